@@ -117,6 +117,28 @@ class ImagePreprocessor:
         Returns:
             Imagen PIL preprocesada y optimizada
         """
+        cv_image = self.preprocess_ndarray(image)
+
+        # Convertir de escala de grises a RGB para Google Vision
+        if len(cv_image.shape) == 2:  # Si es escala de grises
+            cv_image = cv2.cvtColor(cv_image, cv2.COLOR_GRAY2RGB)
+
+        # Convertir de vuelta a PIL
+        return self.enhancer.cv2_to_pil(cv_image)
+
+    def preprocess_ndarray(self, image: Image.Image) -> np.ndarray:
+        """
+        Ejecuta el pipeline completo y retorna el array OpenCV final.
+
+        Permite codificar el resultado directamente (cv2.imencode) sin
+        pasar de nuevo por PIL, ahorrando copias completas de píxeles.
+
+        Args:
+            image: Imagen PIL a preprocesar
+
+        Returns:
+            Array numpy preprocesado (escala de grises o BGR)
+        """
         start_time = time.time()
 
         # Convertir PIL a OpenCV
@@ -241,13 +263,6 @@ class ImagePreprocessor:
         if self.config.get('save_processed_images', False):
             self._save_comparison(original_cv, cv_image)
 
-        # Convertir de escala de grises a RGB para Google Vision
-        if len(cv_image.shape) == 2:  # Si es escala de grises
-            cv_image = cv2.cvtColor(cv_image, cv2.COLOR_GRAY2RGB)
-
-        # Convertir de vuelta a PIL
-        processed_pil = self.enhancer.cv2_to_pil(cv_image)
-
         # Log resumen conciso
         log_info_message(
             self.logger,
@@ -261,7 +276,7 @@ class ImagePreprocessor:
             contrast_improvement=f"{comparison['improvement_percent']['contrast']:.1f}%"
         )
 
-        return processed_pil
+        return cv_image
 
 
     def _save_comparison(self, original: np.ndarray, processed: np.ndarray) -> None:
@@ -3,7 +3,7 @@ from .base_ocr_adapter import BaseOCRAdapter
 from .image_converter import ImageConverter
 
 # OCR Factory (siempre disponible)
-from .ocr_factory import create_ocr_adapter, get_available_providers, get_provider_comparison
+from .ocr_factory import create_ocr_adapter, clear_ocr_cache, get_available_providers, get_provider_comparison
 
 # Optional OCR providers (may have missing dependencies)
 try:
@@ -58,6 +58,7 @@ __all__ = [
     'BaseOCRAdapter',
     'ImageConverter',
     'create_ocr_adapter',
+    'clear_ocr_cache',
     'get_available_providers',
     'get_provider_comparison',
 ]
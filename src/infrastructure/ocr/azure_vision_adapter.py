@@ -85,6 +85,14 @@ class AzureVisionAdapter(BaseOCRAdapter):
         self.max_retries = self.config.get('ocr.azure_vision.max_retries', 3)
         self.timeout = self.config.get('ocr.azure_vision.timeout', 30)
 
+        # Formato de subida: JPEG q90 pesa varias veces menos que PNG y se codifica más rápido
+        self.upload_format = str(self.config.get('ocr.azure_vision.upload_format', 'JPEG')).upper()
+        self.upload_quality = self.config.get('ocr.azure_vision.upload_quality', 90)
+
+        # Límite de píxeles de la imagen subida (0 = sin límite, por defecto):
+        # el pipeline escala 4x para que los dígitos manuscritos conserven detalle
+        self.max_upload_pixels = self.config.get('ocr.azure_vision.max_upload_pixels', 0)
+
         self._initialize_ocr()
 
     def _initialize_ocr(self) -> None:
@@ -210,7 +218,19 @@ class AzureVisionAdapter(BaseOCRAdapter):
                 processed_image = self.preprocess_image(image)
 
                 # Convertir imagen PIL a bytes usando ImageConverter
-                img_bytes = ImageConverter.pil_to_bytes(processed_image, format='PNG')
+                processed_image = ImageConverter.limit_pixels(processed_image, self.max_upload_pixels)
+                log_debug_message(
+                    self.logger,
+                    "Imagen lista para subir",
+                    upload_size=f"{processed_image.width}x{processed_image.height}"
+                )
+
+                img_bytes = ImageConverter.pil_to_bytes(
+                    processed_image,
+                    format=self.upload_format,
+                    quality=self.upload_quality,
+                    lossless=self.upload_format == 'WEBP'
+                )
 
                 # Llamar a Azure Read API
                 log_api_call(self.logger, "azure_vision", "analyze", feature="READ", api_version="v4.0")
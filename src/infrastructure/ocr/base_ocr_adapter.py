@@ -1,13 +1,46 @@
 """Clase base abstracta para adaptadores OCR - Elimina duplicación de código."""
 import re
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import List, Dict, Tuple
+import numpy as np
+import structlog
 from PIL import Image
 
 from ...domain.entities import CedulaRecord
 from ...domain.ports import OCRPort, ConfigPort
 from ..image import ImagePreprocessor
 
+logger = structlog.get_logger(__name__)
+
+# Lado mayor de la reducción usada para detectar imágenes en blanco
+_BLANK_CHECK_MAX_SIDE = 1024
+
+# Compilado una sola vez: se aplica a cada línea reconocida
+_NON_DIGIT_RE = re.compile(r'\D')
+
+# Matriz de corrección de errores comunes de OCR en escritura manual
+_OCR_CONFUSIONS = {
+    'l': '1', 'I': '1', '|': '1',  # Confusión con 1
+    'O': '0', 'o': '0',             # Confusión con 0
+    'S': '5', 's': '5',             # Confusión con 5
+    'B': '8',                        # Confusión con 8
+    'Z': '2', 'z': '2',             # Confusión con 2
+    'G': '6',                        # Confusión con 6
+}
+_OCR_CONFUSION_CHARS = frozenset(_OCR_CONFUSIONS)
+
+# Tabla de bytes equivalente para corregir y filtrar en una sola pasada:
+# translate() elimina primero los bytes de `delete` (todo lo que no es
+# dígito ni carácter confundible) y luego mapea los confundibles a dígitos
+_OCR_CONFUSION_BYTES = bytes.maketrans(
+    ''.join(_OCR_CONFUSIONS).encode('ascii'),
+    ''.join(_OCR_CONFUSIONS.values()).encode('ascii')
+)
+_OCR_DELETE_BYTES = bytes(
+    b for b in range(256)
+    if not (0x30 <= b <= 0x39) and chr(b) not in _OCR_CONFUSION_CHARS
+)
+
 
 class BaseOCRAdapter(OCRPort, ABC):
     """
@@ -103,11 +136,11 @@ class BaseOCRAdapter(OCRPort, ABC):
         Returns:
             Imagen preprocesada y optimizada en RGB
         """
-        print(f"\nDEBUG OCR: Imagen original {image.width}x{image.height}")
+        logger.debug("image_received", width=image.width, height=image.height)
 
         # Verificar si el preprocesamiento está habilitado
         if not self.config.get('image_preprocessing.enabled', True):
-            print("DEBUG OCR: Preprocesamiento deshabilitado, usando imagen original")
+            logger.debug("preprocessing_disabled")
             if image.mode != 'RGB':
                 image = image.convert('RGB')
             return image
@@ -119,10 +152,43 @@ class BaseOCRAdapter(OCRPort, ABC):
         if processed_image.mode != 'RGB':
             processed_image = processed_image.convert('RGB')
 
-        print(f"DEBUG OCR: Imagen procesada {processed_image.width}x{processed_image.height}")
+        logger.debug(
+            "image_preprocessed",
+            width=processed_image.width,
+            height=processed_image.height
+        )
 
         return processed_image
 
+    def _is_visually_blank(self, image: Image.Image) -> bool:
+        """
+        Detecta imágenes sin tinta (renglones o formularios vacíos).
+
+        Calcula la proporción de píxeles oscuros sobre una reducción que
+        conserva la relación de aspecto (lado mayor <= 1024 px, promedio por
+        bloques), de modo que los trazos finos de una página completa no
+        desaparecen al reducir.
+
+        Args:
+            image: Imagen PIL original
+
+        Returns:
+            True si la proporción de tinta está bajo `ocr.blank_ink_ratio`
+            (0 = verificación deshabilitada, valor por defecto)
+        """
+        min_ink_ratio = float(self.config.get('ocr.blank_ink_ratio', 0.0) or 0.0)
+        if min_ink_ratio <= 0:
+            return False
+
+        gray = image.convert('L')
+        factor = -(-max(gray.size) // _BLANK_CHECK_MAX_SIDE)
+        if factor > 1:
+            gray = gray.reduce(factor)
+
+        pixels = np.asarray(gray)
+        ink_ratio = np.count_nonzero(pixels < 200) / pixels.size
+        return ink_ratio < min_ink_ratio
+
     def _extract_numbers_from_text(self, text: str) -> List[str]:
         """
         Extrae números del texto reconocido.
@@ -142,7 +208,7 @@ class BaseOCRAdapter(OCRPort, ABC):
         """
         # Eliminar TODOS los caracteres que no sean dígitos
         # Esto incluye: letras, espacios, puntos, comas, guiones, etc.
-        text_clean = re.sub(r'[^\d]', '', text)
+        text_clean = _NON_DIGIT_RE.sub('', text)
 
         # Si queda algún número, retornarlo como una sola cédula
         if text_clean:
@@ -178,35 +244,25 @@ class BaseOCRAdapter(OCRPort, ABC):
         if not cedula:
             return cedula
 
-        # Matriz de corrección de errores comunes
-        COMMON_ERRORS = {
-            'l': '1', 'I': '1', '|': '1',  # Confusión con 1
-            'O': '0', 'o': '0',             # Confusión con 0
-            'S': '5', 's': '5',             # Confusión con 5
-            'B': '8',                        # Confusión con 8
-            'Z': '2', 'z': '2',             # Confusión con 2
-            'G': '6',                        # Confusión con 6
-        }
-
-        # Aplicar correcciones carácter por carácter
-        cedula_corregida = ""
-        correcciones_aplicadas = []
-
-        for char in cedula:
-            if char in COMMON_ERRORS:
-                char_corregido = COMMON_ERRORS[char]
-                cedula_corregida += char_corregido
-                correcciones_aplicadas.append(f"{char}→{char_corregido}")
-            else:
-                cedula_corregida += char
+        # Corregir y filtrar solo dígitos en una sola pasada (bytes.translate en C).
+        # Las cédulas son ASCII: cualquier carácter no ASCII se descarta.
+        cedula_final = (
+            cedula.encode('ascii', 'ignore')
+            .translate(_OCR_CONFUSION_BYTES, _OCR_DELETE_BYTES)
+            .decode('ascii')
+        )
 
         # Log correcciones si se aplicaron
-        if correcciones_aplicadas:
-            print(f"  🔧 Correcciones OCR aplicadas: {', '.join(correcciones_aplicadas)}")
-            print(f"     Antes: '{cedula}' → Después: '{cedula_corregida}'")
-
-        # Filtrar solo dígitos numéricos
-        cedula_final = ''.join(filter(str.isdigit, cedula_corregida))
+        if not _OCR_CONFUSION_CHARS.isdisjoint(cedula):
+            logger.debug(
+                "ocr_corrections_applied",
+                corrections=[
+                    f"{char}→{_OCR_CONFUSIONS[char]}"
+                    for char in cedula if char in _OCR_CONFUSION_CHARS
+                ],
+                before=cedula,
+                after=cedula_final
+            )
 
         return cedula_final
 
@@ -220,16 +276,19 @@ class BaseOCRAdapter(OCRPort, ABC):
         Returns:
             Lista sin duplicados
         """
-        seen = {}
+        # cedula -> (porcentaje de confianza, registro); el porcentaje se
+        # calcula una vez por registro en lugar de en cada comparación
+        seen: Dict[str, Tuple[float, CedulaRecord]] = {}
 
         for record in records:
             # Usar .value ya que cedula es CedulaNumber (Value Object)
             cedula_key = record.cedula.value
-            # Comparar confidence usando .as_percentage()
-            if cedula_key not in seen or record.confidence.as_percentage() > seen[cedula_key].confidence.as_percentage():
-                seen[cedula_key] = record
+            percentage = record.confidence.as_percentage()
+            current = seen.get(cedula_key)
+            if current is None or percentage > current[0]:
+                seen[cedula_key] = (percentage, record)
 
-        return list(seen.values())
+        return [record for _, record in seen.values()]
 
     def _assign_blocks_to_rows(
         self,
@@ -251,16 +310,22 @@ class BaseOCRAdapter(OCRPort, ABC):
         Returns:
             Diccionario {row_index: [bloques]}
         """
-        row_height = image_height / num_rows
-        rows_blocks = {i: [] for i in range(num_rows)}
+        if not blocks:
+            return {i: [] for i in range(num_rows)}
 
-        for block in blocks:
-            # Determinar a qué renglón pertenece según coordenada Y
-            row_idx = int(block['y'] / row_height)
+        row_height = image_height / num_rows
 
-            # Asegurar que está dentro del rango
-            row_idx = max(0, min(row_idx, num_rows - 1))
+        # Determinar el renglón de todos los bloques a la vez según coordenada Y,
+        # asegurando que queda dentro del rango
+        ys = np.fromiter((block['y'] for block in blocks), dtype=np.float64, count=len(blocks))
+        row_indices = np.clip((ys / row_height).astype(np.int64), 0, num_rows - 1)
 
-            rows_blocks[row_idx].append(block)
+        # Agrupar por renglón conservando el orden original dentro de cada uno
+        order = np.argsort(row_indices, kind='stable')
+        splits = np.searchsorted(row_indices[order], np.arange(1, num_rows))
+        groups = np.split(order, splits)
 
-        return rows_blocks
+        return {
+            row_idx: [blocks[i] for i in group]
+            for row_idx, group in enumerate(groups)
+        }
@@ -2,7 +2,7 @@
 import re
 import numpy as np
 from PIL import Image
-from typing import List
+from typing import Dict, List, Tuple
 import easyocr
 
 from ...domain.entities import CedulaRecord
@@ -179,13 +179,16 @@ class EasyOCRAdapter(OCRPort):
         Returns:
             Lista sin duplicados
         """
-        seen = {}
+        # cedula -> (porcentaje de confianza, registro); el porcentaje se
+        # calcula una vez por registro en lugar de en cada comparación
+        seen: Dict[str, Tuple[float, CedulaRecord]] = {}
 
         for record in records:
             # Usar .value ya que cedula es ahora CedulaNumber (Value Object)
             cedula_key = record.cedula.value
-            # Comparar confidence usando .as_percentage() ya que es ConfidenceScore
-            if cedula_key not in seen or record.confidence.as_percentage() > seen[cedula_key].confidence.as_percentage():
-                seen[cedula_key] = record
+            percentage = record.confidence.as_percentage()
+            current = seen.get(cedula_key)
+            if current is None or percentage > current[0]:
+                seen[cedula_key] = (percentage, record)
 
-        return list(seen.values())
+        return [record for _, record in seen.values()]
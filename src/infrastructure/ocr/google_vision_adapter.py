@@ -1,10 +1,21 @@
 """Implementación de OCR usando Google Cloud Vision API - Óptimo para escritura manual (REFACTORIZADA)."""
-from typing import List, Dict, Any
+import asyncio
+import re
+from statistics import fmean
+from typing import List, Dict, Any, Optional, Tuple
 import structlog
 from PIL import Image
 
 try:
+    import grpc
     from google.cloud import vision
+    from google.cloud.vision_v1.services.image_annotator.transports import (
+        ImageAnnotatorGrpcTransport,
+        ImageAnnotatorGrpcAsyncIOTransport
+    )
+    from google.api_core import exceptions as api_exceptions
+    from google.api_core import retry as api_retry
+    from google.api_core import retry_async
     GOOGLE_VISION_AVAILABLE = True
 except ImportError:
     GOOGLE_VISION_AVAILABLE = False
@@ -13,10 +24,13 @@ from ...domain.entities import CedulaRecord
 from ...domain.ports import ConfigPort
 from .base_ocr_adapter import BaseOCRAdapter
 from .image_converter import ImageConverter
-from .vision import GoogleSymbolExtractor, ConfidenceMapper
+from .vision import GoogleSymbolExtractor, ConfidenceMapper, ResponseCache
 
 logger = structlog.get_logger(__name__)
 
+# Detección rápida de formularios sin ningún dígito
+_DIGIT_RE = re.compile(r'\d')
+
 
 class GoogleVisionAdapter(BaseOCRAdapter):
     """
@@ -40,6 +54,9 @@ class GoogleVisionAdapter(BaseOCRAdapter):
         last_raw_response: Última respuesta raw de la API (heredado)
     """
 
+    # Límite de imágenes por petición de BatchAnnotateImages
+    MAX_BATCH_SIZE = 16
+
     def __init__(self, config: ConfigPort):
         """
         Inicializa el servicio de OCR con Google Cloud Vision.
@@ -67,6 +84,25 @@ class GoogleVisionAdapter(BaseOCRAdapter):
         # Bind logger con contexto específico del adapter
         self.logger = logger.bind(adapter="google_vision")
 
+        # Formato de subida: JPEG q90 pesa 4-8x menos que PNG y se codifica más rápido
+        self.upload_format = str(self.config.get('ocr.google_vision.upload_format', 'JPEG')).upper()
+        self.upload_quality = self.config.get('ocr.google_vision.upload_quality', 90)
+
+        # Límite de píxeles subidos: el pipeline escala 4x y la API reduce en el
+        # servidor de todos modos; subir menos acorta codificación y transferencia
+        self.max_upload_pixels = self.config.get('ocr.google_vision.max_upload_pixels', 4_000_000)
+
+        # Máximo de peticiones simultáneas en extract_cedulas_many (cuota de la API)
+        self.max_concurrency = self.config.get('ocr.google_vision.max_concurrency', 8)
+
+        # Cache en disco de respuestas: repetir un escaneo no vuelve a pagar la API
+        self.response_cache = None
+        if self.config.get('ocr.google_vision.cache.enabled', False):
+            self.response_cache = ResponseCache(
+                self.config.get('ocr.google_vision.cache.dir', '~/.cache/firmas/vision'),
+                max_bytes=self.config.get('ocr.google_vision.cache.max_size_mb', 500) * 1024 * 1024
+            )
+
         self.client = None
         self._initialize_ocr()
 
@@ -81,7 +117,27 @@ class GoogleVisionAdapter(BaseOCRAdapter):
             # 2. gcloud auth application-default login (credenciales de usuario)
             # 3. Compute Engine/App Engine/Cloud Run (credenciales de servicio)
 
-            self.client = vision.ImageAnnotatorClient()
+            self.client = vision.ImageAnnotatorClient(transport=self._create_transport())
+
+            # Reintentos con backoff exponencial ante cuota excedida (429) o
+            # servicio no disponible (503), compartidos por todas las llamadas
+            retry_kwargs = dict(
+                predicate=api_retry.if_exception_type(
+                    api_exceptions.ResourceExhausted,
+                    api_exceptions.ServiceUnavailable
+                ),
+                initial=1.0,
+                maximum=30.0,
+                multiplier=2.0,
+                timeout=self.config.get('ocr.google_vision.retry_timeout', 120)
+            )
+            self._retry = api_retry.Retry(**retry_kwargs)
+            self._retry_async = retry_async.AsyncRetry(**retry_kwargs)
+
+            # OPTIMIZACIÓN: Language hints para mejorar precisión en español.
+            # El proto es inmutable, se construye una sola vez y se reutiliza.
+            self._image_context = vision.ImageContext(language_hints=['es'])
+            self._features = [vision.Feature(type_=vision.Feature.Type.DOCUMENT_TEXT_DETECTION)]
 
             self.logger.info(
                 "google_vision_initialized",
@@ -102,12 +158,135 @@ class GoogleVisionAdapter(BaseOCRAdapter):
             )
             raise
 
+    def _create_transport(self) -> Any:
+        """
+        Crea el transporte gRPC con keepalive para mantener la conexión HTTP/2.
+
+        Los pings de keepalive detectan conexiones muertas durante llamadas
+        largas en lugar de esperar al timeout TCP, lo que producía picos de
+        latencia en document_text_detection.
+
+        El canal se crea una sola vez por adapter y lo comparten todas las
+        llamadas síncronas y por lotes.
+
+        Returns:
+            ImageAnnotatorGrpcTransport con las opciones de canal configuradas
+        """
+        channel = ImageAnnotatorGrpcTransport.create_channel(options=self._channel_options())
+        return ImageAnnotatorGrpcTransport(channel=channel)
+
+    def _create_async_transport(self) -> Any:
+        """
+        Crea el transporte grpc.aio con las mismas opciones que el síncrono.
+
+        Returns:
+            ImageAnnotatorGrpcAsyncIOTransport para el loop actual
+        """
+        channel = ImageAnnotatorGrpcAsyncIOTransport.create_channel(options=self._channel_options())
+        return ImageAnnotatorGrpcAsyncIOTransport(channel=channel)
+
+    def _channel_options(self) -> List[Tuple[str, Any]]:
+        """
+        Opciones de canal gRPC comunes a los clientes síncrono y asíncrono.
+
+        Con `ocr.google_vision.compression: gzip` se activa la compresión
+        del canal. Desactivada por defecto: la imagen ya viaja como JPEG y
+        comprimirla de nuevo solo consume CPU.
+
+        Returns:
+            Lista de pares (opción, valor)
+        """
+        options = [
+            ('grpc.keepalive_time_ms', self.config.get('ocr.google_vision.keepalive_time_ms', 10000)),
+            ('grpc.keepalive_timeout_ms', self.config.get('ocr.google_vision.keepalive_timeout_ms', 5000)),
+            ('grpc.http2.max_pings_without_data', 0),
+            ('grpc.max_receive_message_length', 32 * 1024 * 1024),
+        ]
+
+        if str(self.config.get('ocr.google_vision.compression', 'none')).lower() == 'gzip':
+            options.append(('grpc.default_compression_algorithm', int(grpc.Compression.Gzip)))
+
+        return options
+
+    def _encode_for_upload(self, image: Image.Image, limit_pixels: bool = True) -> bytes:
+        """
+        Codifica la imagen preprocesada en el formato de subida configurado.
+
+        Si excede `ocr.google_vision.max_upload_pixels` se reduce antes, salvo
+        con limit_pixels=False: los flujos que ubican las palabras en
+        coordenadas de la imagen recibida no deben reducirla.
+
+        - JPEG (default): calidad 90, submuestreo 4:4:4
+        - WEBP: sin pérdida, para contenido binarizado
+        - PNG: comportamiento original
+
+        Args:
+            image: Imagen PIL preprocesada
+            limit_pixels: Si se aplica el límite de píxeles de subida
+
+        Returns:
+            Imagen en bytes lista para enviar a la API
+        """
+        if limit_pixels:
+            image = ImageConverter.limit_pixels(image, self.max_upload_pixels)
+
+        img_bytes = ImageConverter.pil_to_bytes(
+            image,
+            format=self.upload_format,
+            quality=self.upload_quality,
+            lossless=self.upload_format == 'WEBP'
+        )
+
+        self.logger.debug(
+            "image_encoded",
+            format=self.upload_format,
+            size_bytes=len(img_bytes)
+        )
+
+        return img_bytes
+
+    def _preprocess_for_upload(self, image: Image.Image) -> bytes:
+        """
+        Preprocesa la imagen y la codifica para la API en un solo paso.
+
+        Con el preprocesamiento habilitado, el array OpenCV final se codifica
+        directamente, sin la ida y vuelta a PIL de preprocess_image().
+
+        Args:
+            image: Imagen PIL original
+
+        Returns:
+            Imagen preprocesada en bytes lista para enviar a la API
+        """
+        if not self.config.get('image_preprocessing.enabled', True):
+            return self._encode_for_upload(self.preprocess_image(image))
+
+        processed = ImageConverter.limit_pixels_ndarray(
+            self.preprocessor.preprocess_ndarray(image),
+            self.max_upload_pixels
+        )
+
+        img_bytes = ImageConverter.ndarray_to_bytes(
+            processed,
+            format=self.upload_format,
+            quality=self.upload_quality,
+            lossless=self.upload_format == 'WEBP'
+        )
+
+        self.logger.debug(
+            "image_encoded",
+            format=self.upload_format,
+            size_bytes=len(img_bytes)
+        )
+
+        return img_bytes
+
     def _call_ocr_api(self, image_bytes: bytes) -> Any:
         """
         Realiza la llamada a Google Vision API.
 
         Args:
-            image_bytes: Imagen en bytes (PNG format)
+            image_bytes: Imagen en bytes (JPEG, PNG o WEBP)
 
         Returns:
             Respuesta de document_text_detection
@@ -115,23 +294,62 @@ class GoogleVisionAdapter(BaseOCRAdapter):
         Raises:
             Exception: Si hay error en la llamada API
         """
+        cache_key, cached = self._get_cached_response(image_bytes)
+        if cached is not None:
+            return cached
+
         # Crear objeto Image de Google Vision
         vision_image = vision.Image(content=image_bytes)
 
-        # OPTIMIZACIÓN: Language hints para mejorar precisión en español
-        image_context = vision.ImageContext(language_hints=['es'])
-
         # Llamar a la API - DOCUMENT_TEXT_DETECTION detecta texto línea por línea
         response = self.client.document_text_detection(
             image=vision_image,
-            image_context=image_context
+            image_context=self._image_context,
+            retry=self._retry
         )
 
         if response.error.message:
             raise Exception(f"Google Vision API error: {response.error.message}")
 
+        self._store_cached_response(cache_key, response)
+
         return response
 
+    def _get_cached_response(self, image_bytes: bytes):
+        """
+        Busca una respuesta previa para la imagen en el cache en disco.
+
+        Args:
+            image_bytes: Imagen en bytes tal como se enviaría a la API
+
+        Returns:
+            Tupla (clave, respuesta). La clave es None si el cache está
+            deshabilitado; la respuesta es None si no hay entrada.
+        """
+        if self.response_cache is None:
+            return None, None
+
+        cache_key = ResponseCache.key_for(image_bytes)
+        cached = self.response_cache.get(cache_key)
+        if cached is None:
+            return cache_key, None
+
+        self.logger.debug("cache_hit", key=cache_key)
+        return cache_key, vision.AnnotateImageResponse.deserialize(cached)
+
+    def _store_cached_response(self, cache_key, response) -> None:
+        """
+        Guarda una respuesta exitosa en el cache en disco.
+
+        Args:
+            cache_key: Clave de _get_cached_response() (None = cache deshabilitado)
+            response: AnnotateImageResponse sin error
+        """
+        if cache_key is None or response.error.message:
+            return
+
+        self.response_cache.put(cache_key, vision.AnnotateImageResponse.serialize(response))
+
     def extract_cedulas(self, image: Image.Image) -> List[CedulaRecord]:
         """
         Extrae números de cédula de una imagen usando Google Cloud Vision.
@@ -160,12 +378,15 @@ class GoogleVisionAdapter(BaseOCRAdapter):
         )
         operation_logger.info("extraction_started")
 
-        try:
-            # Preprocesar imagen usando método heredado
-            processed_image = self.preprocess_image(image)
+        # Imagen en blanco: no vale la pena pagar una llamada a la API
+        if self._is_visually_blank(image):
+            operation_logger.info("blank_image_skipped")
+            self.last_raw_response = None
+            return []
 
-            # Convertir imagen PIL a bytes usando ImageConverter
-            img_bytes = ImageConverter.pil_to_bytes(processed_image, format='PNG')
+        try:
+            # Preprocesar y codificar en el formato de subida configurado
+            img_bytes = self._preprocess_for_upload(image)
 
             # Llamar a la API
             operation_logger.debug("calling_api", method="document_text_detection", language="es")
@@ -177,41 +398,7 @@ class GoogleVisionAdapter(BaseOCRAdapter):
             operation_logger.debug("api_call_successful", api_calls=1)
 
             # Procesar respuesta - Google Vision detecta texto organizado por bloques/líneas
-            records = []
-
-            # Opción 1: Usar full_text_annotation para obtener todo el texto
-            if response.full_text_annotation:
-                full_text = response.full_text_annotation.text
-                operation_logger.debug("text_detected", full_text=full_text)
-
-                # Procesar línea por línea
-                lines = full_text.split('\n')
-                operation_logger.debug("lines_detected", total_lines=len(lines))
-
-                for idx, line in enumerate(lines):
-                    if not line.strip():
-                        continue
-
-                    line_logger = operation_logger.bind(line_number=idx + 1, content=line.strip())
-                    line_logger.debug("processing_line")
-
-                    # Extraer números del texto usando método heredado
-                    numbers = self._extract_numbers_from_text(line)
-
-                    for num in numbers:
-                        # Validar longitud de cédula (3-11 dígitos)
-                        if 3 <= len(num) <= 11:
-                            # Usar factory method para crear con Value Objects
-                            record = CedulaRecord.from_primitives(
-                                cedula=num,
-                                confidence=95.0  # Google Vision es muy confiable
-                            )
-                            records.append(record)
-                            operation_logger.info("cedula_extracted", cedula=num, digits=len(num))
-                        elif len(num) < 3:
-                            operation_logger.debug("cedula_rejected_too_short", cedula=num, length=len(num))
-                        else:
-                            operation_logger.debug("cedula_rejected_too_long", cedula=num, length=len(num))
+            records = self._parse_cedulas(response, operation_logger)
 
             # Eliminar duplicados usando método heredado
             unique_records = self._remove_duplicates(records)
@@ -235,6 +422,301 @@ class GoogleVisionAdapter(BaseOCRAdapter):
             )
             return []
 
+    def extract_cedulas_batch(self, images: List[Image.Image]) -> List[List[CedulaRecord]]:
+        """
+        Extrae cédulas de varias imágenes usando BatchAnnotateImages.
+
+        Agrupa hasta MAX_BATCH_SIZE imágenes por petición, de modo que la
+        latencia gRPC se paga una vez por lote en lugar de una vez por imagen.
+
+        Args:
+            images: Lista de imágenes PIL a procesar
+
+        Returns:
+            Lista de listas de registros, en el mismo orden que `images`
+        """
+        if self.client is None:
+            self.logger.error("client_not_initialized")
+            return [[] for _ in images]
+
+        if not images:
+            return []
+
+        operation_logger = self.logger.bind(
+            operation="extract_cedulas_batch",
+            images_count=len(images)
+        )
+        operation_logger.info("batch_extraction_started")
+
+        try:
+            # Las imágenes en blanco no se envían (None)
+            encoded_images = [
+                None if self._is_visually_blank(image) else self._preprocess_for_upload(image)
+                for image in images
+            ]
+
+            operation_logger.debug("calling_api", method="batch_annotate_images", language="es")
+            responses = self._call_ocr_api_batch(encoded_images)
+
+        except Exception as e:
+            operation_logger.error(
+                "batch_extraction_failed",
+                error_type=type(e).__name__,
+                error_message=str(e),
+                exc_info=True
+            )
+            return [[] for _ in images]
+
+        results = self._parse_responses(responses, operation_logger)
+
+        operation_logger.info(
+            "batch_extraction_completed",
+            cedulas_extracted=sum(len(records) for records in results),
+            api_calls=-(-len(images) // self.MAX_BATCH_SIZE),
+            success=True
+        )
+
+        return results
+
+    def extract_cedulas_many(self, images: List[Image.Image]) -> List[List[CedulaRecord]]:
+        """
+        Extrae cédulas de varias imágenes con peticiones concurrentes.
+
+        Usa ImageAnnotatorAsyncClient y asyncio.gather, limitado por
+        `ocr.google_vision.max_concurrency`, de modo que el tiempo total se
+        acerca a la latencia máxima y no a la suma de latencias.
+
+        No debe llamarse desde un event loop en ejecución (usa asyncio.run).
+
+        Args:
+            images: Lista de imágenes PIL a procesar
+
+        Returns:
+            Lista de listas de registros, en el mismo orden que `images`
+        """
+        if self.client is None:
+            self.logger.error("client_not_initialized")
+            return [[] for _ in images]
+
+        if not images:
+            return []
+
+        operation_logger = self.logger.bind(
+            operation="extract_cedulas_many",
+            images_count=len(images),
+            max_concurrency=self.max_concurrency
+        )
+        operation_logger.info("concurrent_extraction_started")
+
+        try:
+            # Las imágenes en blanco no se envían (None)
+            encoded_images = [
+                None if self._is_visually_blank(image) else self._preprocess_for_upload(image)
+                for image in images
+            ]
+
+            operation_logger.debug("calling_api", method="document_text_detection_async", language="es")
+            responses = asyncio.run(self._call_ocr_api_many(encoded_images))
+
+        except Exception as e:
+            operation_logger.error(
+                "concurrent_extraction_failed",
+                error_type=type(e).__name__,
+                error_message=str(e),
+                exc_info=True
+            )
+            return [[] for _ in images]
+
+        results = self._parse_responses(responses, operation_logger)
+
+        operation_logger.info(
+            "concurrent_extraction_completed",
+            cedulas_extracted=sum(len(records) for records in results),
+            api_calls=len(images),
+            success=True
+        )
+
+        return results
+
+    async def _call_ocr_api_many(self, images_bytes: List[Optional[bytes]]) -> List[Any]:
+        """
+        Lanza una petición asíncrona por imagen, limitadas por un semáforo.
+
+        El cliente asíncrono se crea dentro del event loop que lo usa: los
+        canales grpc.aio quedan ligados a su loop y asyncio.run crea uno nuevo
+        en cada llamada. Todas las peticiones del lote se multiplexan sobre
+        ese único canal, configurado con las mismas opciones que el síncrono.
+
+        Args:
+            images_bytes: Imágenes codificadas en bytes (None = imagen en blanco, no se envía)
+
+        Returns:
+            Respuestas (o excepciones) en el mismo orden que `images_bytes`
+        """
+        async_client = vision.ImageAnnotatorAsyncClient(transport=self._create_async_transport())
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def annotate(image_bytes: Optional[bytes]) -> Any:
+            if image_bytes is None:
+                return None
+
+            cache_key, cached = self._get_cached_response(image_bytes)
+            if cached is not None:
+                return cached
+
+            async with semaphore:
+                response = await async_client.document_text_detection(
+                    image=vision.Image(content=image_bytes),
+                    image_context=self._image_context,
+                    retry=self._retry_async
+                )
+
+            self._store_cached_response(cache_key, response)
+            return response
+
+        return await asyncio.gather(
+            *(annotate(image_bytes) for image_bytes in images_bytes),
+            return_exceptions=True
+        )
+
+    def _parse_responses(self, responses: List[Any], operation_logger) -> List[List[CedulaRecord]]:
+        """
+        Convierte respuestas de un lote en registros, aislando errores por imagen.
+
+        Args:
+            responses: Respuestas de la API (o excepciones) en orden de entrada
+            operation_logger: Logger con el contexto de la operación
+
+        Returns:
+            Lista de listas de registros sin duplicados
+        """
+        results = []
+
+        for idx, response in enumerate(responses):
+            image_logger = operation_logger.bind(image_index=idx)
+
+            if response is None:
+                image_logger.debug("blank_image_skipped")
+                results.append([])
+                continue
+
+            if isinstance(response, Exception):
+                image_logger.error(
+                    "image_request_failed",
+                    error_type=type(response).__name__,
+                    error_message=str(response)
+                )
+                results.append([])
+                continue
+
+            if response.error.message:
+                image_logger.error("image_request_failed", error_message=response.error.message)
+                results.append([])
+                continue
+
+            records = self._parse_cedulas(response, image_logger)
+            results.append(self._remove_duplicates(records))
+
+        return results
+
+    def _call_ocr_api_batch(self, images_bytes: List[Optional[bytes]]) -> List[Any]:
+        """
+        Envía varias imágenes a Google Vision en lotes de MAX_BATCH_SIZE.
+
+        Args:
+            images_bytes: Imágenes codificadas en bytes (None = imagen en blanco, no se envía)
+
+        Returns:
+            Lista de AnnotateImageResponse en el mismo orden que `images_bytes`
+        """
+        responses = [None] * len(images_bytes)
+        cache_keys = [None] * len(images_bytes)
+        pending = []
+
+        # Solo se envían a la API las imágenes sin respuesta en cache
+        for idx, image_bytes in enumerate(images_bytes):
+            if image_bytes is None:
+                continue
+            cache_keys[idx], responses[idx] = self._get_cached_response(image_bytes)
+            if responses[idx] is None:
+                pending.append(idx)
+
+        for start in range(0, len(pending), self.MAX_BATCH_SIZE):
+            chunk = pending[start:start + self.MAX_BATCH_SIZE]
+
+            requests = [
+                vision.AnnotateImageRequest(
+                    image=vision.Image(content=images_bytes[idx]),
+                    features=self._features,
+                    image_context=self._image_context
+                )
+                for idx in chunk
+            ]
+
+            batch_response = self.client.batch_annotate_images(requests=requests, retry=self._retry)
+
+            for idx, response in zip(chunk, batch_response.responses):
+                responses[idx] = response
+                self._store_cached_response(cache_keys[idx], response)
+
+        return responses
+
+    def _parse_cedulas(self, response, operation_logger) -> List[CedulaRecord]:
+        """
+        Extrae cédulas del texto completo de una respuesta de Google Vision.
+
+        Args:
+            response: Respuesta de document_text_detection
+            operation_logger: Logger con el contexto de la operación
+
+        Returns:
+            Lista de registros (puede contener duplicados)
+        """
+        records = []
+
+        # Usar full_text_annotation para obtener todo el texto
+        if not response.full_text_annotation:
+            return records
+
+        full_text = response.full_text_annotation.text
+        operation_logger.debug("text_detected", full_text=full_text)
+
+        # Formulario en blanco o sin números: no hay nada que procesar
+        if not _DIGIT_RE.search(full_text):
+            operation_logger.debug("no_digits_detected")
+            return records
+
+        # Procesar línea por línea
+        lines = full_text.split('\n')
+        operation_logger.debug("lines_detected", total_lines=len(lines))
+
+        for idx, line in enumerate(lines):
+            if not line.strip():
+                continue
+
+            line_logger = operation_logger.bind(line_number=idx + 1, content=line.strip())
+            line_logger.debug("processing_line")
+
+            # Extraer números del texto usando método heredado
+            numbers = self._extract_numbers_from_text(line)
+
+            for num in numbers:
+                # Validar longitud de cédula (3-11 dígitos)
+                if 3 <= len(num) <= 11:
+                    # Usar factory method para crear con Value Objects
+                    record = CedulaRecord.from_primitives(
+                        cedula=num,
+                        confidence=95.0  # Google Vision es muy confiable
+                    )
+                    records.append(record)
+                    operation_logger.info("cedula_extracted", cedula=num, digits=len(num))
+                elif len(num) < 3:
+                    operation_logger.debug("cedula_rejected_too_short", cedula=num, length=len(num))
+                else:
+                    operation_logger.debug("cedula_rejected_too_long", cedula=num, length=len(num))
+
+        return records
+
     # MÉTODO REMOVIDO: extract_full_form_data ya no es necesario para API
     # Usaba RowData que es específico de la UI de escritorio
 
@@ -280,8 +762,9 @@ class GoogleVisionAdapter(BaseOCRAdapter):
             # Preprocesar imagen
             processed_image = self.preprocess_image(image)
 
-            # Convertir imagen PIL a bytes
-            img_bytes = ImageConverter.pil_to_bytes(processed_image, format='PNG')
+            # Convertir imagen PIL a bytes en el formato de subida configurado,
+            # sin reducir: los renglones se calculan con el alto de processed_image
+            img_bytes = self._encode_for_upload(processed_image, limit_pixels=False)
 
             # ⚡ ÚNICA LLAMADA API - DOCUMENT_TEXT_DETECTION
             operation_logger.debug("calling_api", method="document_text_detection")
@@ -380,45 +863,109 @@ class GoogleVisionAdapter(BaseOCRAdapter):
                 - confidence: Confianza del OCR
                 - vertices: Vértices del bounding box
         """
+        return self._walk_response(response)[0]
+
+    def _extract_text_blocks_with_positions(self, response) -> List[Dict]:
+        """
+        Extrae palabras individuales con coordenadas (NO bloques completos).
+
+        Trabajar a nivel de PALABRA permite agrupar nombres que están
+        separados espacialmente (RowBasedExtraction, SpatialPairing), en
+        lugar de depender de cómo Google Vision agrupa los bloques.
+
+        Args:
+            response: Respuesta de Google Vision API
+
+        Returns:
+            Lista de palabras con {text, x, y, width, height, confidence}
+        """
+        return self._walk_response(response)[1]
+
+    def _walk_response(self, response) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Recorre pages → blocks → paragraphs → words una sola vez.
+
+        Produce a la vez los bloques (con centro y confianza promedio) y las
+        palabras (con bounding box). No guarda estado en la instancia: quien
+        necesite bloques y palabras de la misma respuesta debe llamarlo una
+        vez y usar ambos elementos de la tupla.
+
+        Args:
+            response: Respuesta de Google Vision API
+
+        Returns:
+            Tupla (bloques, palabras) con el formato de
+            _extract_text_blocks_with_coords y _extract_text_blocks_with_positions
+        """
         blocks = []
+        word_blocks = []
+
+        # Métodos enlazados a locales: evita la búsqueda de atributo por palabra
+        block_append = blocks.append
+        word_append = word_blocks.append
+        join = ''.join
 
         for page in response.full_text_annotation.pages:
             for block in page.blocks:
+                word_texts = []
+                word_confidences = []
+                text_append = word_texts.append
+                confidence_append = word_confidences.append
+
+                for paragraph in block.paragraphs:
+                    for word in paragraph.words:
+                        word_text = join(symbol.text for symbol in word.symbols)
+                        word_confidence = word.confidence
+                        text_append(word_text)
+                        confidence_append(word_confidence)
+
+                        # Bounding box de la palabra (4 vértices, desenrollado)
+                        vertices = word.bounding_box.vertices
+                        word_text = word_text.strip()
+                        if len(vertices) < 4 or not word_text:
+                            continue
+
+                        v0, v1, v2, v3 = vertices[0], vertices[1], vertices[2], vertices[3]
+                        x0, x1, x2, x3 = v0.x, v1.x, v2.x, v3.x
+                        y0, y1, y2, y3 = v0.y, v1.y, v2.y, v3.y
+                        min_x = min(x0, x1, x2, x3)
+                        min_y = min(y0, y1, y2, y3)
+
+                        word_append({
+                            'text': word_text,
+                            'x': min_x,
+                            'y': min_y,
+                            'width': max(x0, x1, x2, x3) - min_x,
+                            'height': max(y0, y1, y2, y3) - min_y,
+                            'confidence': word_confidence
+                        })
+
                 # Calcular coordenadas promedio del bloque
                 vertices = block.bounding_box.vertices
                 if not vertices:
                     continue
 
-                avg_x = sum(v.x for v in vertices) / len(vertices)
-                avg_y = sum(v.y for v in vertices) / len(vertices)
-
-                # Extraer texto del bloque
-                block_text = ""
-                block_confidence = 0.0
-                word_count = 0
-
-                for paragraph in block.paragraphs:
-                    for word in paragraph.words:
-                        word_text = ''.join([symbol.text for symbol in word.symbols])
-                        block_text += word_text + " "
-                        block_confidence += word.confidence
-                        word_count += 1
-
-                block_text = block_text.strip()
+                if len(vertices) == 4:
+                    # Bounding box estándar: promedio desenrollado
+                    v0, v1, v2, v3 = vertices
+                    avg_x = (v0.x + v1.x + v2.x + v3.x) * 0.25
+                    avg_y = (v0.y + v1.y + v2.y + v3.y) * 0.25
+                else:
+                    avg_x = sum(v.x for v in vertices) / len(vertices)
+                    avg_y = sum(v.y for v in vertices) / len(vertices)
 
-                if word_count > 0:
-                    block_confidence /= word_count
+                block_text = ' '.join(word_texts).strip()
 
                 if block_text:  # Solo agregar bloques con texto
-                    blocks.append({
+                    block_append({
                         'text': block_text,
                         'x': avg_x,
                         'y': avg_y,
-                        'confidence': block_confidence,
+                        'confidence': fmean(word_confidences),
                         'vertices': vertices
                     })
 
-        return blocks
+        return blocks, word_blocks
 
     def get_character_confidences(self, text: str) -> Dict[str, Any]:
         """
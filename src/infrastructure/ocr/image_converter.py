@@ -1,15 +1,33 @@
 """Utilidad para conversiones de formatos de imagen."""
 import io
+import threading
+import cv2
+import numpy as np
 from PIL import Image
 from typing import Tuple
 
 
+# Buffer de codificación reutilizable, uno por hilo (BytesIO no es thread-safe)
+_encode_buffers = threading.local()
+
+
+def _get_encode_buffer() -> io.BytesIO:
+    """Retorna el buffer del hilo actual, vacío y listo para escribir."""
+    buffer = getattr(_encode_buffers, 'buffer', None)
+    if buffer is None:
+        buffer = _encode_buffers.buffer = io.BytesIO()
+    buffer.seek(0)
+    buffer.truncate()
+    return buffer
+
+
 class ImageConverter:
     """
     Utilidad para convertir imágenes entre diferentes formatos.
 
     Proporciona métodos estáticos para conversiones comunes:
     - PIL Image a bytes (PNG/JPEG)
+    - Array OpenCV a bytes (sin pasar por PIL)
     - bytes a PIL Image
     - Conversiones de modo de color (RGB, RGBA, L, etc)
     - Validación de formato
@@ -22,15 +40,20 @@ class ImageConverter:
     def pil_to_bytes(
         image: Image.Image,
         format: str = 'PNG',
-        quality: int = 95
+        quality: int = 95,
+        lossless: bool = False
     ) -> bytes:
         """
         Convierte imagen PIL a bytes.
 
+        JPEG se guarda con submuestreo 4:4:4 (subsampling=0) para no
+        difuminar los bordes finos de los dígitos manuscritos.
+
         Args:
             image: Imagen PIL a convertir
             format: Formato de salida ('PNG', 'JPEG', 'WEBP', etc)
             quality: Calidad de compresión para JPEG/WEBP (1-100)
+            lossless: Si usar WEBP sin pérdida (ideal para imágenes binarizadas)
 
         Returns:
             Imagen en bytes
@@ -41,21 +64,69 @@ class ImageConverter:
             >>> len(img_bytes)
             245680
         """
-        img_byte_arr = io.BytesIO()
+        img_byte_arr = _get_encode_buffer()
+        format = format.upper()
 
-        # Asegurar compatibilidad de formato
-        if format.upper() in ('JPEG', 'JPG') and image.mode in ('RGBA', 'P'):
-            # JPEG no soporta transparencia
-            image = image.convert('RGB')
+        # Asegurar compatibilidad de formato; RGB y L se guardan sin copiar
+        if format in ('JPEG', 'JPG') and image.mode not in ('RGB', 'L'):
+            # JPEG no soporta transparencia ni paletas
+            image = ImageConverter.ensure_rgb(image)
 
         # Guardar en buffer
-        if format.upper() in ('JPEG', 'JPG', 'WEBP'):
-            image.save(img_byte_arr, format=format.upper(), quality=quality)
+        if format in ('JPEG', 'JPG'):
+            image.save(img_byte_arr, format='JPEG', quality=quality, subsampling=0)
+        elif format == 'WEBP':
+            image.save(img_byte_arr, format='WEBP', quality=quality, lossless=lossless)
         else:
-            image.save(img_byte_arr, format=format.upper())
+            image.save(img_byte_arr, format=format)
 
         return img_byte_arr.getvalue()
 
+    @staticmethod
+    def ndarray_to_bytes(
+        image: np.ndarray,
+        format: str = 'PNG',
+        quality: int = 95,
+        lossless: bool = False
+    ) -> bytes:
+        """
+        Codifica un array OpenCV (escala de grises o BGR) directamente a bytes.
+
+        Evita la conversión numpy -> PIL cuando la imagen ya viene de un
+        pipeline OpenCV.
+
+        Args:
+            image: Array numpy a codificar
+            format: Formato de salida ('PNG', 'JPEG', 'WEBP')
+            quality: Calidad de compresión para JPEG/WEBP (1-100)
+            lossless: Si usar WEBP sin pérdida
+
+        Returns:
+            Imagen en bytes
+
+        Raises:
+            ValueError: Si OpenCV no puede codificar la imagen
+        """
+        format = format.upper()
+
+        if format in ('JPEG', 'JPG'):
+            # Submuestreo 4:4:4, igual que pil_to_bytes (subsampling=0)
+            ext, params = '.jpg', [
+                int(cv2.IMWRITE_JPEG_QUALITY), quality,
+                int(cv2.IMWRITE_JPEG_SAMPLING_FACTOR), int(cv2.IMWRITE_JPEG_SAMPLING_FACTOR_444),
+            ]
+        elif format == 'WEBP':
+            # Calidad > 100 activa el modo sin pérdida en OpenCV
+            ext, params = '.webp', [int(cv2.IMWRITE_WEBP_QUALITY), 101 if lossless else quality]
+        else:
+            ext, params = f'.{format.lower()}', []
+
+        success, buffer = cv2.imencode(ext, image, params)
+        if not success:
+            raise ValueError(f"No se pudo codificar la imagen como {format}")
+
+        return buffer.tobytes()
+
     @staticmethod
     def bytes_to_pil(image_bytes: bytes) -> Image.Image:
         """
@@ -137,6 +208,9 @@ class ImageConverter:
         """
         Obtiene información sobre la imagen.
 
+        size_bytes es el tamaño del buffer de píxeles sin comprimir
+        (ancho x alto x bandas); no se codifica la imagen para medirlo.
+
         Args:
             image: Imagen PIL
 
@@ -152,16 +226,10 @@ class ImageConverter:
                 'height': 600,
                 'mode': 'RGB',
                 'format': 'JPEG',
-                'size_bytes': 245680
+                'size_bytes': 1440000
             }
         """
-        # Calcular tamaño en bytes si es posible
-        size_bytes = None
-        try:
-            img_bytes = ImageConverter.pil_to_bytes(image, format='PNG')
-            size_bytes = len(img_bytes)
-        except:
-            pass
+        size_bytes = image.width * image.height * len(image.getbands())
 
         return {
             'width': image.width,
@@ -251,3 +319,53 @@ class ImageConverter:
             new_height = min(height, max_height)
 
         return image.resize((new_width, new_height), Image.LANCZOS)
+
+    @staticmethod
+    def limit_pixels(image: Image.Image, max_pixels: int) -> Image.Image:
+        """
+        Reduce la imagen si su número de píxeles excede el máximo.
+
+        Mantiene el aspect ratio. Útil antes de subir a una API que
+        reduce la imagen en el servidor de todos modos.
+
+        Args:
+            image: Imagen PIL
+            max_pixels: Número máximo de píxeles (0 o None = sin límite)
+
+        Returns:
+            Imagen reducida (o la original si no excede el límite)
+        """
+        new_size = ImageConverter._size_within_pixels(image.width, image.height, max_pixels)
+        if new_size is None:
+            return image
+
+        return image.resize(new_size, Image.LANCZOS)
+
+    @staticmethod
+    def limit_pixels_ndarray(image: np.ndarray, max_pixels: int) -> np.ndarray:
+        """
+        Equivalente de limit_pixels() para arrays OpenCV.
+
+        Args:
+            image: Array numpy (escala de grises o BGR)
+            max_pixels: Número máximo de píxeles (0 o None = sin límite)
+
+        Returns:
+            Array reducido (o el original si no excede el límite)
+        """
+        height, width = image.shape[:2]
+        new_size = ImageConverter._size_within_pixels(width, height, max_pixels)
+        if new_size is None:
+            return image
+
+        # INTER_AREA es el método recomendado por OpenCV para reducir
+        return cv2.resize(image, new_size, interpolation=cv2.INTER_AREA)
+
+    @staticmethod
+    def _size_within_pixels(width: int, height: int, max_pixels: int):
+        """Retorna (ancho, alto) reducidos para caber en max_pixels, o None si ya caben."""
+        if not max_pixels or width * height <= max_pixels:
+            return None
+
+        ratio = (max_pixels / (width * height)) ** 0.5
+        return max(1, int(width * ratio)), max(1, int(height * ratio))
@@ -1,10 +1,17 @@
 """Adaptador de OCR manual - permite entrada manual de cédulas."""
+import re
 from PIL import Image
 from typing import List
 
 from ...domain.entities import CedulaRecord
 from ...domain.ports import OCRPort, ConfigPort
 
+# Separadores que el usuario puede escribir dentro de la cédula
+_STRIP_TABLE = str.maketrans('', '', ' .,-')
+
+# Cédula válida: solo dígitos, entre 3 y 11
+_CEDULA_RE = re.compile(r'\d{3,11}')
+
 
 class ManualOCR(OCRPort):
     """
@@ -80,16 +87,14 @@ class ManualOCR(OCRPort):
                 break
 
             # Limpiar entrada
-            cedula = cedula.replace(' ', '').replace('.', '').replace(',', '').replace('-', '')
-
-            # Validar que sea solo números
-            if not cedula.isdigit():
-                print(f"  ✗ '{cedula}' no es válido (solo números). Intente de nuevo.")
-                continue
-
-            # Validar longitud
-            if not (3 <= len(cedula) <= 11):
-                print(f"  ✗ '{cedula}' tiene longitud inválida ({len(cedula)} dígitos). Debe tener 3-11 dígitos.")
+            cedula = cedula.translate(_STRIP_TABLE)
+
+            # Validar números y longitud en una sola pasada
+            if not _CEDULA_RE.fullmatch(cedula):
+                if not cedula.isdigit():
+                    print(f"  ✗ '{cedula}' no es válido (solo números). Intente de nuevo.")
+                else:
+                    print(f"  ✗ '{cedula}' tiene longitud inválida ({len(cedula)} dígitos). Debe tener 3-11 dígitos.")
                 continue
 
             # Crear registro usando factory method
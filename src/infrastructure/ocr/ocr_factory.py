@@ -1,8 +1,84 @@
 """Factory para crear adaptadores OCR según configuración."""
-from typing import Optional
+import hashlib
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ...domain.ports import OCRPort, ConfigPort
-from ...shared.logging import LoggerFactory, log_info_message, log_warning_message, log_error_message
+from ...shared.logging import (
+    LoggerFactory, log_debug_message, log_info_message, log_warning_message, log_error_message
+)
+
+# Clases de adaptador exportadas de forma diferida (PEP 562): el módulo del
+# SDK solo se importa cuando se accede al nombre
+_LAZY_ADAPTERS = {
+    'GoogleVisionAdapter': '.google_vision_adapter',
+    'AzureVisionAdapter': '.azure_vision_adapter',
+    'EnsembleOCR': '.ensemble_ocr',
+    'DigitLevelEnsembleOCR': '.digit_level_ensemble_ocr',
+    'TesseractOCR': '.tesseract_ocr',
+}
+
+# Cache en disco de la detección de proveedores (stale-while-revalidate):
+# pasado el TTL se sirve el valor viejo y se refresca en segundo plano
+_PROVIDERS_CACHE_PATH = Path('~/.cache/firmas/ocr_providers.json').expanduser()
+_PROVIDERS_CACHE_TTL = 24 * 60 * 60
+
+# Historial de inicializaciones por proveedor (momento, latencia, éxito), en
+# ventana deslizante y persistido entre ejecuciones para ordenar los fallbacks.
+# Las muestras vencen pasado el TTL y con pocas muestras vigentes el proveedor
+# conserva su lugar: un fallo pasajero no lo relega de forma permanente
+_PROVIDER_STATS_PATH = Path('~/.cache/firmas/ocr_provider_stats.json').expanduser()
+_PROVIDER_STATS_WINDOW = 20
+_PROVIDER_STATS_TTL = 24 * 60 * 60
+_PROVIDER_STATS_MIN_SAMPLES = 3
+_provider_stats: Optional[Dict[str, deque]] = None
+_PROVIDER_STATS_LOCK = threading.Lock()
+
+# Adaptadores ya inicializados, por (proveedor configurado, id de la configuración).
+# Cada entrada guarda la configuración (para que su id no pueda reutilizarse)
+# y la huella de las secciones que leen los adapters al construirse.
+_ADAPTER_CACHE: Dict[Tuple[str, int], Tuple[ConfigPort, str, OCRPort]] = {}
+_ADAPTER_CACHE_LOCK = threading.Lock()
+
+# Secciones de configuración que determinan un adaptador
+_ADAPTER_CONFIG_SECTIONS = ('ocr', 'image_preprocessing')
+
+
+def __getattr__(name: str):
+    """
+    Resuelve las clases de _LAZY_ADAPTERS al primer acceso.
+
+    Args:
+        name: Nombre del atributo solicitado
+
+    Returns:
+        Clase del adaptador (queda en el módulo para los siguientes accesos)
+
+    Raises:
+        AttributeError: Si el nombre no es un adaptador conocido
+    """
+    module_name = _LAZY_ADAPTERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    adapter_class = getattr(importlib.import_module(module_name, __package__), name)
+    globals()[name] = adapter_class
+    return adapter_class
+
+
+def __dir__():
+    """Incluye los adaptadores diferidos en dir() y el autocompletado."""
+    return sorted(set(globals()) | set(_LAZY_ADAPTERS))
 
 
 def create_ocr_adapter(config: ConfigPort) -> Optional[OCRPort]:
@@ -30,10 +106,95 @@ def create_ocr_adapter(config: ConfigPort) -> Optional[OCRPort]:
     Note:
         Si el proveedor configurado no está disponible, intenta fallback
         automático a otros proveedores disponibles.
-    """
-    logger = LoggerFactory.get_infrastructure_logger("ocr_factory")
 
+        El adaptador resultante (incluido el de fallback) se reutiliza en
+        llamadas posteriores con la misma configuración, evitando repetir
+        la autenticación de los SDKs. Si cambian las secciones 'ocr' o
+        'image_preprocessing' se crea uno nuevo. Ver clear_ocr_cache().
+    """
     provider = config.get('ocr.provider', 'google_vision').lower()
+    cache_key = (provider, id(config))
+    fingerprint = _config_fingerprint(config)
+
+    with _ADAPTER_CACHE_LOCK:
+        cached = _ADAPTER_CACHE.get(cache_key)
+        if cached is not None and cached[1] == fingerprint:
+            return cached[2]
+
+        ocr_adapter = _create_ocr_adapter(provider, config)
+
+        if ocr_adapter is not None:
+            _ADAPTER_CACHE[cache_key] = (config, fingerprint, ocr_adapter)
+
+        return ocr_adapter
+
+
+def _config_fingerprint(config: ConfigPort) -> str:
+    """
+    Calcula una huella de las secciones de configuración de los adapters.
+
+    Una sola lectura por sección; detecta cambios hechos con config.set()
+    (credenciales, proveedor, preprocesamiento) sobre la misma instancia.
+
+    Args:
+        config: Servicio de configuración
+
+    Returns:
+        Hash corto (hex) del contenido de _ADAPTER_CONFIG_SECTIONS
+    """
+    snapshot = {section: config.get(section) for section in _ADAPTER_CONFIG_SECTIONS}
+    serialized = json.dumps(snapshot, sort_keys=True, default=str)
+    return hashlib.blake2b(serialized.encode('utf-8'), digest_size=8).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def _get_logger():
+    """
+    Logger del factory, creado una sola vez.
+
+    Se crea en el primer uso (no al importar) para incluir el contexto
+    global que la aplicación configura al arrancar.
+    """
+    return LoggerFactory.get_infrastructure_logger("ocr_factory")
+
+
+def clear_ocr_cache() -> None:
+    """
+    Descarta los adaptadores cacheados por create_ocr_adapter(), la
+    detección de proveedores de get_available_providers() y el historial
+    de inicializaciones que ordena los fallbacks (en memoria y en disco).
+
+    La siguiente llamada vuelve a inicializar el proveedor (útil en tests
+    o tras cambiar credenciales o instalar un SDK).
+    """
+    global _provider_stats
+
+    with _ADAPTER_CACHE_LOCK:
+        _ADAPTER_CACHE.clear()
+    _detect_available_providers.cache_clear()
+
+    with _PROVIDER_STATS_LOCK:
+        _provider_stats = None
+
+        for path in (_PROVIDERS_CACHE_PATH, _PROVIDER_STATS_PATH):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+def _create_ocr_adapter(provider: str, config: ConfigPort) -> Optional[OCRPort]:
+    """
+    Crea el adaptador del proveedor indicado, con fallback automático.
+
+    Args:
+        provider: Proveedor configurado en 'ocr.provider'
+        config: Servicio de configuración
+
+    Returns:
+        Adaptador OCR inicializado, o None si ningún proveedor funcionó
+    """
+    logger = _get_logger()
 
     log_info_message(
         logger,
@@ -43,9 +204,10 @@ def create_ocr_adapter(config: ConfigPort) -> Optional[OCRPort]:
     )
 
     # Intentar crear el proveedor configurado
-    ocr_adapter = _try_create_provider(provider, config, logger)
+    ocr_adapter, latency = _timed_create_provider(provider, config, logger)
 
     if ocr_adapter:
+        _record_provider_inits([(provider, latency, True)])
         return ocr_adapter
 
     # Si falló, intentar fallback automático
@@ -55,29 +217,30 @@ def create_ocr_adapter(config: ConfigPort) -> Optional[OCRPort]:
         failed_provider=provider
     )
 
-    fallback_order = ['google_vision', 'azure_vision', 'tesseract']
-
-    for fallback_provider in fallback_order:
-        if fallback_provider == provider:
-            continue  # Ya lo intentamos
+    fallback_providers = _order_by_reliability(
+        [p for p in _FALLBACK_ORDER if p != provider]  # El configurado ya se intentó
+    )
+    ocr_adapter, fallback_provider, fallback_samples = _create_first_available(
+        fallback_providers, config, logger
+    )
 
-        logger.info("Intentando proveedor fallback", provider=fallback_provider)
-        ocr_adapter = _try_create_provider(fallback_provider, config, logger)
+    # Un solo registro (y una sola escritura) con los intentos usados
+    _record_provider_inits([(provider, latency, False), *fallback_samples])
 
-        if ocr_adapter:
-            log_info_message(
-                logger,
-                "Fallback exitoso",
-                fallback_provider=fallback_provider,
-                original_provider=provider
-            )
-            return ocr_adapter
+    if ocr_adapter:
+        log_info_message(
+            logger,
+            "Fallback exitoso",
+            fallback_provider=fallback_provider,
+            original_provider=provider
+        )
+        return ocr_adapter
 
     # Si ninguno funcionó
     log_error_message(
         logger,
         "No se pudo inicializar ningun proveedor OCR",
-        attempted_providers=[provider] + fallback_order,
+        attempted_providers=[provider, *fallback_providers],
         solutions=[
             "Google Vision: Configurar gcloud auth application-default login",
             "Azure Vision: Configurar AZURE_VISION_ENDPOINT y AZURE_VISION_KEY",
@@ -88,6 +251,56 @@ def create_ocr_adapter(config: ConfigPort) -> Optional[OCRPort]:
     return None
 
 
+def _create_first_available(
+    providers: List[str],
+    config: ConfigPort,
+    logger
+) -> Tuple[Optional[OCRPort], Optional[str], List[Tuple[str, float, bool]]]:
+    """
+    Inicializa los proveedores en orden y devuelve el primero que funcione.
+
+    El siguiente proveedor solo arranca cuando el preferido falló: así no
+    se construyen clientes de nube (autenticación, canales gRPC/HTTP) que
+    luego quedarían sin usar ni cerrar.
+
+    Args:
+        providers: Proveedores en orden de preferencia
+        config: Servicio de configuración
+        logger: Logger para registrar eventos
+
+    Returns:
+        Tupla (adaptador, proveedor, intentos), con (None, None, intentos)
+        si ninguno funcionó. Cada intento es (proveedor, latencia, éxito)
+    """
+    samples = []
+
+    for fallback_provider in providers:
+        logger.info("Intentando proveedor fallback", provider=fallback_provider)
+        ocr_adapter, latency = _timed_create_provider(fallback_provider, config, logger)
+        samples.append((fallback_provider, latency, ocr_adapter is not None))
+        if ocr_adapter:
+            return ocr_adapter, fallback_provider, samples
+
+    return None, None, samples
+
+
+def _timed_create_provider(provider: str, config: ConfigPort, logger) -> Tuple[Optional[OCRPort], float]:
+    """
+    Intenta crear un proveedor y mide la duración de la inicialización.
+
+    Args:
+        provider: Nombre del proveedor
+        config: Servicio de configuración
+        logger: Logger para registrar eventos
+
+    Returns:
+        Tupla (adaptador o None, segundos transcurridos)
+    """
+    start = time.perf_counter()
+    adapter = _try_create_provider(provider, config, logger)
+    return adapter, time.perf_counter() - start
+
+
 def _try_create_provider(provider: str, config: ConfigPort, logger) -> Optional[OCRPort]:
     """
     Intenta crear un proveedor OCR específico.
@@ -100,86 +313,13 @@ def _try_create_provider(provider: str, config: ConfigPort, logger) -> Optional[
     Returns:
         Adaptador OCR o None si falló
     """
-    try:
-        if provider == 'google_vision':
-            from .google_vision_adapter import GoogleVisionAdapter
-            logger.info("Inicializando Google Cloud Vision")
-            adapter = GoogleVisionAdapter(config)
-            log_info_message(
-                logger,
-                "Google Cloud Vision inicializado correctamente",
-                free_tier="1,000 imagenes/mes",
-                equivalent_cedulas="15,000 cedulas/mes"
-            )
-            return adapter
-
-        elif provider == 'azure_vision':
-            from .azure_vision_adapter import AzureVisionAdapter
-            logger.info("Inicializando Azure Computer Vision")
-            adapter = AzureVisionAdapter(config)
-            log_info_message(
-                logger,
-                "Azure Computer Vision inicializado correctamente",
-                free_tier="5,000 transacciones/mes",
-                equivalent_cedulas="75,000 cedulas/mes"
-            )
-            return adapter
-
-        elif provider == 'ensemble':
-            from .ensemble_ocr import EnsembleOCR
-            logger.info("Inicializando Ensemble OCR", providers=["google_vision", "azure_vision"])
-            adapter = EnsembleOCR(config)
-            log_info_message(
-                logger,
-                "Ensemble OCR inicializado correctamente",
-                mode="maxima_precision",
-                cost_multiplier=2,
-                warning="Doble costo - usa ambas APIs"
-            )
-            return adapter
-
-        elif provider == 'digit_ensemble':
-            from .google_vision_adapter import GoogleVisionAdapter
-            from .azure_vision_adapter import AzureVisionAdapter
-            from .digit_level_ensemble_ocr import DigitLevelEnsembleOCR
-
-            logger.info("Inicializando Digit-Level Ensemble OCR")
-            logger.debug("Creando Azure Vision adapter (Primary)")
-            azure = AzureVisionAdapter(config)
-            logger.debug("Creando Google Vision adapter (Secondary)")
-            google = GoogleVisionAdapter(config)
-            logger.debug("Combinando ambos con logica de votacion por digito")
-
-            adapter = DigitLevelEnsembleOCR(
-                config=config,
-                primary_ocr=azure,      # Azure como primary (mejor precisión)
-                secondary_ocr=google    # Google como secondary
-            )
-            log_info_message(
-                logger,
-                "Digit-Level Ensemble inicializado correctamente",
-                precision="98-99.5%",
-                cost_multiplier=2,
-                strategy="votacion_por_digito",
-                warning="Doble costo - usa ambas APIs"
-            )
-            return adapter
-
-        elif provider == 'tesseract':
-            from .tesseract_ocr import TesseractOCR
-            logger.info("Inicializando Tesseract OCR")
-            adapter = TesseractOCR(config)
-            log_info_message(
-                logger,
-                "Tesseract OCR inicializado correctamente",
-                cost="gratis",
-                precision="70-85%"
-            )
-            return adapter
+    factory = _FACTORIES.get(provider)
+    if factory is None:
+        log_error_message(logger, "Proveedor OCR desconocido", provider=provider)
+        return None
 
-        else:
-            log_error_message(logger, "Proveedor OCR desconocido", provider=provider)
-            return None
+    try:
+        return factory(config, logger)
 
     except ImportError as e:
         log_error_message(
@@ -199,6 +339,222 @@ def _try_create_provider(provider: str, config: ConfigPort, logger) -> Optional[
         return None
 
 
+def _order_by_reliability(providers: List[str]) -> List[str]:
+    """
+    Ordena los proveedores por tasa de éxito reciente al inicializarse.
+
+    Un proveedor que viene fallando (credenciales vencidas, SDK roto) pasa
+    detrás de los que funcionan, así el fallback no espera su fallo. A
+    igual tasa se conserva el orden de preferencia recibido; la latencia
+    no reordena, porque priorizaría al motor más rápido (Tesseract) sobre
+    el más preciso.
+
+    Solo cuentan las muestras vigentes (_PROVIDER_STATS_TTL, 24 horas), y
+    con menos de _PROVIDER_STATS_MIN_SAMPLES el proveedor conserva su
+    lugar. Un proveedor relegado, que ya no se intenta, recupera su
+    posición cuando vencen sus fallos.
+
+    Args:
+        providers: Proveedores en orden de preferencia
+
+    Returns:
+        Proveedores reordenados (sin historial suficiente cuentan como 100%
+        de éxito)
+    """
+    oldest = time.time() - _PROVIDER_STATS_TTL
+
+    with _PROVIDER_STATS_LOCK:
+        stats = _load_provider_stats()
+        success_rates = {}
+        for provider in providers:
+            recent = [ok for ts, _, ok in stats.get(provider, ()) if ts >= oldest]
+            success_rates[provider] = (
+                sum(recent) / len(recent)
+                if len(recent) >= _PROVIDER_STATS_MIN_SAMPLES else 1.0
+            )
+
+    return sorted(providers, key=lambda provider: -success_rates[provider])
+
+
+def _record_provider_inits(attempts: List[Tuple[str, float, bool]]) -> None:
+    """
+    Registra los resultados de inicialización y persiste el historial.
+
+    Todos los intentos de una creación se escriben en disco una sola vez.
+
+    Args:
+        attempts: Lista de (proveedor, latencia en segundos, si se obtuvo adaptador)
+    """
+    if not attempts:
+        return
+
+    now = round(time.time(), 3)
+
+    with _PROVIDER_STATS_LOCK:
+        stats = _load_provider_stats()
+        for provider, latency, success in attempts:
+            samples = stats.setdefault(provider, deque(maxlen=_PROVIDER_STATS_WINDOW))
+            samples.append((now, round(latency, 3), success))
+
+        _write_json_atomic(
+            _PROVIDER_STATS_PATH,
+            {name: list(entries) for name, entries in stats.items()}
+        )
+
+
+def _load_provider_stats() -> Dict[str, deque]:
+    """
+    Retorna el historial en memoria, cargándolo del disco la primera vez.
+
+    Debe llamarse con _PROVIDER_STATS_LOCK tomado.
+
+    Returns:
+        Dict proveedor -> deque de (momento, latencia, éxito)
+    """
+    global _provider_stats
+
+    if _provider_stats is None:
+        try:
+            data = json.loads(_PROVIDER_STATS_PATH.read_text(encoding='utf-8'))
+            # Las muestras sin momento (formato anterior) se descartan
+            _provider_stats = {
+                provider: deque(
+                    (
+                        (float(sample[0]), float(sample[1]), bool(sample[2]))
+                        for sample in samples if len(sample) == 3
+                    ),
+                    maxlen=_PROVIDER_STATS_WINDOW
+                )
+                for provider, samples in data.items()
+            }
+        except (OSError, ValueError, TypeError, AttributeError):
+            _provider_stats = {}
+
+    return _provider_stats
+
+
+# ----------------------------------------------------------------------------
+# Constructores por proveedor. Cada uno resuelve su clase con _adapter_class
+# al ser llamado, de modo que los SDKs no instalados solo fallan si se eligen.
+# ----------------------------------------------------------------------------
+
+def _adapter_class(name: str) -> type:
+    """
+    Retorna una clase de _LAZY_ADAPTERS, importándola solo la primera vez.
+
+    Las siguientes llamadas la toman de los globals del módulo (donde la
+    deja __getattr__) sin volver a pasar por el sistema de imports.
+
+    Args:
+        name: Nombre de la clase (clave de _LAZY_ADAPTERS)
+
+    Returns:
+        Clase del adaptador
+
+    Raises:
+        ImportError: Si el módulo del adaptador no se puede importar
+    """
+    return globals().get(name) or __getattr__(name)
+
+
+def _make_google_vision(config: ConfigPort, logger) -> OCRPort:
+    logger.info("Inicializando Google Cloud Vision")
+    adapter = _adapter_class('GoogleVisionAdapter')(config)
+    log_info_message(
+        logger,
+        "Google Cloud Vision inicializado correctamente",
+        free_tier="1,000 imagenes/mes",
+        equivalent_cedulas="15,000 cedulas/mes"
+    )
+    return adapter
+
+
+def _make_azure_vision(config: ConfigPort, logger) -> OCRPort:
+    logger.info("Inicializando Azure Computer Vision")
+    adapter = _adapter_class('AzureVisionAdapter')(config)
+    log_info_message(
+        logger,
+        "Azure Computer Vision inicializado correctamente",
+        free_tier="5,000 transacciones/mes",
+        equivalent_cedulas="75,000 cedulas/mes"
+    )
+    return adapter
+
+
+def _make_ensemble(config: ConfigPort, logger) -> OCRPort:
+    logger.info("Inicializando Ensemble OCR", providers=["google_vision", "azure_vision"])
+    adapter = _adapter_class('EnsembleOCR')(config)
+    log_info_message(
+        logger,
+        "Ensemble OCR inicializado correctamente",
+        mode="maxima_precision",
+        cost_multiplier=2,
+        warning="Doble costo - usa ambas APIs"
+    )
+    return adapter
+
+
+def _make_digit_ensemble(config: ConfigPort, logger) -> OCRPort:
+    azure_class = _adapter_class('AzureVisionAdapter')
+    google_class = _adapter_class('GoogleVisionAdapter')
+    ensemble_class = _adapter_class('DigitLevelEnsembleOCR')
+
+    logger.info("Inicializando Digit-Level Ensemble OCR")
+    logger.debug("Creando Azure Vision (Primary) y Google Vision (Secondary) en paralelo")
+
+    # La autenticación de cada SDK es I/O independiente: en paralelo
+    # el arranque tarda lo del más lento en lugar de la suma.
+    # result() relanza la excepción original para _try_create_provider.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        azure_future = executor.submit(azure_class, config)
+        google_future = executor.submit(google_class, config)
+        azure = azure_future.result()
+        google = google_future.result()
+
+    logger.debug("Combinando ambos con logica de votacion por digito")
+
+    adapter = ensemble_class(
+        config=config,
+        primary_ocr=azure,      # Azure como primary (mejor precisión)
+        secondary_ocr=google    # Google como secondary
+    )
+    log_info_message(
+        logger,
+        "Digit-Level Ensemble inicializado correctamente",
+        precision="98-99.5%",
+        cost_multiplier=2,
+        strategy="votacion_por_digito",
+        warning="Doble costo - usa ambas APIs"
+    )
+    return adapter
+
+
+def _make_tesseract(config: ConfigPort, logger) -> OCRPort:
+    logger.info("Inicializando Tesseract OCR")
+    adapter = _adapter_class('TesseractOCR')(config)
+    log_info_message(
+        logger,
+        "Tesseract OCR inicializado correctamente",
+        cost="gratis",
+        precision="70-85%"
+    )
+    return adapter
+
+
+# Tabla de despacho: nombre de proveedor -> constructor
+_FACTORIES: Dict[str, Callable[[ConfigPort, Any], OCRPort]] = {
+    'google_vision': _make_google_vision,
+    'azure_vision': _make_azure_vision,
+    'ensemble': _make_ensemble,
+    'digit_ensemble': _make_digit_ensemble,
+    'tesseract': _make_tesseract,
+}
+
+# Proveedores de un solo motor, en orden de preferencia para el fallback
+# (los ensembles no se usan como fallback: duplican el costo)
+_FALLBACK_ORDER = ('google_vision', 'azure_vision', 'tesseract')
+
+
 def get_available_providers() -> list:
     """
     Obtiene lista de proveedores OCR disponibles en el sistema.
@@ -206,88 +562,224 @@ def get_available_providers() -> list:
     Returns:
         Lista de strings con nombres de proveedores disponibles
 
+    Note:
+        La detección se hace una sola vez por proceso; se retorna una
+        copia para que el llamador pueda modificarla.
+
     Example:
         >>> providers = get_available_providers()
         >>> print(f"Proveedores disponibles: {', '.join(providers)}")
     """
+    return list(_detect_available_providers())
+
+
+@lru_cache(maxsize=1)
+def _detect_available_providers() -> Tuple[str, ...]:
+    """
+    Retorna los proveedores disponibles (memoizado, ver get_available_providers).
+
+    Usa el cache en disco si existe y corresponde a este intérprete. Si
+    está vencido lo sirve igual y lanza un refresco en segundo plano; si
+    no existe, escanea y lo escribe.
+
+    Returns:
+        Tupla con los nombres de proveedores disponibles
+    """
+    cached = _read_providers_cache()
+
+    if cached is None:
+        available = _scan_available_providers()
+        _write_providers_cache(available)
+        return available
+
+    providers, timestamp = cached
+    if time.time() - timestamp > _PROVIDERS_CACHE_TTL:
+        threading.Thread(target=_refresh_providers_cache, daemon=True).start()
+
+    return providers
+
+
+def _refresh_providers_cache() -> None:
+    """Vuelve a escanear los SDKs y reescribe el cache en disco."""
+    _write_providers_cache(_scan_available_providers())
+
+
+def _read_providers_cache() -> Optional[Tuple[Tuple[str, ...], float]]:
+    """
+    Lee el cache en disco de proveedores.
+
+    Returns:
+        Tupla (proveedores, timestamp), o None si no existe, es ilegible
+        o fue generado por otro intérprete (otro venv)
+    """
+    try:
+        data = json.loads(_PROVIDERS_CACHE_PATH.read_text(encoding='utf-8'))
+        if data['python'] != sys.executable:
+            return None
+        return tuple(data['providers']), float(data['ts'])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_providers_cache(providers: Tuple[str, ...]) -> None:
+    """
+    Escribe el cache en disco de proveedores de forma atómica.
+
+    Los errores se registran pero no se propagan: el cache es opcional.
+
+    Args:
+        providers: Proveedores detectados
+    """
+    _write_json_atomic(
+        _PROVIDERS_CACHE_PATH,
+        {'providers': list(providers), 'python': sys.executable, 'ts': time.time()}
+    )
+
+
+def _write_json_atomic(path: Path, data: Any) -> None:
+    """
+    Escribe un JSON de forma atómica (tmp + os.replace).
+
+    El archivo temporal tiene nombre único en el mismo directorio, así dos
+    procesos que escriben a la vez no comparten el temporal y el lector
+    siempre ve un JSON completo.
+
+    Los errores se registran pero no se propagan: estos caches son opcionales.
+
+    Args:
+        path: Ruta destino
+        data: Datos serializables a JSON
+    """
+    tmp_path = None
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as tmp_file:
+            json.dump(data, tmp_file)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+        log_debug_message(
+            _get_logger(),
+            "No se pudo escribir el cache",
+            path=str(path),
+            error=str(e)
+        )
+
+
+def _scan_available_providers() -> Tuple[str, ...]:
+    """Detecta los SDKs instalados con find_spec (sin importarlos)."""
     available = []
 
     # Verificar Google Vision
-    try:
-        from google.cloud import vision
+    if _module_available('google.cloud.vision'):
         available.append('google_vision')
-    except ImportError:
-        pass
 
     # Verificar Azure Vision
-    try:
-        from azure.ai.vision.imageanalysis import ImageAnalysisClient
+    if _module_available('azure.ai.vision.imageanalysis'):
         available.append('azure_vision')
-    except ImportError:
-        pass
 
     # Verificar Tesseract
-    try:
-        import pytesseract
+    if _module_available('pytesseract'):
         available.append('tesseract')
-    except ImportError:
-        pass
 
     # Ensemble solo si hay Google Vision y Azure Vision
     if 'google_vision' in available and 'azure_vision' in available:
         available.append('ensemble')
         available.append('digit_ensemble')
 
-    return available
+    return tuple(available)
+
+
+def _module_available(module_name: str) -> bool:
+    """
+    Verifica si un módulo está instalado sin importarlo.
+
+    find_spec solo consulta los finders; no ejecuta el código del SDK
+    (protobufs, clientes HTTP, etc.), a diferencia de un import de prueba.
+
+    Args:
+        module_name: Nombre completo del módulo (ej. 'google.cloud.vision')
+
+    Returns:
+        True si el módulo puede importarse
+    """
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        # El paquete padre no existe (ej. 'azure' sin instalar)
+        return False
+
+
+# Datos comparativos estáticos de get_provider_comparison()
+_PROVIDER_COMPARISON = {
+    'google_vision': {
+        'precision': '95-98%',
+        'cost_per_1000': '$5.16 COP',
+        'speed': '1-2 seg',
+        'free_tier': '1,000 imgs/mes'
+    },
+    'azure_vision': {
+        'precision': '96-98%',
+        'cost_per_1000': '$4,200 COP',
+        'speed': '1-2 seg',
+        'free_tier': '5,000 trans/mes'
+    },
+    'ensemble': {
+        'precision': '>99%',
+        'cost_per_1000': '$9,360 COP',
+        'speed': '2-3 seg',
+        'note': 'Doble costo'
+    },
+    'digit_ensemble': {
+        'precision': '98-99.5%',
+        'cost_per_1000': '$9,360 COP',
+        'speed': '2-3 seg',
+        'recommended': True,
+        'note': 'Votacion digito por digito'
+    },
+    'tesseract': {
+        'precision': '70-85%',
+        'cost_per_1000': 'Gratis',
+        'speed': '0.5-1 seg',
+        'note': 'Local, sin conexion'
+    }
+}
+
+_PROVIDER_RECOMMENDATIONS = {
+    'max_precision': 'digit_ensemble',
+    'production': 'google_vision',
+    'comparison': 'azure_vision',
+    'high_precision': 'ensemble',
+    'development': 'tesseract'
+}
 
 
 def get_provider_comparison() -> dict:
     """
     Obtiene datos comparativos de proveedores OCR disponibles.
 
+    Las tablas son constantes del módulo; solo 'available' se calcula
+    (y está memoizado). Se retornan copias para que el llamador pueda
+    modificarlas.
+
     Returns:
         Dict con información de cada proveedor y recomendaciones
     """
     return {
-        'providers': {
-            'google_vision': {
-                'precision': '95-98%',
-                'cost_per_1000': '$5.16 COP',
-                'speed': '1-2 seg',
-                'free_tier': '1,000 imgs/mes'
-            },
-            'azure_vision': {
-                'precision': '96-98%',
-                'cost_per_1000': '$4,200 COP',
-                'speed': '1-2 seg',
-                'free_tier': '5,000 trans/mes'
-            },
-            'ensemble': {
-                'precision': '>99%',
-                'cost_per_1000': '$9,360 COP',
-                'speed': '2-3 seg',
-                'note': 'Doble costo'
-            },
-            'digit_ensemble': {
-                'precision': '98-99.5%',
-                'cost_per_1000': '$9,360 COP',
-                'speed': '2-3 seg',
-                'recommended': True,
-                'note': 'Votacion digito por digito'
-            },
-            'tesseract': {
-                'precision': '70-85%',
-                'cost_per_1000': 'Gratis',
-                'speed': '0.5-1 seg',
-                'note': 'Local, sin conexion'
-            }
-        },
-        'recommendations': {
-            'max_precision': 'digit_ensemble',
-            'production': 'google_vision',
-            'comparison': 'azure_vision',
-            'high_precision': 'ensemble',
-            'development': 'tesseract'
-        },
+        'providers': {name: dict(info) for name, info in _PROVIDER_COMPARISON.items()},
+        'recommendations': dict(_PROVIDER_RECOMMENDATIONS),
         'available': get_available_providers()
     }
+
+
+# OCR_EAGER_IMPORT=1 resuelve todos los adaptadores al importar el módulo,
+# para que CI detecte errores de importación que el modo diferido ocultaría
+if os.environ.get('OCR_EAGER_IMPORT') == '1':
+    for _adapter_name in _LAZY_ADAPTERS:
+        __getattr__(_adapter_name)
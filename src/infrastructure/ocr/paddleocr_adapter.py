@@ -1,8 +1,9 @@
 """Implementación de OCR usando PaddleOCR (alternativa ligera a EasyOCR)."""
+import os
 import re
-import numpy as npz
+import numpy as np
 from PIL import Image
-from typing import List
+from typing import Dict, List, Tuple
 
 try:
     from paddleocr import PaddleOCR
@@ -13,6 +14,10 @@ except ImportError:
 
 from ...domain.entities import CedulaRecord
 from ...domain.ports import OCRPort, ConfigPort
+from ...shared.logging import LoggerFactory, log_debug_message, log_error_message, log_warning_message
+
+# Secuencias de dígitos (compilado una sola vez)
+_DIGIT_RUN_RE = re.compile(r'\d+')
 
 
 class PaddleOCRAdapter(OCRPort):
@@ -41,6 +46,7 @@ class PaddleOCRAdapter(OCRPort):
             raise ImportError("PaddleOCR no está instalado. Instalar con: pip install paddleocr")
 
         self.config = config
+        self.logger = LoggerFactory.get_ocr_logger("paddleocr")
         self.ocr = None
         self._initialize_ocr()
 
@@ -48,22 +54,48 @@ class PaddleOCRAdapter(OCRPort):
         """Inicializa PaddleOCR."""
         # Obtener configuración
         lang = self.config.get('ocr.paddle_lang', 'es')  # es, en, ch, etc.
+        enable_mkldnn = self.config.get('ocr.paddle_enable_mkldnn', True)
+        # 0 = la mitad de los núcleos (el resto queda para la UI y las APIs)
+        cpu_threads = self.config.get('ocr.paddle_cpu_threads', 0) or max(1, (os.cpu_count() or 2) // 2)
 
-        print(f"DEBUG PaddleOCR: Inicializando con idioma '{lang}'")
+        log_debug_message(
+            self.logger, "Inicializando PaddleOCR",
+            lang=lang, enable_mkldnn=enable_mkldnn, cpu_threads=cpu_threads
+        )
 
         try:
-            # Crear motor de PaddleOCR con parámetros mínimos
             # use_angle_cls=True: detecta texto rotado
             # lang='es': español (cambia según necesidad)
+            # enable_mkldnn: kernels MKL-DNN en CPU Intel
+            # show_log=False: el adapter ya registra sus propios eventos
             self.ocr = PaddleOCR(
                 use_angle_cls=True,
-                lang=lang
+                lang=lang,
+                enable_mkldnn=enable_mkldnn,
+                cpu_threads=cpu_threads,
+                show_log=False
             )
-            print("DEBUG PaddleOCR: Inicializado correctamente")
+            log_debug_message(self.logger, "PaddleOCR inicializado correctamente")
         except Exception as e:
-            print(f"ERROR PaddleOCR: No se pudo inicializar: {e}")
+            log_error_message(self.logger, "No se pudo inicializar PaddleOCR", error=e)
             raise
 
+        if self.config.get('ocr.paddle_warmup', True):
+            self._warmup()
+
+    def _warmup(self) -> None:
+        """
+        Ejecuta una inferencia sobre una imagen en blanco.
+
+        Los grafos MKL-DNN se construyen en la primera llamada; hacerlo aquí
+        evita que la primera imagen real pague esa latencia. Un fallo del
+        calentamiento no impide usar el motor.
+        """
+        try:
+            self.ocr.ocr(np.zeros((32, 32, 3), dtype=np.uint8), cls=True)
+        except Exception as e:
+            log_warning_message(self.logger, "Calentamiento de PaddleOCR fallido", error=str(e))
+
     def preprocess_image(self, image: Image.Image) -> Image.Image:
         """
         Preprocesa una imagen para mejorar el OCR.
@@ -80,7 +112,7 @@ class PaddleOCRAdapter(OCRPort):
         if image.mode != 'RGB':
             image = image.convert('RGB')
 
-        print(f"DEBUG PaddleOCR Preprocess: Imagen {image.width}x{image.height}")
+        log_debug_message(self.logger, "Imagen preprocesada", width=image.width, height=image.height)
 
         return image
 
@@ -95,64 +127,100 @@ class PaddleOCRAdapter(OCRPort):
             Lista de registros de cédulas extraídas
         """
         if self.ocr is None:
-            print("ERROR: PaddleOCR no está inicializado")
+            log_error_message(self.logger, "PaddleOCR no esta inicializado")
             return []
 
-        print("DEBUG PaddleOCR: Iniciando extracción...")
-
-        # Convertir PIL a numpy array
-        img_array = np.array(image)
+        log_debug_message(self.logger, "Iniciando extraccion")
 
         try:
-            # Ejecutar OCR
+            # Ejecutar OCR (una imagen por llamada: PaddleOCR 2.x termina el
+            # proceso con exit(0) si recibe una lista de imágenes con det=True)
             # Retorna: [[[bbox], (text, confidence)], ...]
-            results = self.ocr.ocr(img_array, cls=True)
+            results = self.ocr.ocr(self._to_array(image), cls=True)
 
-            if not results or results[0] is None:
-                print("DEBUG PaddleOCR: No se detectó texto")
+            if not results:
+                log_debug_message(self.logger, "No se detecto texto")
                 return []
 
-            print(f"DEBUG PaddleOCR: Detectados {len(results[0])} elementos")
+            return self._parse_result(results[0])
 
-            records = []
+        except Exception as e:
+            log_error_message(self.logger, "Error en extraccion de cedulas", error=e)
+            return []
 
-            for line in results[0]:
-                bbox, (text, confidence) = line
+    @staticmethod
+    def _to_array(image: Image.Image) -> np.ndarray:
+        """
+        Convierte una imagen PIL al array uint8 RGB contiguo que espera PaddleOCR.
 
-                # Limpiar texto - extraer solo números
-                text_clean = text.strip().replace(' ', '').replace('.', '').replace(',', '')
+        Usa asarray: el motor solo lee la imagen, no hace falta una copia
+        adicional del buffer. Una imagen ya preprocesada no se convierte.
 
-                print(f"DEBUG PaddleOCR: '{text}' -> '{text_clean}' con confianza {confidence*100:.1f}%")
+        Args:
+            image: Imagen PIL
 
-                # Extraer números del texto
-                numbers = re.findall(r'\d+', text_clean)
+        Returns:
+            Array (alto, ancho, 3) contiguo en memoria
+        """
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        img_array = np.asarray(image)
+        if not img_array.flags['C_CONTIGUOUS']:
+            img_array = np.ascontiguousarray(img_array)
+        return img_array
 
-                for num in numbers:
-                    # Validar longitud de cédula (3-11 dígitos)
-                    if 3 <= len(num) <= 11:
-                        # PaddleOCR da buena confianza, umbral bajo
-                        if confidence >= 0.3:  # 30% mínimo
-                            # Usar factory method para crear con Value Objects
-                            record = CedulaRecord.from_primitives(
-                                cedula=num,
-                                confidence=confidence * 100  # Convertir a porcentaje
-                            )
-                            records.append(record)
+    def _parse_result(self, page_result) -> List[CedulaRecord]:
+        """
+        Convierte el resultado de PaddleOCR de una imagen en registros de cédula.
+
+        Args:
+            page_result: Líneas detectadas [[bbox, (text, confidence)], ...] o None
 
-                            print(f"✓ Cédula aceptada: '{num}' ({confidence*100:.1f}%)")
+        Returns:
+            Registros sin duplicados
+        """
+        if page_result is None:
+            log_debug_message(self.logger, "No se detecto texto")
+            return []
 
-            # Eliminar duplicados manteniendo el de mayor confianza
-            unique_records = self._remove_duplicates(records)
+        log_debug_message(self.logger, "Elementos detectados", count=len(page_result))
 
-            print(f"DEBUG PaddleOCR: Total registros únicos: {len(unique_records)}")
+        records = []
 
-            return unique_records
+        for line in page_result:
+            bbox, (text, confidence) = line
 
-        except Exception as e:
-            print(f"ERROR PaddleOCR: {e}")
-            import traceback
-            traceback.print_exc()
-            return []
+            # Limpiar texto - extraer solo números
+            text_clean = text.strip().replace(' ', '').replace('.', '').replace(',', '')
+
+            log_debug_message(
+                self.logger, "Texto detectado",
+                text=text, text_clean=text_clean, confidence=confidence
+            )
+
+            # Extraer números del texto
+            numbers = _DIGIT_RUN_RE.findall(text_clean)
+
+            for num in numbers:
+                # Validar longitud de cédula (3-11 dígitos)
+                if 3 <= len(num) <= 11:
+                    # PaddleOCR da buena confianza, umbral bajo
+                    if confidence >= 0.3:  # 30% mínimo
+                        # Usar factory method para crear con Value Objects
+                        record = CedulaRecord.from_primitives(
+                            cedula=num,
+                            confidence=confidence * 100  # Convertir a porcentaje
+                        )
+                        records.append(record)
+
+                        log_debug_message(self.logger, "Cedula aceptada", cedula=num, confidence=confidence)
+
+        # Eliminar duplicados manteniendo el de mayor confianza
+        unique_records = self._remove_duplicates(records)
+
+        log_debug_message(self.logger, "Registros unicos", count=len(unique_records))
+
+        return unique_records
 
     def _remove_duplicates(self, records: List[CedulaRecord]) -> List[CedulaRecord]:
         """
@@ -164,13 +232,16 @@ class PaddleOCRAdapter(OCRPort):
         Returns:
             Lista sin duplicados
         """
-        seen = {}
+        # cedula -> (porcentaje de confianza, registro); el porcentaje se
+        # calcula una vez por registro en lugar de en cada comparación
+        seen: Dict[str, Tuple[float, CedulaRecord]] = {}
 
         for record in records:
             # Usar .value ya que cedula es ahora CedulaNumber (Value Object)
             cedula_key = record.cedula.value
-            # Comparar confidence usando .as_percentage() ya que es ConfidenceScore
-            if cedula_key not in seen or record.confidence.as_percentage() > seen[cedula_key].confidence.as_percentage():
-                seen[cedula_key] = record
+            percentage = record.confidence.as_percentage()
+            current = seen.get(cedula_key)
+            if current is None or percentage > current[0]:
+                seen[cedula_key] = (percentage, record)
 
-        return list(seen.values())
+        return [record for _, record in seen.values()]
@@ -8,10 +8,26 @@ Esto elimina completamente los problemas de sincronización y agrupamiento.
 """
 
 import re
+from functools import lru_cache
 from typing import List, Dict, Tuple
 from PIL import Image
 import numpy as np
-import cv2
+import structlog
+
+from .image_converter import ImageConverter
+
+logger = structlog.get_logger(__name__)
+
+# Patrones compilados una sola vez
+_CEDULA_RE = re.compile(r'\d{7,10}')
+_NON_DIGIT_RE = re.compile(r'\D')
+
+# Palabras del formulario/encabezado que NO son nombres (se buscan como
+# subcadena, así también filtran variantes como "Cédula:" o "Nombres")
+_FORM_WORDS = ('cédula', 'cedula', 'of', 'can', 'firma', 'nombre', 'documento', 'firmas')
+
+# Artículos y conectores que van en minúscula dentro de un nombre
+_LOWERCASE_ARTICLES = frozenset({'de', 'del', 'y', 'e', 'la', 'las', 'los'})
 
 
 class RowBasedExtraction:
@@ -129,48 +145,68 @@ class RowBasedExtraction:
         for block in text_blocks:
             text = block['text'].strip()
 
-            # Filtrar basura
-            if len(text) < 2:
+            # Filtrar basura, números y palabras del formulario
+            if not RowBasedExtraction._is_nombre_word(text):
                 continue
 
-            # ¿Es principalmente letras?
-            letter_count = sum(1 for c in text if c.isalpha() or c.isspace())
-            if letter_count / len(text) < 0.7:
-                continue
+            nombre_parts.append(text)
 
-            # Blacklist de palabras del formulario
-            text_lower = text.lower()
-            blacklist = ['cédula', 'cedula', 'of', 'can', 'firma', 'nombre',
-                         'documento', 'firmas']
-            if any(word in text_lower for word in blacklist):
-                continue
+        # Unir todas las partes, limpiar y formatear
+        return RowBasedExtraction._format_nombre(' '.join(nombre_parts))
 
-            nombre_parts.append(text)
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _format_nombre(nombre: str) -> str:
+        """
+        Normaliza espacios, quita puntuación de los extremos y aplica
+        Title Case dejando en minúscula los artículos ("de", "la", ...).
+
+        Cacheado: el mismo texto de nombre se repite entre lecturas.
+
+        Args:
+            nombre: Nombre tal como lo leyó el OCR
 
-        # Unir todas las partes
-        nombre = ' '.join(nombre_parts)
+        Returns:
+            Nombre formateado o cadena vacía
+        """
+        nombre = ' '.join(nombre.split()).strip('.,;:()[]{}')
+        if not nombre:
+            return nombre
 
-        # Limpiar y formatear
-        nombre = ' '.join(nombre.split())  # Normalizar espacios
-        nombre = nombre.strip('.,;:()[]{}')
+        first, *rest = nombre.split()
+        formatted = [first.capitalize()]
+        for word in rest:
+            lower = word.lower()
+            formatted.append(lower if lower in _LOWERCASE_ARTICLES else word.capitalize())
 
-        # Title case
-        if nombre:
-            words = nombre.split()
-            formatted = []
-            lowercase_articles = {'de', 'del', 'de la', 'y', 'e', 'la', 'las', 'los'}
+        return ' '.join(formatted)
 
-            for i, word in enumerate(words):
-                if i == 0:
-                    formatted.append(word.capitalize())
-                elif word.lower() in lowercase_articles:
-                    formatted.append(word.lower())
-                else:
-                    formatted.append(word.capitalize())
+    @staticmethod
+    def _is_nombre_word(text: str) -> bool:
+        """
+        Determina si una palabra puede ser parte de un nombre.
 
-            nombre = ' '.join(formatted)
+        Principalmente letras (>= 70%), al menos 2 caracteres y sin
+        palabras del encabezado del formulario.
 
-        return nombre
+        Args:
+            text: Texto de la palabra
+
+        Returns:
+            True si la palabra parece parte de un nombre
+        """
+        text = text.strip()
+
+        # Permitir palabras cortas como "de"
+        if len(text) < 2:
+            return False
+
+        letter_count = sum(1 for c in text if c.isalpha() or c.isspace())
+        if letter_count / len(text) < 0.7:
+            return False
+
+        text_lower = text.lower()
+        return not any(word in text_lower for word in _FORM_WORDS)
 
     @staticmethod
     def extract_cedula_from_row(text_blocks: List[Dict]) -> str:
@@ -188,16 +224,14 @@ class RowBasedExtraction:
         for block in text_blocks:
             text = block['text'].strip()
 
-            # Buscar grupos de 7-10 dígitos
-            numero_pattern = r'\d{7,10}'
-            matches = re.findall(numero_pattern, text)
+            # Buscar grupos de 7-10 dígitos; retornar el primero encontrado
+            match = _CEDULA_RE.search(text)
 
-            if matches:
-                # Retornar el primer número encontrado
-                return matches[0]
+            if match:
+                return match.group()
 
             # Si no encontró, intentar limpiar todo
-            cleaned = re.sub(r'[^\d]', '', text)
+            cleaned = _NON_DIGIT_RE.sub('', text)
             if 7 <= len(cleaned) <= 10:
                 return cleaned
 
@@ -233,32 +267,25 @@ class RowBasedExtraction:
         Returns:
             Lista de pares {nombre, cedula, confidence_nombre, confidence_cedula}
         """
-        if verbose:
-            print("\n" + "=" * 80)
-            print("EXTRACCIÓN INTELIGENTE BASADA EN DETECCIÓN DE CÉDULAS")
-            print("=" * 80)
-
         # 1. OCR de imagen completa
         if verbose:
-            print("\n[1/4] Ejecutando OCR en imagen completa...")
+            logger.debug("row_extraction_started")
 
         # Preprocesar imagen
         processed_image = ocr_adapter.preprocess_image(image)
 
-        # Ejecutar OCR
-        import io
-        from google.cloud import vision
-
-        img_byte_arr = io.BytesIO()
-        processed_image.save(img_byte_arr, format='PNG')
-        img_byte_arr = img_byte_arr.getvalue()
-
-        vision_image = vision.Image(content=img_byte_arr)
-        response = ocr_adapter.client.document_text_detection(
-            image=vision_image,
-            image_context=vision.ImageContext(language_hints=['es'])
+        # Ejecutar OCR (el adapter reutiliza su ImageContext, reintentos y cache).
+        # Se codifica en el formato de subida del adapter sin reducir la imagen:
+        # las coordenadas de las palabras deben corresponder a processed_image.
+        img_bytes = ImageConverter.pil_to_bytes(
+            processed_image,
+            format=ocr_adapter.upload_format,
+            quality=ocr_adapter.upload_quality,
+            lossless=ocr_adapter.upload_format == 'WEBP'
         )
 
+        response = ocr_adapter._call_ocr_api(img_bytes)
+
         # Extraer TEXTO COMPLETO organizado por LÍNEAS
         if response.full_text_annotation:
             full_text = response.full_text_annotation.text
@@ -267,40 +294,36 @@ class RowBasedExtraction:
             lines = []
 
         if verbose:
-            print(f"  ✓ Detectadas {len(lines)} líneas de texto")
+            logger.debug("text_lines_detected", count=len(lines))
 
         # 2. Detectar CÉDULAS procesando línea por línea
-        if verbose:
-            print("\n[2/4] Detectando cédulas (método línea por línea)...")
-
         cedulas_detectadas = []
 
         # También necesitamos las palabras para obtener coordenadas Y
         words = ocr_adapter._extract_text_blocks_with_positions(response)
 
+        # Dígitos de cada palabra, calculados una sola vez (sin palabras sin dígitos)
+        digit_words = [(_NON_DIGIT_RE.sub('', w['text']), w) for w in words]
+        digit_words = [(digits, w) for digits, w in digit_words if digits]
+
         for idx, line in enumerate(lines):
             line_original = line.strip()
             if not line_original:
                 continue
 
             # Eliminar TODO excepto dígitos (mismo método que Google Vision adapter)
-            cleaned = re.sub(r'[^\d]', '', line_original)
+            cleaned = _NON_DIGIT_RE.sub('', line_original)
 
             # Si queda un número de 7-11 dígitos, es probablemente una cédula
             if 7 <= len(cleaned) <= 11:
-                # Buscar coordenada Y de esta cédula específica
-                # Buscar palabras que contengan los dígitos de esta cédula
-                cedula_words = []
-
-                for w in words:
-                    w_text_digits = re.sub(r'[^\d]', '', w['text'])
-                    # Si esta palabra contiene parte de la cédula
-                    if w_text_digits and w_text_digits in cleaned:
-                        cedula_words.append(w)
-
-                if cedula_words:
-                    # Usar la coordenada Y de la primera palabra que contiene la cédula
-                    cedula_word = cedula_words[0]
+                # Buscar coordenada Y de esta cédula específica: la primera
+                # palabra cuyos dígitos son parte de la cédula
+                cedula_word = next(
+                    (w for digits, w in digit_words if digits in cleaned),
+                    None
+                )
+
+                if cedula_word is not None:
                     cedula_y = cedula_word['y'] + cedula_word['height'] / 2
                     cedula_x = cedula_word['x']
 
@@ -312,92 +335,76 @@ class RowBasedExtraction:
                     })
 
                     if verbose:
-                        print(f"  Línea {idx+1}: '{line_original}' → Cédula: {cleaned} (y={cedula_y:.0f})")
+                        logger.debug(
+                            "cedula_detected",
+                            line=idx + 1, text=line_original, cedula=cleaned, y=cedula_y
+                        )
 
         if verbose:
-            print(f"  ✓ Detectadas {len(cedulas_detectadas)} cédulas")
-            for i, ced in enumerate(cedulas_detectadas, 1):
-                print(f"    Cédula {i}: {ced['cedula']} (y={ced['y']:.0f})")
+            logger.debug("cedulas_detected", count=len(cedulas_detectadas))
 
         # 3. Para cada cédula, encontrar el nombre en la misma fila
-        if verbose:
-            print(f"\n[3/4] Emparejando nombres con cédulas...")
-
         pares = []
 
-        for ced_data in cedulas_detectadas:
-            cedula = ced_data['cedula']
-            cedula_y = ced_data['y']
-            cedula_conf = ced_data['confidence']
+        # Coordenadas de las palabras en arrays (Struct-of-Arrays). El filtro
+        # de texto no depende de la cédula, se evalúa una sola vez por palabra.
+        word_xs = np.fromiter((w['x'] for w in words), dtype=np.float64, count=len(words))
+        word_y_centers = np.fromiter(
+            (w['y'] + w['height'] / 2 for w in words), dtype=np.float64, count=len(words)
+        )
+        word_is_nombre = np.fromiter(
+            (RowBasedExtraction._is_nombre_word(w['text']) for w in words), dtype=bool, count=len(words)
+        )
 
-            # Definir rango vertical de la fila (±25px alrededor de la cédula)
-            # Más estrecho para evitar capturar nombres de otras filas
-            row_y_min = cedula_y - 25
-            row_y_max = cedula_y + 25
+        # Rango vertical de cada fila (±25px alrededor de la cédula), más
+        # estrecho para evitar capturar nombres de otras filas
+        cedula_ys = np.fromiter(
+            (c['y'] for c in cedulas_detectadas), dtype=np.float64, count=len(cedulas_detectadas)
+        )
+        cedula_xs = np.fromiter(
+            (c.get('x', 0) for c in cedulas_detectadas), dtype=np.float64, count=len(cedulas_detectadas)
+        )
+        row_y_mins = cedula_ys - 25
+        row_y_maxs = cedula_ys + 25
+
+        # Matriz (cédulas x palabras) calculada en una sola operación: misma
+        # fila verticalmente, parece nombre y está a la IZQUIERDA de la
+        # cédula (al menos 50px)
+        in_rows = (
+            word_is_nombre
+            & (word_y_centers >= row_y_mins[:, None])
+            & (word_y_centers <= row_y_maxs[:, None])
+            & (word_xs < cedula_xs[:, None] - 50)
+        )
 
-            # Encontrar todas las palabras en esta fila que parezcan nombres
-            # IMPORTANTE: Los nombres están a la IZQUIERDA de las cédulas (x < cedula_x)
-            nombre_words = []
+        for k, ced_data in enumerate(cedulas_detectadas):
+            cedula = ced_data['cedula']
+            cedula_y = ced_data['y']
             cedula_x = ced_data.get('x', 0)
+            cedula_conf = ced_data['confidence']
+            row_y_min = row_y_mins[k]
+            row_y_max = row_y_maxs[k]
 
-            if verbose:
-                print(f"\n  Buscando nombre para cédula {cedula} (y={cedula_y:.0f}, x={cedula_x:.0f})")
-                print(f"    Rango Y: {row_y_min:.0f} - {row_y_max:.0f}")
-
-            for word in words:
-                word_y_center = word['y'] + word['height'] / 2
-                word_x = word['x']
-
-                # ¿Está en la misma fila verticalmente?
-                if row_y_min <= word_y_center <= row_y_max:
-                    text = word['text'].strip()
-
-                    # ¿Es un nombre? (principalmente letras, no números)
-                    if len(text) >= 2:  # Permitir palabras más cortas como "de"
-                        letter_count = sum(1 for c in text if c.isalpha() or c.isspace())
-                        if letter_count / len(text) >= 0.7:
-                            # Filtrar palabras del encabezado
-                            text_lower = text.lower()
-                            if not any(w in text_lower for w in ['cédula', 'cedula', 'nombre', 'firma', 'documento', 'firmas', 'of', 'can']):
-                                # IMPORTANTE: El nombre debe estar a la IZQUIERDA de la cédula
-                                if word_x < cedula_x - 50:  # Al menos 50px a la izquierda
-                                    nombre_words.append(word)
-                                    if verbose:
-                                        print(f"      ✓ '{text}' (x={word_x:.0f}, y={word_y_center:.0f})")
+            in_row = np.flatnonzero(in_rows[k])
+            nombre_words = [words[i] for i in in_row.tolist()]
 
             # Ordenar palabras de izquierda a derecha
             nombre_words.sort(key=lambda w: w['x'])
 
-            # Concatenar para formar nombre completo
-            nombre_parts = [w['text'] for w in nombre_words]
-            nombre = ' '.join(nombre_parts)
-
-            # Formatear nombre (Title Case)
-            nombre = ' '.join(nombre.split())  # Normalizar espacios
-            nombre = nombre.strip('.,;:()[]{}')
-
-            if nombre:
-                words_list = nombre.split()
-                formatted = []
-                lowercase_articles = {'de', 'del', 'de la', 'y', 'e', 'la', 'las', 'los'}
-
-                for j, word in enumerate(words_list):
-                    if j == 0:
-                        formatted.append(word.capitalize())
-                    elif word.lower() in lowercase_articles:
-                        formatted.append(word.lower())
-                    else:
-                        formatted.append(word.capitalize())
-
-                nombre = ' '.join(formatted)
+            # Concatenar para formar nombre completo (Title Case)
+            nombre = RowBasedExtraction._format_nombre(' '.join(w['text'] for w in nombre_words))
 
             # Calcular confianza promedio del nombre
             nombre_conf = sum(w['confidence'] for w in nombre_words) / len(nombre_words) if nombre_words else 0.0
 
             if verbose:
-                print(f"  Cédula {cedula} (y={cedula_y:.0f})")
-                print(f"    → Nombre: '{nombre}' (conf: {nombre_conf:.2%})")
-                print(f"    → Cédula conf: {cedula_conf:.2%}")
+                logger.debug(
+                    "row_name_matched",
+                    cedula=cedula, y=cedula_y, x=cedula_x,
+                    row_y_min=row_y_min, row_y_max=row_y_max,
+                    nombre=nombre, words=len(nombre_words),
+                    confidence_nombre=nombre_conf, confidence_cedula=cedula_conf
+                )
 
             # Agregar par si hay nombre
             if nombre and len(nombre) >= 4:
@@ -407,20 +414,16 @@ class RowBasedExtraction:
                     'confidence_nombre': nombre_conf,
                     'confidence_cedula': cedula_conf
                 })
-
-                if verbose:
-                    print(f"    ✓ Par válido agregado")
-            else:
-                if verbose:
-                    if not nombre:
-                        print(f"    ⚠ No se detectó nombre")
-                    elif len(nombre) < 4:
-                        print(f"    ⚠ Nombre muy corto: '{nombre}'")
+            elif verbose:
+                logger.debug(
+                    "row_pair_rejected",
+                    cedula=cedula,
+                    reason="nombre_vacio" if not nombre else "nombre_corto",
+                    nombre=nombre
+                )
 
         # 4. Resumen
         if verbose:
-            print(f"\n[4/4] Extracción completada")
-            print(f"  ✓ {len(pares)} pares válidos extraídos")
-            print("=" * 80)
+            logger.debug("row_extraction_completed", pairs=len(pares))
 
         return pares
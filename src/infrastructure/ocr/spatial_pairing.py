@@ -6,10 +6,31 @@ basadas en proximidad espacial en lugar de índices.
 """
 
 import re
-import math
+from collections import deque
 from typing import List, Dict, Optional, Tuple
 from difflib import SequenceMatcher
 
+import numpy as np
+
+# Patrones compilados una sola vez
+_NUMERO_RE = re.compile(r'\d{7,10}')
+_NON_DIGIT_RE = re.compile(r'\D')
+
+# Caracteres que no son letras ni espacios (puntuación, dígitos, "_")
+_NON_LETTER_RE = re.compile(r'[^\w\s]|[\d_]')
+
+# Palabras del formulario/encabezado que NO son nombres (se buscan como
+# subcadena, todas en una sola pasada del patrón)
+_NOMBRE_BLACKLIST = ('cédula', 'cedula', 'of', 'can', 'firma', 'nombre',
+                     'documento', 'hicx6', 'hicx', 'firmas')
+_NOMBRE_BLACKLIST_RE = re.compile('|'.join(map(re.escape, _NOMBRE_BLACKLIST)))
+
+# Artículos y conectores que van en minúscula dentro de un nombre
+_LOWERCASE_ARTICLES = frozenset({'de', 'del', 'y', 'e', 'la', 'las', 'los'})
+
+# Símbolos que el OCR agrega al inicio/final de las palabras
+_STRIP_CHARS = '.,;:()[]{}'
+
 
 class SpatialPairing:
     """
@@ -40,36 +61,37 @@ class SpatialPairing:
             return []
 
         # 2. Clustering espacial - agrupar palabras cercanas
+        # Matriz de vecindad calculada en una sola operación: dos palabras
+        # son vecinas si están en la misma fila (< 60px vertical) Y cerca
+        # horizontalmente (< 350px). El BFS solo lee filas de la matriz.
+        xs = np.fromiter((b['x'] for b in palabra_blocks), dtype=np.float64, count=len(palabra_blocks))
+        ys = np.fromiter((b['y'] for b in palabra_blocks), dtype=np.float64, count=len(palabra_blocks))
+        neighbours = (
+            (np.abs(ys[:, None] - ys[None, :]) < 60)
+            & (np.abs(xs[:, None] - xs[None, :]) < 350)
+        )
+        unused = np.ones(len(palabra_blocks), dtype=bool)
         clusters = []
-        used = set()
 
-        for i, block in enumerate(palabra_blocks):
-            if i in used:
+        for i in range(len(palabra_blocks)):
+            if not unused[i]:
                 continue
 
             # Iniciar nuevo cluster con este bloque
-            cluster = [block]
-            used.add(i)
+            cluster = [palabra_blocks[i]]
+            unused[i] = False
 
             # Buscar palabras cercanas recursivamente
-            queue = [block]
+            queue = deque([i])
             while queue:
-                current = queue.pop(0)
-
-                for j, other in enumerate(palabra_blocks):
-                    if j in used:
-                        continue
-
-                    # Calcular distancia entre current y other
-                    v_dist = abs(other['y'] - current['y'])
-                    h_dist = abs(other['x'] - current['x'])
+                current = queue.popleft()
 
-                    # ¿Están cerca? (mismo cluster/nombre)
-                    # Criterio: misma fila (< 60px vertical) Y cerca horizontal (< 350px)
-                    if v_dist < 60 and h_dist < 350:
-                        cluster.append(other)
-                        used.add(j)
-                        queue.append(other)  # Buscar vecinos de este también
+                # Vecinos aún sin cluster (mismo nombre)
+                near = np.flatnonzero(unused & neighbours[current])
+                unused[near] = False
+                for j in near.tolist():
+                    cluster.append(palabra_blocks[j])
+                    queue.append(j)  # Buscar vecinos de este también
 
             clusters.append(cluster)
 
@@ -108,18 +130,17 @@ class SpatialPairing:
 
             # Buscar todos los grupos de 7-10 dígitos consecutivos
             # Esto separa múltiples cédulas que Google Vision agrupa en un solo bloque
-            numero_pattern = r'\d{7,10}'
-            matches = re.finditer(numero_pattern, text)
+            matches = list(_NUMERO_RE.finditer(text))
+
+            # Altura de cada cédula: el bloque repartido entre todas
+            cedula_height = block['height'] / max(1, len(matches))
 
-            found_any = False
             for match in matches:
                 cedula_text = match.group()
-                found_any = True
 
                 # Calcular posición aproximada dentro del bloque
                 # Si hay múltiples cédulas en un bloque vertical, distribuirlas
                 match_start = match.start()
-                text_before = text[:match_start]
 
                 # Estimar offset vertical basado en posición en el texto
                 # Asumiendo distribución vertical uniforme
@@ -131,13 +152,13 @@ class SpatialPairing:
                     'x': block['x'],
                     'y': block['y'] + estimated_y_offset,
                     'width': block['width'],
-                    'height': block['height'] / max(1, len(list(re.finditer(numero_pattern, text)))),
+                    'height': cedula_height,
                     'confidence': block['confidence']
                 })
 
             # Si no encontró ninguna cédula con el patrón, intentar limpiar todo el texto
-            if not found_any:
-                cleaned = re.sub(r'[^\d]', '', text)
+            if not matches:
+                cleaned = _NON_DIGIT_RE.sub('', text)
                 if 7 <= len(cleaned) <= 10:
                     cedulas.append({
                         'text': cleaned,
@@ -161,30 +182,24 @@ class SpatialPairing:
         - Puede tener espacios, acentos, ñ
         - NO contiene palabras del encabezado del formulario
         """
+        # Rechazos de menor a mayor costo: el resultado no depende del orden
         if not text or len(text) < 2:
             return False
 
-        text_lower = text.lower()
-
-        # Filtrar palabras del formulario/encabezado que NO son nombres
-        blacklist = ['cédula', 'cedula', 'of', 'can', 'firma', 'nombre',
-                     'documento', 'hicx6', 'hicx', 'firmas']
-        if any(word in text_lower for word in blacklist):
+        # No debe ser solo números (la mayoría de bloques de cédula)
+        if text.replace(" ", "").isdigit():
             return False
 
-        # Contar letras
-        letter_count = sum(1 for c in text if c.isalpha() or c.isspace())
-        letter_ratio = letter_count / len(text) if text else 0
+        # Contar letras (y espacios): todo lo que no es puntuación ni dígito
+        letter_count = len(text) - len(_NON_LETTER_RE.findall(text))
 
         # Debe ser principalmente letras
-        if letter_ratio < 0.7:
+        if letter_count / len(text) < 0.7:
             return False
 
-        # No debe ser solo números
-        if text.replace(" ", "").isdigit():
-            return False
-
-        return True
+        # Filtrar palabras del formulario/encabezado que NO son nombres
+        # (el texto en minúsculas solo se construye si llega hasta aquí)
+        return not _NOMBRE_BLACKLIST_RE.search(text.lower())
 
     @staticmethod
     def _merge_nombre_blocks(blocks: List[Dict]) -> Optional[Dict]:
@@ -205,33 +220,35 @@ class SpatialPairing:
         if not blocks:
             return None
 
-        # Concatenar textos
-        full_text = ' '.join(b['text'] for b in blocks)
-        full_text = ' '.join(full_text.split())  # Normalizar espacios
+        # Palabras, bounding box combinado y suma de confianzas en una sola pasada
+        words = []
+        min_x = min_y = float('inf')
+        max_x = max_y = float('-inf')
+        confidence_sum = 0.0
+
+        for b in blocks:
+            x = b['x']
+            y = b['y']
+            words.extend(b['text'].split())  # Espacios normalizados al separar
+            min_x = min(min_x, x)
+            min_y = min(min_y, y)
+            max_x = max(max_x, x + b['width'])
+            max_y = max(max_y, y + b['height'])
+            confidence_sum += b['confidence']
+
+        full_text = ' '.join(words)
 
         # Validar que es un nombre completo válido
         if not SpatialPairing._is_valid_nombre(full_text):
             return None
 
-        # Formatear (Title Case)
-        formatted_text = SpatialPairing._format_nombre(full_text)
-
-        # Calcular bounding box combinado
-        min_x = min(b['x'] for b in blocks)
-        min_y = min(b['y'] for b in blocks)
-        max_x = max(b['x'] + b['width'] for b in blocks)
-        max_y = max(b['y'] + b['height'] for b in blocks)
-
-        # Confianza promedio
-        avg_confidence = sum(b['confidence'] for b in blocks) / len(blocks)
-
         return {
-            'text': formatted_text,
+            'text': SpatialPairing._format_nombre(full_text),  # Title Case
             'x': min_x,
             'y': min_y,
             'width': max_x - min_x,
             'height': max_y - min_y,
-            'confidence': avg_confidence
+            'confidence': confidence_sum / len(blocks)
         }
 
     @staticmethod
@@ -286,21 +303,17 @@ class SpatialPairing:
         words = [w for w in text.split() if len(w) >= 2]
         formatted = []
 
-        lowercase_articles = {'de', 'del', 'de la', 'y', 'e', 'la', 'las', 'los'}
-
         for i, word in enumerate(words):
             # Limpiar caracteres no alfabéticos al inicio/final (excepto acentos)
-            word_clean = word.strip('.,;:()[]{}')
+            word_clean = word.strip(_STRIP_CHARS)
 
             if not word_clean:
                 continue
 
-            # Primera palabra siempre mayúscula
-            if i == 0:
-                formatted.append(word_clean.capitalize())
-            # Artículos en minúscula (excepto al inicio)
-            elif word_clean.lower() in lowercase_articles:
-                formatted.append(word_clean.lower())
+            # Artículos en minúscula (excepto al inicio, siempre mayúscula)
+            word_lower = word_clean.lower()
+            if i > 0 and word_lower in _LOWERCASE_ARTICLES:
+                formatted.append(word_lower)
             # Resto con mayúscula inicial
             else:
                 formatted.append(word_clean.capitalize())
@@ -333,49 +346,44 @@ class SpatialPairing:
             Lista de pares nombre-cédula
         """
         pares = []
-        used_nombres = set()
 
         # Ordenar cédulas por posición vertical (top → bottom)
         cedulas_sorted = sorted(cedulas, key=lambda c: c['y'])
 
-        for cedula in cedulas_sorted:
-            # Centro de la cédula
-            cedula_cx = cedula['x'] + cedula['width'] / 2
-            cedula_cy = cedula['y'] + cedula['height'] / 2
-
+        # Centros de nombres y cédulas en arrays (calculados una sola vez)
+        nombres_cx = np.array([n['x'] + n['width'] / 2 for n in nombres], dtype=np.float64)
+        nombres_cy = np.array([n['y'] + n['height'] / 2 for n in nombres], dtype=np.float64)
+        nombres_text = np.array([n['text'] for n in nombres], dtype=object)
+        cedulas_cx = np.array([c['x'] + c['width'] / 2 for c in cedulas_sorted], dtype=np.float64)
+        cedulas_cy = np.array([c['y'] + c['height'] / 2 for c in cedulas_sorted], dtype=np.float64)
+        available = np.ones(len(nombres), dtype=bool)
+
+        # Matriz de distancias (cédulas x nombres) en una sola operación
+        # IMPORTANTE: Dar más peso a la distancia vertical (factor 2x)
+        # porque en formularios, nombre y cédula están en el mismo renglón
+        dx = cedulas_cx[:, None] - nombres_cx[None, :]
+        dy = (cedulas_cy[:, None] - nombres_cy[None, :]) * 2  # Peso 2x en Y
+        distances = np.sqrt(dx * dx + dy * dy)
+
+        # Penalizar si el nombre está MUY ABAJO de la cédula
+        # (normalmente el nombre va antes/arriba de la cédula)
+        distances[nombres_cy[None, :] > cedulas_cy[:, None] + 50] *= 2
+
+        # Penalizar si están MUY LEJOS horizontalmente
+        # (mismo renglón implica distancia horizontal razonable)
+        distances[np.abs(dx) > 500] *= 1.5
+
+        for k, cedula in enumerate(cedulas_sorted):
             best_nombre = None
             best_distance = float('inf')
 
-            for nombre in nombres:
-                # Skip si ya fue usado
-                if nombre['text'] in used_nombres:
-                    continue
-
-                # Centro del nombre
-                nombre_cx = nombre['x'] + nombre['width'] / 2
-                nombre_cy = nombre['y'] + nombre['height'] / 2
-
-                # Calcular distancia
-                # IMPORTANTE: Dar más peso a la distancia vertical (factor 2x)
-                # porque en formularios, nombre y cédula están en el mismo renglón
-                dx = cedula_cx - nombre_cx
-                dy = (cedula_cy - nombre_cy) * 2  # Peso 2x en Y
-
-                distance = math.sqrt(dx**2 + dy**2)
+            if available.any():
+                # Skip nombres ya usados
+                row = np.where(available, distances[k], np.inf)
 
-                # Penalizar si el nombre está MUY ABAJO de la cédula
-                # (normalmente el nombre va antes/arriba de la cédula)
-                if nombre_cy > cedula_cy + 50:  # Nombre 50px+ abajo
-                    distance *= 2  # Penalizar 2x
-
-                # Penalizar si están MUY LEJOS horizontalmente
-                # (mismo renglón implica distancia horizontal razonable)
-                if abs(dx) > 500:  # Más de 500px de separación horizontal
-                    distance *= 1.5  # Penalizar 1.5x
-
-                if distance < best_distance:
-                    best_distance = distance
-                    best_nombre = nombre
+                best_idx = int(np.argmin(row))
+                best_distance = float(row[best_idx])
+                best_nombre = nombres[best_idx]
 
             # Empareja si encontró nombre cercano
             if best_nombre and best_distance < max_distance:
@@ -395,7 +403,8 @@ class SpatialPairing:
                     }
                 })
 
-                used_nombres.add(best_nombre['text'])
+                # Marcar como usado (por texto, incluidos duplicados)
+                available &= nombres_text != best_nombre['text']
 
                 if verbose:
                     print(f"✓ Emparejado: '{best_nombre['text']}' ↔ '{cedula['text']}' "
@@ -429,34 +438,40 @@ class SpatialPairing:
         matched = []
         used_azure = set()
 
+        # SequenceMatcher cachea el análisis de la segunda secuencia: se crea
+        # un matcher por par de Azure y solo se cambia la de Google
+        azure_matchers = [
+            (SequenceMatcher(None, '', a_pair['cedula']),
+             SequenceMatcher(None, '', a_pair['nombre'].lower()))
+            for a_pair in azure_pairs
+        ]
+
         for g_pair in google_pairs:
             best_match = None
             best_similarity = 0.0
             best_idx = None
+            g_cedula = g_pair['cedula']
+            g_nombre = g_pair['nombre'].lower()
 
-            for a_idx, a_pair in enumerate(azure_pairs):
+            for a_idx, (cedula_matcher, nombre_matcher) in enumerate(azure_matchers):
                 if a_idx in used_azure:
                     continue
 
-                # Similitud de cédulas (peso 80%)
-                cedula_sim = SequenceMatcher(
-                    None,
-                    g_pair['cedula'],
-                    a_pair['cedula']
-                ).ratio()
+                cedula_matcher.set_seq1(g_cedula)
+                nombre_matcher.set_seq1(g_nombre)
 
-                # Similitud de nombres (peso 20%)
-                nombre_sim = SequenceMatcher(
-                    None,
-                    g_pair['nombre'].lower(),
-                    a_pair['nombre'].lower()
-                ).ratio()
+                # Cota superior barata (solo longitudes): si ni en el mejor
+                # caso supera al mejor candidato, no se calcula ratio()
+                upper_bound = (cedula_matcher.real_quick_ratio() * 0.8) + (nombre_matcher.real_quick_ratio() * 0.2)
+                if upper_bound <= best_similarity:
+                    continue
 
-                similarity = (cedula_sim * 0.8) + (nombre_sim * 0.2)
+                # Similitud de cédulas (peso 80%) y de nombres (peso 20%)
+                similarity = (cedula_matcher.ratio() * 0.8) + (nombre_matcher.ratio() * 0.2)
 
                 if similarity > best_similarity:
                     best_similarity = similarity
-                    best_match = a_pair
+                    best_match = azure_pairs[a_idx]
                     best_idx = a_idx
 
             if best_match and best_similarity >= min_similarity:
@@ -1,13 +1,26 @@
 """Implementación de OCR usando Tesseract."""
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+
 import cv2
 import numpy as np
 import pytesseract
 from PIL import Image
-from typing import List
+from typing import Dict, List, Tuple
 
 from ...domain.entities import CedulaRecord
 from ...domain.ports import OCRPort, ConfigPort
+from ...shared.logging import LoggerFactory, log_debug_message, log_error_message
+
+# Kernel 2x2 para cierre/apertura del binarizado (creado una sola vez)
+_MORPH_KERNEL = np.ones((2, 2), np.uint8)
+
+# Interpolaciones admitidas para el redimensionado previo al OCR
+_INTERPOLATIONS = {
+    'linear': cv2.INTER_LINEAR,
+    'cubic': cv2.INTER_CUBIC,
+}
 
 
 class TesseractOCR(OCRPort):
@@ -26,12 +39,37 @@ class TesseractOCR(OCRPort):
             config: Servicio de configuración
         """
         self.config = config
+        self.logger = LoggerFactory.get_ocr_logger("tesseract")
 
         # Configurar ruta de Tesseract si es necesario (Windows)
         tesseract_path = self.config.get('ocr.tesseract_path')
         if tesseract_path:
             pytesseract.pytesseract.tesseract_cmd = tesseract_path
 
+        # Bilineal por defecto: la imagen se binariza justo después, así que
+        # la interpolación bicúbica (4x más multiplicaciones) no aporta nitidez
+        interpolation = str(self.config.get('ocr.tesseract.upscale_interpolation', 'linear')).lower()
+        self.upscale_interpolation = _INTERPOLATIONS.get(interpolation, cv2.INTER_LINEAR)
+
+        # Modos de segmentación a probar (cada uno es un proceso de Tesseract)
+        # PSM 4 = columna de texto
+        # PSM 6 = bloque uniforme de texto
+        # PSM 11 = texto disperso
+        # PSM 13 = línea de texto sin restricciones
+        psm_modes = self.config.get('ocr.tesseract.psm_modes', (4, 6, 11, 13))
+        if isinstance(psm_modes, (int, str)):
+            psm_modes = (psm_modes,)
+        self.psm_modes = tuple(int(psm) for psm in psm_modes) or (6,)
+
+        # Procesos de Tesseract simultáneos. Cada uno ya usa varios hilos
+        # (OpenMP): por defecto no se lanzan más que CPUs disponibles
+        max_workers = self.config.get('ocr.tesseract.max_workers', 0) or os.cpu_count() or 1
+        self.max_workers = max(1, min(len(self.psm_modes), int(max_workers)))
+
+        # Preprocesamiento con la API transparente de OpenCL (cv2.UMat). Sin
+        # dispositivo OpenCL, OpenCV ejecuta las mismas funciones en CPU
+        self.use_opencl = bool(self.config.get('ocr.tesseract.use_opencl', False)) and cv2.ocl.haveOpenCL()
+
     def preprocess_image(self, image: Image.Image) -> Image.Image:
         """
         Preprocesa una imagen para mejorar el OCR, optimizado para escritura manual.
@@ -52,7 +90,7 @@ class TesseractOCR(OCRPort):
         # Convertir PIL a formato OpenCV
         img_array = np.array(image)
 
-        print(f"DEBUG Preprocess: Imagen original: {img_array.shape}")
+        log_debug_message(self.logger, "Imagen original", shape=img_array.shape)
 
         # Convertir a escala de grises
         if len(img_array.shape) == 3:
@@ -64,9 +102,12 @@ class TesseractOCR(OCRPort):
         scale_factor = 4.0  # Escritura manual necesita más resolución
         width = int(gray.shape[1] * scale_factor)
         height = int(gray.shape[0] * scale_factor)
-        resized = cv2.resize(gray, (width, height), interpolation=cv2.INTER_CUBIC)
+        # Con OpenCL, toda la cadena trabaja sobre UMat en memoria del
+        # dispositivo y solo se descarga el resultado final
+        source = cv2.UMat(gray) if self.use_opencl else gray
+        resized = cv2.resize(source, (width, height), interpolation=self.upscale_interpolation)
 
-        print(f"DEBUG Preprocess: Imagen redimensionada: {resized.shape}")
+        log_debug_message(self.logger, "Imagen redimensionada", height=height, width=width)
 
         # Mejorar contraste primero
         clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8, 8))
@@ -85,18 +126,21 @@ class TesseractOCR(OCRPort):
             10   # Constante C más grande
         )
 
-        # Invertir si el fondo es oscuro
-        if np.mean(binary) < 127:
-            binary = cv2.bitwise_not(binary)
+        # Invertir si el fondo es oscuro. La imagen solo tiene 0 y 255:
+        # media < 127 equivale a 255 * blancos < 127 * total, contado en
+        # enteros sin recorrer la imagen en punto flotante
+        if 255 * cv2.countNonZero(binary) < 127 * width * height:
+            cv2.bitwise_not(binary, dst=binary)
 
-        # Operaciones morfológicas para limpiar ruido
-        kernel = np.ones((2, 2), np.uint8)
-        binary = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel)
-        binary = cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel)
+        # Operaciones morfológicas para limpiar ruido (sobre el mismo buffer)
+        cv2.morphologyEx(binary, cv2.MORPH_CLOSE, _MORPH_KERNEL, dst=binary)
+        cv2.morphologyEx(binary, cv2.MORPH_OPEN, _MORPH_KERNEL, dst=binary)
 
-        print(f"DEBUG Preprocess: Preprocesamiento completado")
+        log_debug_message(self.logger, "Preprocesamiento completado")
 
         # Convertir de vuelta a PIL
+        if self.use_opencl:
+            binary = binary.get()
         processed_image = Image.fromarray(binary)
 
         return processed_image
@@ -117,64 +161,21 @@ class TesseractOCR(OCRPort):
 
         records = []
 
-        # Intentar con múltiples configuraciones de PSM para mejor detección
-        # PSM 6 = bloque uniforme de texto
-        # PSM 4 = columna de texto
-        # PSM 11 = texto disperso
-        # PSM 13 = línea de texto sin restricciones
-        psm_modes = [4, 6, 11, 13]
-
-        for psm in psm_modes:
-            # Configurar Tesseract - solo números, sin diccionario
-            # Para escritura manual es mejor ser más permisivo
-            custom_config = (
-                f'--oem 3 --psm {psm} '
-                f'-c tessedit_char_whitelist=0123456789 '
-                f'-c classify_bln_numeric_mode=1 '
-                f'-c tessedit_pageseg_mode={psm}'
-            )
-
-            try:
-                # Ejecutar OCR con datos detallados
-                ocr_data = pytesseract.image_to_data(
-                    image,
-                    lang=language,
-                    config=custom_config,
-                    output_type=pytesseract.Output.DICT
-                )
-
-                # Procesar cada elemento detectado
-                for i, text in enumerate(ocr_data['text']):
-                    # Limpiar texto - eliminar espacios y caracteres extraños
-                    text = text.strip().replace(' ', '').replace('.', '').replace(',', '')
-
-                    # Verificar si es un número
-                    if text and text.isdigit():
-                        confidence = float(ocr_data['conf'][i])
-
-                        # Para escritura manual, aceptar confianza más baja
-                        if confidence >= 0:  # Aceptar todos para debug
-                            # Validar longitud razonable (3 a 11 dígitos para cédulas)
-                            if 3 <= len(text) <= 11:
-                                # Usar factory method para crear con Value Objects
-                                record = CedulaRecord.from_primitives(
-                                    cedula=text,
-                                    confidence=max(confidence, 30.0)  # Mínimo 30% de confianza
-                                )
-                                records.append(record)
-
-                                print(f"DEBUG OCR PSM{psm}: Encontrado '{text}' (len={len(text)}) con confianza {confidence:.1f}%")
-
-            except Exception as e:
-                print(f"DEBUG OCR: Error en PSM {psm}: {e}")
-                continue
+        # Cada modo PSM es un proceso de Tesseract independiente: se lanzan
+        # a la vez y los resultados se combinan en el orden configurado
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for psm_records in executor.map(
+                lambda psm: self._extract_with_psm(image, language, psm),
+                self.psm_modes
+            ):
+                records.extend(psm_records)
 
         # Si no se encontró nada, intentar extracción de texto completo
         if not records:
-            print("DEBUG OCR: Intentando extracción de texto completo...")
+            log_debug_message(self.logger, "Intentando extraccion de texto completo")
             try:
                 full_text = pytesseract.image_to_string(image, lang=language)
-                print(f"DEBUG OCR: Texto completo extraído:\n{full_text}")
+                log_debug_message(self.logger, "Texto completo extraido", text=full_text)
 
                 # Buscar números en el texto
                 numbers = re.findall(r'\d+', full_text)
@@ -186,18 +187,80 @@ class TesseractOCR(OCRPort):
                             confidence=60.0  # Confianza media
                         )
                         records.append(record)
-                        print(f"DEBUG OCR: Número extraído del texto: {num}")
+                        log_debug_message(self.logger, "Numero extraido del texto", cedula=num)
 
             except Exception as e:
-                print(f"DEBUG OCR: Error en extracción de texto completo: {e}")
+                log_error_message(self.logger, "Error en extraccion de texto completo", error=e)
 
         # Eliminar duplicados manteniendo el de mayor confianza
         unique_records = self._remove_duplicates(records)
 
-        print(f"DEBUG OCR: Total registros únicos: {len(unique_records)}")
+        log_debug_message(self.logger, "Total registros unicos", count=len(unique_records))
 
         return unique_records
 
+    def _extract_with_psm(self, image: Image.Image, language: str, psm: int) -> List[CedulaRecord]:
+        """
+        Ejecuta Tesseract con un modo de segmentación de página (PSM).
+
+        Args:
+            image: Imagen PIL a procesar
+            language: Idioma de Tesseract
+            psm: Modo de segmentación
+
+        Returns:
+            Registros encontrados con ese modo (vacío si Tesseract falla)
+        """
+        records = []
+
+        # Configurar Tesseract - solo números, sin diccionario
+        # Para escritura manual es mejor ser más permisivo
+        custom_config = (
+            f'--oem 3 --psm {psm} '
+            f'-c tessedit_char_whitelist=0123456789 '
+            f'-c classify_bln_numeric_mode=1 '
+            f'-c tessedit_pageseg_mode={psm}'
+        )
+
+        try:
+            # Ejecutar OCR con datos detallados
+            ocr_data = pytesseract.image_to_data(
+                image,
+                lang=language,
+                config=custom_config,
+                output_type=pytesseract.Output.DICT
+            )
+
+            # Procesar cada elemento detectado
+            for i, text in enumerate(ocr_data['text']):
+                # Limpiar texto - eliminar espacios y caracteres extraños
+                text = text.strip().replace(' ', '').replace('.', '').replace(',', '')
+
+                # Verificar si es un número
+                if text and text.isdigit():
+                    confidence = float(ocr_data['conf'][i])
+
+                    # Para escritura manual, aceptar confianza más baja
+                    if confidence >= 0:  # Aceptar todos para debug
+                        # Validar longitud razonable (3 a 11 dígitos para cédulas)
+                        if 3 <= len(text) <= 11:
+                            # Usar factory method para crear con Value Objects
+                            record = CedulaRecord.from_primitives(
+                                cedula=text,
+                                confidence=max(confidence, 30.0)  # Mínimo 30% de confianza
+                            )
+                            records.append(record)
+
+                            log_debug_message(
+                                self.logger, "Cedula encontrada",
+                                psm=psm, cedula=text, confidence=confidence
+                            )
+
+        except Exception as e:
+            log_error_message(self.logger, f"Error en PSM {psm}", error=e)
+
+        return records
+
     def _remove_duplicates(self, records: List[CedulaRecord]) -> List[CedulaRecord]:
         """
         Elimina registros duplicados, manteniendo el de mayor confianza.
@@ -208,13 +271,16 @@ class TesseractOCR(OCRPort):
         Returns:
             Lista sin duplicados
         """
-        seen = {}
+        # cedula -> (porcentaje de confianza, registro); el porcentaje se
+        # calcula una vez por registro en lugar de en cada comparación
+        seen: Dict[str, Tuple[float, CedulaRecord]] = {}
 
         for record in records:
             # Usar .value ya que cedula es ahora CedulaNumber (Value Object)
             cedula_key = record.cedula.value
-            # Comparar confidence usando .as_percentage() ya que es ConfidenceScore
-            if cedula_key not in seen or record.confidence.as_percentage() > seen[cedula_key].confidence.as_percentage():
-                seen[cedula_key] = record
+            percentage = record.confidence.as_percentage()
+            current = seen.get(cedula_key)
+            if current is None or percentage > current[0]:
+                seen[cedula_key] = (percentage, record)
 
-        return list(seen.values())
+        return [record for _, record in seen.values()]
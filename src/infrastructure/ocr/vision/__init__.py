@@ -3,6 +3,7 @@ from .text_cleaner import TextCleaner
 from .google_symbol_extractor import GoogleSymbolExtractor, Symbol
 from .azure_word_extractor import AzureWordExtractor, Word
 from .confidence_mapper import ConfidenceMapper
+from .response_cache import ResponseCache
 
 __all__ = [
     # Limpieza de texto
@@ -16,4 +17,7 @@ __all__ = [
 
     # Mapeador
     'ConfidenceMapper',
+
+    # Cache
+    'ResponseCache',
 ]
@@ -36,27 +36,28 @@ class ConfidenceMapper:
         # Limpiar texto buscado (solo digitos)
         text_clean = TextCleaner.clean_for_digits(target_text)
 
-        # Obtener texto completo de simbolos (solo digitos)
-        all_text = GoogleSymbolExtractor.get_full_text(symbols)
-        all_text_clean = TextCleaner.clean_for_digits(all_text)
+        # Una sola pasada: simbolos numericos, cuyo texto concatenado es el
+        # texto limpio y cuyas confianzas quedan alineadas por indice
+        digit_symbols = [s for s in symbols if s.text.isdigit()]
+        all_text_clean = ''.join(s.text for s in digit_symbols)
 
-        # Buscar texto en simbolos
-        if text_clean in all_text_clean:
-            # Encontrado - extraer confianzas correspondientes
-            start_idx = all_text_clean.index(text_clean)
-            confidences, positions = ConfidenceMapper._extract_confidences_from_symbols(
-                symbols, start_idx, len(text_clean)
-            )
+        # Buscar texto en simbolos (busqueda de subcadena en C)
+        start_idx = all_text_clean.find(text_clean)
+
+        if start_idx != -1:
+            # Encontrado - las confianzas son el tramo correspondiente
+            confidences = [
+                s.confidence for s in digit_symbols[start_idx:start_idx + len(text_clean)]
+            ]
 
             return {
                 'confidences': confidences,
-                'positions': positions,
+                'positions': list(range(len(confidences))),
                 'average': sum(confidences) / len(confidences) if confidences else 0.0,
                 'found': True
             }
         else:
             # No encontrado - usar promedio de todos los simbolos numericos
-            digit_symbols = [s for s in symbols if s.text.isdigit()]
             avg_conf = GoogleSymbolExtractor.get_average_confidence(digit_symbols)
 
             return {
@@ -122,36 +123,6 @@ class ConfidenceMapper:
                 'found': False
             }
 
-    @staticmethod
-    def _extract_confidences_from_symbols(
-        symbols: List[Symbol],
-        start_idx: int,
-        length: int
-    ) -> tuple:
-        """
-        Extrae confianzas de simbolos en un rango especifico.
-
-        Args:
-            symbols: Lista de simbolos
-            start_idx: Indice inicial (en digitos)
-            length: Longitud a extraer
-
-        Returns:
-            Tupla (confidences, positions)
-        """
-        confidences = []
-        positions = []
-
-        digit_counter = 0
-        for symbol in symbols:
-            if symbol.text.isdigit():
-                if digit_counter >= start_idx and digit_counter < start_idx + length:
-                    confidences.append(symbol.confidence)
-                    positions.append(digit_counter - start_idx)
-                digit_counter += 1
-
-        return confidences, positions
-
     @staticmethod
     def _extract_confidences_from_words(
         words: List[Word],
@@ -45,26 +45,21 @@ class GoogleSymbolExtractor:
 
         all_symbols = []
 
-        # Navegar estructura jerarquica
+        # Navegar estructura jerarquica. Los campos protobuf siempre existen
+        # (valen 0.0 si la API no los envia), por lo que no hace falta hasattr.
         for page in response.full_text_annotation.pages:
             for block in page.blocks:
                 for paragraph in block.paragraphs:
                     for word in paragraph.words:
-                        # Obtener confianza de la palabra (fallback)
-                        word_confidence = word.confidence if hasattr(word, 'confidence') else 0.95
+                        # Confianza de la palabra como fallback del simbolo
+                        word_confidence = word.confidence
 
                         # Extraer cada simbolo
                         for symbol in word.symbols:
-                            symbol_conf = (
-                                symbol.confidence
-                                if hasattr(symbol, 'confidence')
-                                else word_confidence
-                            )
-
                             all_symbols.append(
                                 Symbol(
                                     text=symbol.text,
-                                    confidence=symbol_conf
+                                    confidence=symbol.confidence or word_confidence
                                 )
                             )
 
@@ -95,7 +90,7 @@ class GoogleSymbolExtractor:
         Returns:
             Texto completo
         """
-        return ''.join([s.text for s in symbols])
+        return ''.join(s.text for s in symbols)
 
     @staticmethod
     def get_average_confidence(symbols: List[Symbol]) -> float:
@@ -0,0 +1,140 @@
+"""Cache persistente en disco de respuestas de Vision APIs."""
+import hashlib
+import os
+from pathlib import Path
+from typing import Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+class ResponseCache:
+    """
+    Cache en disco de respuestas serializadas, indexado por hash de la imagen.
+
+    Responsabilidad unica: Guardar y recuperar bytes por clave SHA-256
+    del contenido enviado a la API, con expulsion LRU (por fecha de
+    acceso) al superar el tamaño maximo.
+
+    La serializacion de la respuesta queda a cargo del adapter, de modo
+    que el cache no depende de ningun SDK.
+
+    Attributes:
+        cache_dir: Directorio donde se guardan las entradas
+        max_bytes: Tamaño maximo total del cache en bytes
+    """
+
+    # Extension de las entradas (protobuf serializado)
+    ENTRY_SUFFIX = '.pb'
+
+    def __init__(self, cache_dir: str, max_bytes: int = 500 * 1024 * 1024):
+        """
+        Inicializa el cache creando el directorio si no existe.
+
+        Args:
+            cache_dir: Directorio del cache (admite ~)
+            max_bytes: Tamaño maximo total en bytes (default: 500 MB)
+        """
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key_for(content: bytes) -> str:
+        """
+        Calcula la clave de cache para un contenido.
+
+        Args:
+            content: Bytes de la imagen enviada a la API
+
+        Returns:
+            Hash SHA-256 en hexadecimal
+        """
+        return hashlib.sha256(content).hexdigest()
+
+    def _path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{self.ENTRY_SUFFIX}"
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Recupera una entrada y actualiza su fecha de acceso.
+
+        Args:
+            key: Clave obtenida con key_for()
+
+        Returns:
+            Bytes almacenados, o None si no existe o no se puede leer
+        """
+        path = self._path_for(key)
+
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning("cache_read_failed", key=key, error_message=str(e))
+            return None
+
+        try:
+            # Marcar como usada recientemente para la expulsion LRU
+            os.utime(path)
+        except OSError:
+            pass
+
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """
+        Guarda una entrada y aplica la expulsion LRU si se excede el tamaño.
+
+        Los errores de escritura se registran pero no se propagan: el cache
+        nunca debe interrumpir una extraccion.
+
+        Args:
+            key: Clave obtenida con key_for()
+            data: Bytes a almacenar
+        """
+        path = self._path_for(key)
+        tmp_path = path.with_suffix('.tmp')
+
+        try:
+            # Escritura atómica: no dejar entradas truncadas si el proceso muere
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("cache_write_failed", key=key, error_message=str(e))
+            return
+
+        self._evict()
+
+    def _evict(self) -> None:
+        """Elimina las entradas menos usadas hasta quedar bajo max_bytes."""
+        entries = []
+        total = 0
+
+        for path in self.cache_dir.glob(f"*{self.ENTRY_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        if total <= self.max_bytes:
+            return
+
+        entries.sort()
+        evicted = 0
+
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            evicted += 1
+
+        logger.debug("cache_evicted", entries=evicted, size_bytes=total)
@@ -14,6 +14,9 @@ class TextCleaner:
     # Caracteres comunes a eliminar en limpieza
     DEFAULT_REMOVE_CHARS = [' ', '.', ',', '-', '_', '/', '\\']
 
+    # Tabla de str.translate equivalente: elimina todos en una pasada en C
+    _DEFAULT_REMOVE_TABLE = str.maketrans('', '', ''.join(DEFAULT_REMOVE_CHARS))
+
     @staticmethod
     def clean_for_digits(text: str) -> str:
         """
@@ -31,7 +34,7 @@ class TextCleaner:
             >>> TextCleaner.clean_for_digits("ID: 12345")
             '12345'
         """
-        return ''.join([c for c in text if c.isdigit()])
+        return ''.join(filter(str.isdigit, text))
 
     @staticmethod
     def clean_general(text: str, remove_chars: List[str] = None) -> str:
@@ -52,13 +55,9 @@ class TextCleaner:
             'abc'
         """
         if remove_chars is None:
-            remove_chars = TextCleaner.DEFAULT_REMOVE_CHARS
-
-        result = text
-        for char in remove_chars:
-            result = result.replace(char, '')
+            return text.translate(TextCleaner._DEFAULT_REMOVE_TABLE)
 
-        return result
+        return text.translate(str.maketrans('', '', ''.join(remove_chars)))
 
     @staticmethod
     def extract_digits_only(text: str) -> str:
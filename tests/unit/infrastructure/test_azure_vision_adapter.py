@@ -0,0 +1,89 @@
+"""Unit tests for AzureVisionAdapter (Azure SDK mocked)."""
+import io
+
+import pytest
+from unittest.mock import Mock, patch
+from PIL import Image
+
+from src.infrastructure.ocr import azure_vision_adapter as ava
+from src.infrastructure.ocr.azure_vision_adapter import AzureVisionAdapter
+from src.domain.ports import ConfigPort
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def config_values():
+    """Configuration values used by the adapter under test."""
+    return {
+        'image_preprocessing.enabled': False,
+        'image_preprocessing': {},
+    }
+
+
+@pytest.fixture
+def mock_config(config_values):
+    """Mock configuration backed by config_values."""
+    config = Mock(spec=ConfigPort)
+    config.get.side_effect = lambda key, default=None: config_values.get(key, default)
+    return config
+
+
+@pytest.fixture
+def adapter(mock_config):
+    """AzureVisionAdapter without SDK client; the API call is mocked."""
+    with patch.object(ava, 'AZURE_VISION_AVAILABLE', True), \
+            patch.object(AzureVisionAdapter, '_initialize_ocr'):
+        instance = AzureVisionAdapter(mock_config)
+    instance.client = Mock()
+    instance._call_ocr_api = Mock(return_value=Mock(read=None))
+    return instance
+
+
+@pytest.fixture
+def large_image():
+    """Image the size of an upscaled form."""
+    return Image.new('RGB', (3200, 2400), color='white')
+
+
+def uploaded_image(adapter) -> Image.Image:
+    """Decode the image sent in the last API call."""
+    return Image.open(io.BytesIO(adapter._call_ocr_api.call_args.args[0]))
+
+
+# ============================================================================
+# UPLOAD TESTS
+# ============================================================================
+
+class TestUpload:
+    """Test the size and encoding of the uploaded image."""
+
+    def test_upload_keeps_full_resolution_by_default(self, adapter, large_image):
+        adapter.extract_cedulas(large_image)
+
+        assert uploaded_image(adapter).size == large_image.size
+
+    def test_pixel_budget_is_opt_in(self, mock_config, config_values, large_image):
+        config_values['ocr.azure_vision.max_upload_pixels'] = 1_200_000
+        with patch.object(ava, 'AZURE_VISION_AVAILABLE', True), \
+                patch.object(AzureVisionAdapter, '_initialize_ocr'):
+            adapter = AzureVisionAdapter(mock_config)
+        adapter.client = Mock()
+        adapter._call_ocr_api = Mock(return_value=Mock(read=None))
+
+        adapter.extract_cedulas(large_image)
+
+        width, height = uploaded_image(adapter).size
+        assert width * height <= 1_200_000
+        assert width / height == pytest.approx(4 / 3, rel=0.01)
+
+    def test_webp_upload_is_lossless(self, adapter):
+        adapter.upload_format = 'WEBP'
+        image = Image.new('L', (64, 32), color=255)
+        image.paste(0, (10, 10, 50, 20))
+
+        adapter.extract_cedulas(image)
+
+        assert list(uploaded_image(adapter).convert('L').getdata()) == list(image.getdata())
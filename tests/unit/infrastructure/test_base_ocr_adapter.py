@@ -0,0 +1,115 @@
+"""Unit tests for shared helpers in BaseOCRAdapter."""
+import pytest
+from unittest.mock import Mock
+
+from src.infrastructure.ocr.base_ocr_adapter import BaseOCRAdapter
+from src.domain.entities import CedulaRecord
+from src.domain.ports import ConfigPort
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+class StubOCRAdapter(BaseOCRAdapter):
+    """Minimal concrete adapter exposing the base class helpers."""
+
+    def _initialize_ocr(self):
+        pass
+
+    def _call_ocr_api(self, image_bytes):
+        return None
+
+    def _extract_text_blocks_with_coords(self, response):
+        return []
+
+    def extract_cedulas(self, image):
+        return []
+
+
+@pytest.fixture
+def adapter():
+    """Adapter with an empty configuration."""
+    config = Mock(spec=ConfigPort)
+    config.get.side_effect = lambda key, default=None: default
+    return StubOCRAdapter(config)
+
+
+# ============================================================================
+# ROW ASSIGNMENT TESTS
+# ============================================================================
+
+class TestAssignBlocksToRows:
+    """Test bucketing of text blocks into uniform rows."""
+
+    def test_blocks_are_bucketed_by_y_keeping_order(self, adapter):
+        blocks = [{'y': 250, 'id': 'a'}, {'y': 10, 'id': 'b'}, {'y': 260, 'id': 'c'}]
+
+        rows = adapter._assign_blocks_to_rows(blocks, image_height=400, num_rows=4)
+
+        assert [b['id'] for b in rows[0]] == ['b']
+        assert rows[1] == []
+        assert [b['id'] for b in rows[2]] == ['a', 'c']
+        assert rows[3] == []
+
+    def test_out_of_range_blocks_are_clamped(self, adapter):
+        blocks = [{'y': -20, 'id': 'top'}, {'y': 900, 'id': 'bottom'}]
+
+        rows = adapter._assign_blocks_to_rows(blocks, image_height=400, num_rows=4)
+
+        assert [b['id'] for b in rows[0]] == ['top']
+        assert [b['id'] for b in rows[3]] == ['bottom']
+
+    def test_no_blocks_returns_empty_rows(self, adapter):
+        assert adapter._assign_blocks_to_rows([], 400, 3) == {0: [], 1: [], 2: []}
+
+
+# ============================================================================
+# NUMBER EXTRACTION TESTS
+# ============================================================================
+
+class TestExtractNumbersFromText:
+    """Test digit extraction from recognized lines."""
+
+    def test_letters_and_separators_are_removed(self, adapter):
+        assert adapter._extract_numbers_from_text("107 116C1.931") == ["1071161931"]
+
+    def test_line_without_digits_returns_empty_list(self, adapter):
+        assert adapter._extract_numbers_from_text("NOMBRE") == []
+
+
+# ============================================================================
+# DEDUPLICATION TESTS
+# ============================================================================
+
+class TestRemoveDuplicates:
+    """Test keeping the highest-confidence record per cedula."""
+
+    def test_highest_confidence_record_is_kept_in_first_seen_order(self, adapter):
+        records = [
+            CedulaRecord.from_primitives('1234567', 0.70, index=0),
+            CedulaRecord.from_primitives('7654321', 0.80, index=1),
+            CedulaRecord.from_primitives('1234567', 0.95, index=2),
+            CedulaRecord.from_primitives('7654321', 0.60, index=3),
+        ]
+
+        unique = adapter._remove_duplicates(records)
+
+        assert [(r.cedula.value, r.index) for r in unique] == [('1234567', 2), ('7654321', 1)]
+
+
+# ============================================================================
+# OCR CORRECTION TESTS
+# ============================================================================
+
+class TestCorregirErroresOcrCedula:
+    """Test the handwriting confusion-matrix correction."""
+
+    @pytest.mark.parametrize("raw, expected", [
+        ("lO23456", "1023456"),
+        ("B765432I", "87654321"),
+        ("1.234-5Zs", "1234525"),
+        ("", ""),
+    ])
+    def test_confusions_are_fixed_and_non_digits_dropped(self, adapter, raw, expected):
+        assert adapter._corregir_errores_ocr_cedula(raw) == expected
@@ -0,0 +1,39 @@
+"""Unit tests for ConfidenceMapper."""
+import pytest
+
+from src.infrastructure.ocr.vision import ConfidenceMapper, Symbol
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def symbols():
+    """Symbols mixing digits and separators, confidence = position / 10."""
+    return [Symbol(text=c, confidence=i / 10) for i, c in enumerate("A12.3456-7")]
+
+
+# ============================================================================
+# TESTS
+# ============================================================================
+
+class TestMapFromSymbols:
+    """Test mapping target text to per-digit symbol confidences."""
+
+    def test_found_text_returns_aligned_confidences(self, symbols):
+        result = ConfidenceMapper.map_from_symbols("3.456", symbols)
+
+        assert result['found'] is True
+        assert result['confidences'] == [0.4, 0.5, 0.6, 0.7]
+        assert result['positions'] == [0, 1, 2, 3]
+        assert result['average'] == pytest.approx(0.55)
+
+    def test_missing_text_falls_back_to_digit_average(self, symbols):
+        result = ConfidenceMapper.map_from_symbols("999", symbols)
+
+        digit_confidences = [s.confidence for s in symbols if s.text.isdigit()]
+        expected = sum(digit_confidences) / len(digit_confidences)
+
+        assert result['found'] is False
+        assert result['confidences'] == [pytest.approx(expected)] * 3
@@ -0,0 +1,49 @@
+"""Unit tests for GoogleSymbolExtractor."""
+import pytest
+from types import SimpleNamespace
+
+from src.infrastructure.ocr.vision import GoogleSymbolExtractor
+
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+def create_response(words):
+    """Helper to build a proto-like response from (symbols, word_confidence) pairs."""
+    proto_words = [
+        SimpleNamespace(
+            confidence=word_confidence,
+            symbols=[SimpleNamespace(text=text, confidence=conf) for text, conf in symbols]
+        )
+        for symbols, word_confidence in words
+    ]
+    paragraph = SimpleNamespace(words=proto_words)
+    page = SimpleNamespace(blocks=[SimpleNamespace(paragraphs=[paragraph])])
+    return SimpleNamespace(full_text_annotation=SimpleNamespace(pages=[page]))
+
+
+# ============================================================================
+# TESTS
+# ============================================================================
+
+class TestExtractAllSymbols:
+    """Test flattening of the Vision page/block/paragraph/word hierarchy."""
+
+    def test_symbols_keep_their_own_confidence(self):
+        response = create_response([([('1', 0.9), ('2', 0.8)], 0.85)])
+
+        symbols = GoogleSymbolExtractor.extract_all_symbols(response)
+
+        assert [(s.text, s.confidence) for s in symbols] == [('1', 0.9), ('2', 0.8)]
+
+    def test_unset_symbol_confidence_falls_back_to_word(self):
+        response = create_response([([('7', 0.0)], 0.6)])
+
+        symbols = GoogleSymbolExtractor.extract_all_symbols(response)
+
+        assert symbols[0].confidence == 0.6
+
+    def test_missing_annotation_raises(self):
+        with pytest.raises(ValueError):
+            GoogleSymbolExtractor.extract_all_symbols(SimpleNamespace(full_text_annotation=None))
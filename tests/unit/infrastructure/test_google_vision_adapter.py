@@ -0,0 +1,458 @@
+"""Unit tests for GoogleVisionAdapter (Google Cloud Vision SDK mocked)."""
+import io
+
+import numpy as np
+import pytest
+from unittest.mock import Mock, MagicMock, AsyncMock, DEFAULT, patch
+from PIL import Image, ImageDraw
+
+from src.infrastructure.ocr import google_vision_adapter as gva
+from src.infrastructure.ocr.google_vision_adapter import GoogleVisionAdapter
+from src.domain.ports import ConfigPort
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def config_values():
+    """Configuration values used by the adapter under test."""
+    return {
+        'image_preprocessing.enabled': False,
+        'image_preprocessing': {},
+    }
+
+
+@pytest.fixture
+def mock_config(config_values):
+    """Mock configuration backed by config_values."""
+    config = Mock(spec=ConfigPort)
+    config.get.side_effect = lambda key, default=None: config_values.get(key, default)
+    return config
+
+
+@pytest.fixture
+def mock_vision():
+    """Mock of the google.cloud.vision module."""
+    return MagicMock()
+
+
+def patch_vision_sdk(mock_vision):
+    """Replace the Google Vision / api_core imports of the adapter module with mocks."""
+    return patch.multiple(
+        gva,
+        create=True,
+        GOOGLE_VISION_AVAILABLE=True,
+        vision=mock_vision,
+        grpc=DEFAULT,
+        ImageAnnotatorGrpcTransport=DEFAULT,
+        ImageAnnotatorGrpcAsyncIOTransport=DEFAULT,
+        api_exceptions=DEFAULT,
+        api_retry=DEFAULT,
+        retry_async=DEFAULT,
+    )
+
+
+@pytest.fixture
+def adapter(mock_config, mock_vision):
+    """GoogleVisionAdapter with the Vision SDK replaced by a mock."""
+    with patch_vision_sdk(mock_vision):
+        yield GoogleVisionAdapter(mock_config)
+
+
+@pytest.fixture
+def sample_image():
+    """Create a sample PIL image with some ink on it."""
+    image = Image.new('RGB', (120, 60), color='white')
+    ImageDraw.Draw(image).rectangle((10, 20, 110, 40), fill='black')
+    return image
+
+
+@pytest.fixture
+def blank_image():
+    """Create a blank (ink-free) PIL image."""
+    return Image.new('RGB', (120, 60), color='white')
+
+
+def create_response(text: str, error_message: str = ''):
+    """Helper to create a fake AnnotateImageResponse."""
+    response = MagicMock()
+    response.error.message = error_message
+    response.full_text_annotation.text = text
+    return response
+
+
+# ============================================================================
+# BATCH EXTRACTION TESTS
+# ============================================================================
+
+class TestExtractCedulasBatch:
+    """Test batched extraction through BatchAnnotateImages."""
+
+    def test_empty_input_returns_empty_list(self, adapter):
+        assert adapter.extract_cedulas_batch([]) == []
+        adapter.client.batch_annotate_images.assert_not_called()
+
+    def test_images_are_chunked_by_max_batch_size(self, adapter, sample_image):
+        images = [sample_image] * (GoogleVisionAdapter.MAX_BATCH_SIZE + 4)
+
+        def batch_annotate(requests, **kwargs):
+            return MagicMock(responses=[create_response('1234567') for _ in requests])
+
+        adapter.client.batch_annotate_images.side_effect = batch_annotate
+
+        results = adapter.extract_cedulas_batch(images)
+
+        assert adapter.client.batch_annotate_images.call_count == 2
+        assert len(results) == len(images)
+        assert all(r[0].cedula.value == '1234567' for r in results)
+
+    def test_results_keep_input_order_and_isolate_errors(self, adapter, sample_image):
+        adapter.client.batch_annotate_images.return_value = MagicMock(responses=[
+            create_response('1111111'),
+            create_response('', error_message='quota exceeded'),
+            create_response('2222222\n3333333'),
+        ])
+
+        results = adapter.extract_cedulas_batch([sample_image] * 3)
+
+        assert [r.cedula.value for r in results[0]] == ['1111111']
+        assert results[1] == []
+        assert [r.cedula.value for r in results[2]] == ['2222222', '3333333']
+
+    def test_api_failure_returns_empty_result_per_image(self, adapter, sample_image):
+        adapter.client.batch_annotate_images.side_effect = RuntimeError("network down")
+
+        results = adapter.extract_cedulas_batch([sample_image] * 2)
+
+        assert results == [[], []]
+
+
+# ============================================================================
+# CONCURRENT EXTRACTION TESTS
+# ============================================================================
+
+class TestExtractCedulasMany:
+    """Test concurrent extraction through ImageAnnotatorAsyncClient."""
+
+    def test_one_async_request_per_image_in_order(self, adapter, mock_vision, sample_image):
+        texts = iter(['1111111', '2222222', '3333333'])
+        async_client = mock_vision.ImageAnnotatorAsyncClient.return_value
+        async_client.document_text_detection = AsyncMock(
+            side_effect=lambda **kwargs: create_response(next(texts))
+        )
+
+        results = adapter.extract_cedulas_many([sample_image] * 3)
+
+        assert async_client.document_text_detection.await_count == 3
+        assert [r[0].cedula.value for r in results] == ['1111111', '2222222', '3333333']
+
+    def test_async_channel_shares_sync_channel_options(self, mock_config, mock_vision, sample_image):
+        with patch_vision_sdk(mock_vision) as sdk:
+            adapter = GoogleVisionAdapter(mock_config)
+            async_client = mock_vision.ImageAnnotatorAsyncClient.return_value
+            async_client.document_text_detection = AsyncMock(return_value=create_response('1111111'))
+            adapter.extract_cedulas_many([sample_image] * 2)
+
+        sync_options = sdk['ImageAnnotatorGrpcTransport'].create_channel.call_args.kwargs['options']
+        async_transport = sdk['ImageAnnotatorGrpcAsyncIOTransport']
+        async_transport.create_channel.assert_called_once_with(options=sync_options)
+        mock_vision.ImageAnnotatorAsyncClient.assert_called_once_with(
+            transport=async_transport.return_value
+        )
+
+    def test_failed_request_does_not_affect_others(self, adapter, mock_vision, sample_image):
+        async_client = mock_vision.ImageAnnotatorAsyncClient.return_value
+        async_client.document_text_detection = AsyncMock(
+            side_effect=[create_response('1111111'), RuntimeError("deadline exceeded")]
+        )
+
+        results = adapter.extract_cedulas_many([sample_image] * 2)
+
+        assert [r.cedula.value for r in results[0]] == ['1111111']
+        assert results[1] == []
+
+
+# ============================================================================
+# TEXT BLOCK EXTRACTION TESTS
+# ============================================================================
+
+def create_word(text: str, confidence: float):
+    """Helper to create a fake Vision word made of single-char symbols."""
+    return MagicMock(symbols=[MagicMock(text=c) for c in text], confidence=confidence)
+
+
+class TestExtractTextBlocksWithCoords:
+    """Test flattening of Vision blocks into text blocks with coordinates."""
+
+    def test_block_text_confidence_and_center(self, adapter):
+        vertices = [MagicMock(x=x, y=y) for x, y in [(0, 0), (100, 0), (100, 40), (0, 40)]]
+        block = MagicMock()
+        block.bounding_box.vertices = vertices
+        block.paragraphs = [MagicMock(words=[create_word('JUAN', 0.9), create_word('123', 0.7)])]
+        response = MagicMock()
+        response.full_text_annotation.pages = [MagicMock(blocks=[block])]
+
+        blocks = adapter._extract_text_blocks_with_coords(response)
+
+        assert len(blocks) == 1
+        assert blocks[0]['text'] == 'JUAN 123'
+        assert blocks[0]['confidence'] == pytest.approx(0.8)
+        assert (blocks[0]['x'], blocks[0]['y']) == (50, 20)
+
+
+class TestExtractTextBlocksWithPositions:
+    """Test word-level extraction with bounding boxes."""
+
+    def test_words_get_min_corner_and_size(self, adapter):
+        word = create_word('1234567', 0.9)
+        word.bounding_box.vertices = [
+            MagicMock(x=x, y=y) for x, y in [(12, 8), (70, 10), (72, 30), (10, 28)]
+        ]
+        empty = create_word('', 0.5)
+        empty.bounding_box.vertices = word.bounding_box.vertices
+        block = MagicMock(paragraphs=[MagicMock(words=[word, empty])])
+        block.bounding_box.vertices = []
+        response = MagicMock()
+        response.full_text_annotation.pages = [MagicMock(blocks=[block])]
+
+        words = adapter._extract_text_blocks_with_positions(response)
+
+        assert words == [{
+            'text': '1234567', 'x': 10, 'y': 8, 'width': 62, 'height': 22, 'confidence': 0.9
+        }]
+
+    def test_walk_yields_blocks_and_words_in_one_pass(self, adapter):
+        response = MagicMock()
+        pages = MagicMock(return_value=[])
+        type(response.full_text_annotation).pages = property(lambda _: pages())
+
+        blocks, words = adapter._walk_response(response)
+
+        assert (blocks, words) == ([], [])
+        assert pages.call_count == 1
+
+    def test_walk_keeps_no_reference_to_response(self, adapter):
+        response = MagicMock()
+        response.full_text_annotation.pages = []
+
+        adapter._walk_response(response)
+
+        assert all(value is not response for value in vars(adapter).values())
+
+
+# ============================================================================
+# UPLOAD ENCODING TESTS
+# ============================================================================
+
+class TestPreprocessForUpload:
+    """Test that the preprocessed array is encoded without a PIL round-trip."""
+
+    def test_preprocessed_array_is_encoded_directly(self, adapter, config_values, sample_image):
+        config_values['image_preprocessing.enabled'] = True
+        adapter.preprocessor.preprocess_ndarray = Mock(
+            return_value=np.full((60, 120), 255, dtype=np.uint8)
+        )
+        adapter.preprocessor.preprocess = Mock()
+
+        img_bytes = adapter._preprocess_for_upload(sample_image)
+
+        assert img_bytes[:2] == b'\xff\xd8'  # JPEG SOI marker
+        adapter.preprocessor.preprocess.assert_not_called()
+
+    def test_upload_is_limited_to_max_pixels(self, adapter, sample_image):
+        adapter.max_upload_pixels = 1800
+
+        uploaded = Image.open(io.BytesIO(adapter._encode_for_upload(sample_image)))
+
+        assert uploaded.width * uploaded.height <= 1800
+
+    def test_full_form_upload_keeps_row_coordinate_space(self, adapter, sample_image):
+        # Los renglones se calculan con el alto de processed_image: la imagen
+        # enviada debe tener el mismo tamaño para que coincidan las coordenadas
+        adapter.max_upload_pixels = 1800
+        adapter._call_ocr_api = Mock(return_value=create_response(''))
+        adapter._create_empty_row = Mock()  # Ya no existe en el adapter (ruta obsoleta)
+
+        adapter._extract_full_form_data_DEPRECATED(sample_image, expected_rows=2)
+
+        uploaded = Image.open(io.BytesIO(adapter._call_ocr_api.call_args.args[0]))
+        assert uploaded.size == sample_image.size
+
+
+# ============================================================================
+# INITIALIZATION TESTS
+# ============================================================================
+
+class TestInitializeOcr:
+    """Test client construction."""
+
+    def test_client_uses_grpc_transport_with_keepalive(self, mock_config, mock_vision):
+        with patch_vision_sdk(mock_vision) as sdk:
+            GoogleVisionAdapter(mock_config)
+
+        transport_cls = sdk['ImageAnnotatorGrpcTransport']
+
+        options = dict(transport_cls.create_channel.call_args.kwargs['options'])
+        assert options['grpc.keepalive_time_ms'] == 10000
+        mock_vision.ImageAnnotatorClient.assert_called_once_with(
+            transport=transport_cls.return_value
+        )
+
+    def test_channel_compression_is_off_by_default(self, mock_config, mock_vision):
+        with patch_vision_sdk(mock_vision) as sdk:
+            GoogleVisionAdapter(mock_config)
+
+        options = dict(sdk['ImageAnnotatorGrpcTransport'].create_channel.call_args.kwargs['options'])
+        assert 'grpc.default_compression_algorithm' not in options
+
+    def test_gzip_compression_is_configurable(self, mock_config, mock_vision, config_values):
+        config_values['ocr.google_vision.compression'] = 'gzip'
+
+        with patch_vision_sdk(mock_vision) as sdk:
+            sdk['grpc'].Compression.Gzip = 2
+            GoogleVisionAdapter(mock_config)
+
+        options = dict(sdk['ImageAnnotatorGrpcTransport'].create_channel.call_args.kwargs['options'])
+        assert options['grpc.default_compression_algorithm'] == 2
+
+    def test_api_calls_retry_on_quota_errors(self, mock_config, mock_vision, sample_image):
+        with patch_vision_sdk(mock_vision) as sdk:
+            adapter = GoogleVisionAdapter(mock_config)
+            adapter.client.document_text_detection.return_value = create_response('1234567')
+            adapter.extract_cedulas(sample_image)
+
+        predicate_types = sdk['api_retry'].if_exception_type.call_args.args
+        assert sdk['api_exceptions'].ResourceExhausted in predicate_types
+
+        call_kwargs = adapter.client.document_text_detection.call_args.kwargs
+        assert call_kwargs['retry'] is sdk['api_retry'].Retry.return_value
+
+
+# ============================================================================
+# RESPONSE PARSING TESTS
+# ============================================================================
+
+class TestParseCedulas:
+    """Test line-by-line cedula parsing of a Vision response."""
+
+    def test_text_without_digits_returns_no_records(self, adapter):
+        adapter._extract_numbers_from_text = Mock()
+
+        records = adapter._parse_cedulas(create_response('NOMBRE\nFIRMA'), adapter.logger)
+
+        assert records == []
+        adapter._extract_numbers_from_text.assert_not_called()
+
+    def test_lengths_outside_3_to_11_digits_are_rejected(self, adapter):
+        records = adapter._parse_cedulas(
+            create_response('12\n1234567\n123456789012'), adapter.logger
+        )
+
+        assert [r.cedula.value for r in records] == ['1234567']
+
+
+# ============================================================================
+# RESPONSE CACHE TESTS
+# ============================================================================
+
+class TestResponseCacheIntegration:
+    """Test that cached responses skip the API on every request path."""
+
+    @pytest.fixture
+    def cached_adapter(self, adapter, mock_vision):
+        """Adapter whose cache already holds a response for every image."""
+        adapter.response_cache = Mock()
+        adapter.response_cache.get.return_value = b'serialized'
+        mock_vision.AnnotateImageResponse.deserialize.return_value = create_response('1234567')
+        return adapter
+
+    def test_batch_skips_api_for_cached_images(self, cached_adapter, sample_image):
+        results = cached_adapter.extract_cedulas_batch([sample_image] * 3)
+
+        cached_adapter.client.batch_annotate_images.assert_not_called()
+        assert [r[0].cedula.value for r in results] == ['1234567'] * 3
+
+    def test_batch_stores_new_responses(self, adapter, mock_vision, sample_image):
+        adapter.response_cache = Mock()
+        adapter.response_cache.get.return_value = None
+        adapter.client.batch_annotate_images.return_value = MagicMock(
+            responses=[create_response('1111111'), create_response('', error_message='bad image')]
+        )
+
+        adapter.extract_cedulas_batch([sample_image] * 2)
+
+        assert adapter.response_cache.put.call_count == 1
+
+    def test_async_skips_api_for_cached_images(self, cached_adapter, mock_vision, sample_image):
+        async_client = mock_vision.ImageAnnotatorAsyncClient.return_value
+        async_client.document_text_detection = AsyncMock()
+
+        results = cached_adapter.extract_cedulas_many([sample_image] * 2)
+
+        async_client.document_text_detection.assert_not_awaited()
+        assert [r[0].cedula.value for r in results] == ['1234567'] * 2
+
+
+# ============================================================================
+# BLANK IMAGE TESTS
+# ============================================================================
+
+class TestBlankImages:
+    """Test that ink-free images never reach the API when the check is enabled."""
+
+    @pytest.fixture
+    def config_values(self, config_values):
+        return {**config_values, 'ocr.blank_ink_ratio': 0.001}
+
+    @pytest.fixture
+    def full_page_image(self):
+        """A 2480x3508 (A4 at 300 dpi) form with 15 rows of 60px handwriting."""
+        image = Image.new('RGB', (2480, 3508), color='white')
+        draw = ImageDraw.Draw(image)
+        for row in range(15):
+            top = 300 + row * 200
+            for digit in range(10):
+                left = 200 + digit * 60
+                draw.line((left, top, left + 30, top + 60), fill='black', width=3)
+                draw.line((left + 30, top, left, top + 60), fill='black', width=3)
+        return image
+
+    def test_single_blank_image_skips_api(self, adapter, blank_image):
+        assert adapter.extract_cedulas(blank_image) == []
+        adapter.client.document_text_detection.assert_not_called()
+
+    def test_skip_clears_last_raw_response(self, adapter, sample_image, blank_image):
+        adapter.client.document_text_detection.return_value = create_response('1234567')
+        adapter.extract_cedulas(sample_image)
+        assert adapter.last_raw_response is not None
+
+        adapter.extract_cedulas(blank_image)
+
+        assert adapter.last_raw_response is None
+
+    def test_full_page_form_is_not_blank(self, adapter, full_page_image):
+        assert not adapter._is_visually_blank(full_page_image)
+
+    def test_check_disabled_by_default(self, mock_config, mock_vision, config_values, blank_image):
+        config_values.pop('ocr.blank_ink_ratio')
+        with patch_vision_sdk(mock_vision):
+            adapter = GoogleVisionAdapter(mock_config)
+            adapter.client.document_text_detection.return_value = create_response('')
+
+            adapter.extract_cedulas(blank_image)
+
+        adapter.client.document_text_detection.assert_called_once()
+
+    def test_batch_sends_only_non_blank_images(self, adapter, sample_image, blank_image):
+        adapter.client.batch_annotate_images.return_value = MagicMock(
+            responses=[create_response('1234567')]
+        )
+
+        results = adapter.extract_cedulas_batch([blank_image, sample_image])
+
+        sent = adapter.client.batch_annotate_images.call_args.kwargs['requests']
+        assert len(sent) == 1
+        assert results[0] == []
+        assert [r.cedula.value for r in results[1]] == ['1234567']
@@ -0,0 +1,103 @@
+"""Unit tests for ImageConverter."""
+from unittest.mock import patch
+
+import numpy as np
+from PIL import Image, JpegImagePlugin
+
+from src.infrastructure.ocr.image_converter import ImageConverter
+
+
+# ============================================================================
+# PIXEL LIMIT TESTS
+# ============================================================================
+
+class TestLimitPixels:
+    """Test downscaling to a maximum pixel count."""
+
+    def test_image_within_limit_is_returned_unchanged(self):
+        image = Image.new('RGB', (100, 50))
+
+        assert ImageConverter.limit_pixels(image, 10_000) is image
+
+    def test_oversized_image_keeps_aspect_ratio(self):
+        image = Image.new('RGB', (400, 200))
+
+        resized = ImageConverter.limit_pixels(image, 20_000)
+
+        assert resized.size == (200, 100)
+
+    def test_zero_disables_the_limit(self):
+        image = Image.new('RGB', (400, 200))
+
+        assert ImageConverter.limit_pixels(image, 0) is image
+
+    def test_ndarray_is_downscaled(self):
+        array = np.zeros((200, 400), dtype=np.uint8)
+
+        resized = ImageConverter.limit_pixels_ndarray(array, 20_000)
+
+        assert resized.shape == (100, 200)
+
+
+# ============================================================================
+# ENCODING TESTS
+# ============================================================================
+
+class TestNdarrayToBytes:
+    """Test direct OpenCV encoding."""
+
+    def test_jpeg_roundtrip_keeps_size(self):
+        array = np.full((30, 40), 128, dtype=np.uint8)
+
+        data = ImageConverter.ndarray_to_bytes(array, format='JPEG', quality=90)
+
+        assert ImageConverter.bytes_to_pil(data).size == (40, 30)
+
+    def test_jpeg_chroma_sampling_matches_pil_path(self):
+        array = np.zeros((16, 16, 3), dtype=np.uint8)
+        array[:, 8:] = (0, 0, 255)
+
+        cv2_jpeg = ImageConverter.bytes_to_pil(ImageConverter.ndarray_to_bytes(array, format='JPEG'))
+        pil_jpeg = ImageConverter.bytes_to_pil(
+            ImageConverter.pil_to_bytes(Image.fromarray(array), format='JPEG')
+        )
+
+        assert JpegImagePlugin.get_sampling(cv2_jpeg) == JpegImagePlugin.get_sampling(pil_jpeg) == 0
+
+
+class TestPilToBytes:
+    """Test PIL encoding through the reusable buffer."""
+
+    def test_consecutive_encodings_do_not_leak_previous_bytes(self):
+        large = ImageConverter.pil_to_bytes(Image.effect_noise((200, 200), 64), format='PNG')
+        small = ImageConverter.pil_to_bytes(Image.new('L', (10, 10)), format='PNG')
+
+        assert len(small) < len(large)
+        assert ImageConverter.bytes_to_pil(small).size == (10, 10)
+
+    def test_jpeg_accepts_modes_without_jpeg_support(self):
+        image_bytes = ImageConverter.pil_to_bytes(Image.new('LA', (10, 10)), format='JPEG')
+
+        assert ImageConverter.bytes_to_pil(image_bytes).mode == 'RGB'
+
+    def test_jpeg_does_not_convert_rgb_or_grayscale(self):
+        for mode in ('RGB', 'L'):
+            image = Image.new(mode, (10, 10))
+            with patch.object(image, 'convert') as mock_convert:
+                ImageConverter.pil_to_bytes(image, format='JPEG')
+
+            mock_convert.assert_not_called()
+
+
+# ============================================================================
+# IMAGE INFO TESTS
+# ============================================================================
+
+class TestGetImageInfo:
+    """Test image metadata without encoding."""
+
+    def test_size_bytes_is_raw_buffer_size(self):
+        info = ImageConverter.get_image_info(Image.new('RGB', (80, 60)))
+
+        assert info['size_bytes'] == 80 * 60 * 3
+        assert info['format'] == 'Unknown'
@@ -0,0 +1,401 @@
+"""Unit tests for the OCR adapter factory."""
+import json
+import sys
+import threading
+import time
+import pytest
+from unittest.mock import Mock, patch
+
+from src.infrastructure.ocr import ocr_factory
+from src.infrastructure.ocr.ocr_factory import create_ocr_adapter, clear_ocr_cache
+from src.domain.ports import ConfigPort
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture(autouse=True)
+def empty_cache(tmp_path):
+    """Start and finish every test with empty caches, using temporary cache files."""
+    with patch.multiple(
+        ocr_factory,
+        _PROVIDERS_CACHE_PATH=tmp_path / 'ocr_providers.json',
+        _PROVIDER_STATS_PATH=tmp_path / 'ocr_provider_stats.json',
+        _provider_stats=None,
+    ):
+        clear_ocr_cache()
+        yield
+        clear_ocr_cache()
+
+
+@pytest.fixture
+def config_values():
+    """Configuration values used by the factory under test."""
+    return {
+        'ocr.provider': 'google_vision',
+        'ocr': {'provider': 'google_vision'},
+    }
+
+
+@pytest.fixture
+def mock_config(config_values):
+    """Mock configuration backed by config_values."""
+    config = Mock(spec=ConfigPort)
+    config.get.side_effect = lambda key, default=None: config_values.get(key, default)
+    return config
+
+
+# ============================================================================
+# ADAPTER CACHE TESTS
+# ============================================================================
+
+class TestCreateOcrAdapterCache:
+    """Test reuse of initialized adapters across factory calls."""
+
+    def test_same_config_reuses_the_adapter(self, mock_config):
+        with patch.object(ocr_factory, '_try_create_provider', return_value=Mock()) as create:
+            first = create_ocr_adapter(mock_config)
+            second = create_ocr_adapter(mock_config)
+
+        assert first is second
+        create.assert_called_once()
+
+    def test_fallback_adapter_is_cached(self, mock_config):
+        fallback = Mock()
+        adapters = {'azure_vision': fallback}
+
+        with patch.object(ocr_factory, '_try_create_provider',
+                          side_effect=lambda provider, *args: adapters.get(provider)) as create:
+            assert create_ocr_adapter(mock_config) is fallback
+            calls_after_first = create.call_count
+            assert create_ocr_adapter(mock_config) is fallback
+
+        assert create.call_count == calls_after_first
+
+    def test_failures_are_not_cached(self, mock_config):
+        with patch.object(ocr_factory, '_try_create_provider', return_value=None) as create:
+            assert create_ocr_adapter(mock_config) is None
+            create_ocr_adapter(mock_config)
+
+        assert create.call_count == 6
+
+    def test_changed_ocr_settings_create_a_new_adapter(self, mock_config, config_values):
+        with patch.object(ocr_factory, '_try_create_provider', side_effect=lambda *args: Mock()):
+            first = create_ocr_adapter(mock_config)
+            config_values['ocr'] = {'provider': 'google_vision', 'google_vision': {'max_concurrency': 4}}
+            second = create_ocr_adapter(mock_config)
+
+        assert first is not second
+        assert len(ocr_factory._ADAPTER_CACHE) == 1
+
+    def test_clear_ocr_cache_forces_a_new_adapter(self, mock_config):
+        with patch.object(ocr_factory, '_try_create_provider', side_effect=lambda *args: Mock()):
+            first = create_ocr_adapter(mock_config)
+            clear_ocr_cache()
+            second = create_ocr_adapter(mock_config)
+
+        assert first is not second
+
+
+# ============================================================================
+# AVAILABLE PROVIDERS TESTS
+# ============================================================================
+
+class TestGetAvailableProviders:
+    """Test provider detection without importing the SDKs."""
+
+    def test_missing_parent_package_is_not_available(self):
+        assert ocr_factory._module_available('paquete_inexistente.submodulo') is False
+
+    def test_ensembles_require_both_cloud_providers(self):
+        installed = {'google.cloud.vision', 'azure.ai.vision.imageanalysis'}
+
+        with patch.object(ocr_factory, '_module_available', side_effect=installed.__contains__):
+            providers = ocr_factory.get_available_providers()
+
+        assert providers == ['google_vision', 'azure_vision', 'ensemble', 'digit_ensemble']
+
+    def test_detection_runs_once_per_process(self):
+        with patch.object(ocr_factory, '_module_available', return_value=False) as probe:
+            ocr_factory.get_available_providers()
+            providers = ocr_factory.get_available_providers()
+            providers.append('modificado')
+
+            assert ocr_factory.get_available_providers() == []
+
+        assert probe.call_count == 3
+
+
+class TestProvidersDiskCache:
+    """Test the stale-while-revalidate disk cache of detected providers."""
+
+    def write_cache(self, providers, age_seconds):
+        ocr_factory._PROVIDERS_CACHE_PATH.write_text(json.dumps({
+            'providers': providers,
+            'python': sys.executable,
+            'ts': time.time() - age_seconds,
+        }))
+
+    def test_scan_result_is_written_to_disk(self):
+        with patch.object(ocr_factory, '_module_available', side_effect=lambda name: name == 'pytesseract'):
+            ocr_factory.get_available_providers()
+
+        data = json.loads(ocr_factory._PROVIDERS_CACHE_PATH.read_text())
+        assert data['providers'] == ['tesseract']
+
+    def test_fresh_cache_skips_the_scan(self):
+        self.write_cache(['google_vision'], age_seconds=60)
+
+        with patch.object(ocr_factory, '_scan_available_providers') as scan:
+            assert ocr_factory.get_available_providers() == ['google_vision']
+
+        scan.assert_not_called()
+
+    def test_stale_cache_is_served_and_refreshed_in_background(self):
+        self.write_cache(['google_vision'], age_seconds=ocr_factory._PROVIDERS_CACHE_TTL + 1)
+
+        with patch.object(ocr_factory.threading, 'Thread') as thread:
+            assert ocr_factory.get_available_providers() == ['google_vision']
+
+        assert thread.call_args.kwargs['target'] is ocr_factory._refresh_providers_cache
+        thread.return_value.start.assert_called_once()
+
+    def test_cache_from_another_interpreter_is_ignored(self):
+        self.write_cache(['google_vision'], age_seconds=60)
+        data = json.loads(ocr_factory._PROVIDERS_CACHE_PATH.read_text())
+        data['python'] = '/otro/venv/bin/python'
+        ocr_factory._PROVIDERS_CACHE_PATH.write_text(json.dumps(data))
+
+        with patch.object(ocr_factory, '_module_available', return_value=False):
+            assert ocr_factory.get_available_providers() == []
+
+
+# ============================================================================
+# LAZY EXPORT TESTS
+# ============================================================================
+
+class TestLazyAdapterExports:
+    """Test PEP 562 lazy access to adapter classes."""
+
+    def test_adapter_class_is_resolved_on_access(self):
+        from src.infrastructure.ocr.google_vision_adapter import GoogleVisionAdapter
+
+        assert ocr_factory.GoogleVisionAdapter is GoogleVisionAdapter
+        assert 'GoogleVisionAdapter' in vars(ocr_factory)
+
+    def test_factories_reuse_the_resolved_class(self):
+        with patch.object(ocr_factory.importlib, 'import_module', wraps=ocr_factory.importlib.import_module) as import_module:
+            first = ocr_factory._adapter_class('AzureVisionAdapter')
+            second = ocr_factory._adapter_class('AzureVisionAdapter')
+
+        assert first is second
+        assert import_module.call_count <= 1
+
+    def test_unknown_name_raises_attribute_error(self):
+        with pytest.raises(AttributeError):
+            ocr_factory.AdaptadorInexistente
+
+
+# ============================================================================
+# DIGIT ENSEMBLE CONSTRUCTION TESTS
+# ============================================================================
+
+class TestDigitEnsembleConstruction:
+    """Test concurrent construction of the digit ensemble inner adapters."""
+
+    def test_inner_adapters_are_created_in_parallel(self, mock_config):
+        both_started = threading.Barrier(2, timeout=5)
+
+        def create_adapter(config):
+            # Solo pasa la barrera si ambos constructores corren a la vez
+            both_started.wait()
+            return Mock()
+
+        with patch.object(ocr_factory, 'AzureVisionAdapter', side_effect=create_adapter, create=True), \
+             patch.object(ocr_factory, 'GoogleVisionAdapter', side_effect=create_adapter, create=True), \
+             patch.object(ocr_factory, 'DigitLevelEnsembleOCR', create=True) as ensemble:
+            adapter = ocr_factory._try_create_provider('digit_ensemble', mock_config, Mock())
+
+        assert adapter is ensemble.return_value
+
+    def test_inner_adapter_failure_returns_none(self, mock_config):
+        with patch.object(ocr_factory, 'AzureVisionAdapter', side_effect=RuntimeError("auth"), create=True), \
+             patch.object(ocr_factory, 'GoogleVisionAdapter', create=True), \
+             patch.object(ocr_factory, 'DigitLevelEnsembleOCR', create=True) as ensemble:
+            assert ocr_factory._try_create_provider('digit_ensemble', mock_config, Mock()) is None
+
+        ensemble.assert_not_called()
+
+
+# ============================================================================
+# FALLBACK TESTS
+# ============================================================================
+
+class TestFallback:
+    """Test initialization of fallback providers."""
+
+    def test_next_provider_starts_only_after_preferred_fails(self, mock_config):
+        started = []
+
+        def create_provider(provider, *args):
+            started.append(provider)
+            return None if provider == 'azure_vision' else provider
+
+        with patch.object(ocr_factory, '_try_create_provider', side_effect=create_provider):
+            adapter, provider, attempts = ocr_factory._create_first_available(
+                ['google_vision', 'azure_vision', 'tesseract'], mock_config, Mock()
+            )
+
+        # Google funciona: Azure y Tesseract no se construyen
+        assert (adapter, provider) == ('google_vision', 'google_vision')
+        assert started == ['google_vision']
+        assert [(name, ok) for name, _, ok in attempts] == [('google_vision', True)]
+
+    def test_failed_provider_falls_through_to_next(self, mock_config):
+        with patch.object(ocr_factory, '_try_create_provider',
+                          side_effect=lambda provider, *args: None if provider == 'azure_vision' else provider):
+            adapter, provider, attempts = ocr_factory._create_first_available(
+                ['azure_vision', 'tesseract'], mock_config, Mock()
+            )
+
+        assert (adapter, provider) == ('tesseract', 'tesseract')
+        assert [(name, ok) for name, _, ok in attempts] == [('azure_vision', False), ('tesseract', True)]
+
+    def test_failing_provider_moves_behind_working_ones(self):
+        ocr_factory._record_provider_inits([('google_vision', 4.0, False)] * 3 + [('tesseract', 0.1, True)])
+
+        assert ocr_factory._order_by_reliability(['google_vision', 'azure_vision', 'tesseract']) == [
+            'azure_vision', 'tesseract', 'google_vision'
+        ]
+
+    def test_faster_provider_does_not_jump_ahead(self):
+        ocr_factory._record_provider_inits([('google_vision', 3.0, True), ('tesseract', 0.1, True)])
+
+        assert ocr_factory._order_by_reliability(['google_vision', 'tesseract']) == [
+            'google_vision', 'tesseract'
+        ]
+
+    def test_init_history_survives_restarts(self, mock_config):
+        with patch.dict(ocr_factory._FACTORIES, {
+            'azure_vision': Mock(side_effect=RuntimeError("auth")),
+            'google_vision': Mock(return_value='google'),
+            'tesseract': Mock(return_value='tesseract'),
+        }):
+            for _ in range(3):
+                assert ocr_factory._create_ocr_adapter('azure_vision', mock_config) == 'google'
+
+        ocr_factory._provider_stats = None  # Simula un proceso nuevo
+
+        assert ocr_factory._order_by_reliability(['azure_vision', 'tesseract']) == [
+            'tesseract', 'azure_vision'
+        ]
+
+    def test_all_attempts_are_recorded_in_one_write(self, mock_config):
+        with patch.dict(ocr_factory._FACTORIES, {
+            'azure_vision': Mock(return_value=None),
+            'google_vision': Mock(return_value='google'),
+            'tesseract': Mock(return_value='tesseract'),
+        }), patch.object(ocr_factory, '_write_json_atomic') as write:
+            ocr_factory._create_ocr_adapter('azure_vision', mock_config)
+
+        write.assert_called_once()
+        history = write.call_args.args[1]
+        assert sorted(history) == ['azure_vision', 'google_vision']
+        assert [ok for *_, ok in history['azure_vision']] == [False]
+        assert [ok for *_, ok in history['google_vision']] == [True]
+
+    def test_single_transient_failure_keeps_preference(self):
+        ocr_factory._record_provider_inits([('google_vision', 4.0, False), ('tesseract', 0.1, True)])
+
+        assert ocr_factory._order_by_reliability(['google_vision', 'tesseract']) == [
+            'google_vision', 'tesseract'
+        ]
+
+    def test_demoted_provider_recovers_when_failures_expire(self):
+        ocr_factory._record_provider_inits([('google_vision', 4.0, False)] * 3)
+        assert ocr_factory._order_by_reliability(['google_vision', 'tesseract']) == [
+            'tesseract', 'google_vision'
+        ]
+
+        expired = time.time() + ocr_factory._PROVIDER_STATS_TTL + 1
+        with patch.object(ocr_factory.time, 'time', return_value=expired):
+            assert ocr_factory._order_by_reliability(['google_vision', 'tesseract']) == [
+                'google_vision', 'tesseract'
+            ]
+
+    def test_samples_without_timestamp_are_ignored(self):
+        ocr_factory._PROVIDER_STATS_PATH.write_text(
+            json.dumps({'google_vision': [[0.0, False]] * 5}), encoding='utf-8'
+        )
+
+        assert ocr_factory._order_by_reliability(['google_vision', 'tesseract']) == [
+            'google_vision', 'tesseract'
+        ]
+
+    def test_clear_cache_forgets_init_history(self):
+        ocr_factory._record_provider_inits([('google_vision', 4.0, False)] * 3)
+        assert ocr_factory._PROVIDER_STATS_PATH.exists()
+
+        clear_ocr_cache()
+
+        assert not ocr_factory._PROVIDER_STATS_PATH.exists()
+        assert ocr_factory._order_by_reliability(['google_vision', 'tesseract']) == [
+            'google_vision', 'tesseract'
+        ]
+
+    def test_failure_log_lists_providers_in_attempted_order(self, mock_config):
+        ocr_factory._record_provider_inits([('azure_vision', 4.0, False)] * 3)
+
+        with patch.object(ocr_factory, '_try_create_provider', return_value=None), \
+                patch.object(ocr_factory, 'log_error_message') as log_error:
+            assert ocr_factory._create_ocr_adapter('google_vision', mock_config) is None
+
+        # Sin repetir el configurado y con el orden por confiabilidad
+        assert log_error.call_args.kwargs['attempted_providers'] == [
+            'google_vision', 'tesseract', 'azure_vision'
+        ]
+
+    def test_stats_file_is_replaced_atomically(self, tmp_path):
+        path = tmp_path / 'stats.json'
+        path.write_text('{"old": true}', encoding='utf-8')
+
+        with patch.object(ocr_factory.os, 'replace', side_effect=OSError("disk full")):
+            ocr_factory._write_json_atomic(path, {'new': True})
+
+        assert json.loads(path.read_text(encoding='utf-8')) == {'old': True}
+        assert [p.name for p in tmp_path.iterdir()] == ['stats.json']
+
+        ocr_factory._write_json_atomic(path, {'new': True})
+
+        assert json.loads(path.read_text(encoding='utf-8')) == {'new': True}
+        assert [p.name for p in tmp_path.iterdir()] == ['stats.json']
+
+    def test_no_working_provider_returns_none(self, mock_config):
+        with patch.object(ocr_factory, '_try_create_provider', return_value=None):
+            assert ocr_factory._create_first_available(['tesseract'], mock_config, Mock())[:2] == (None, None)
+
+
+# ============================================================================
+# PROVIDER DISPATCH TESTS
+# ============================================================================
+
+class TestProviderDispatch:
+    """Test provider lookup through the dispatch table."""
+
+    def test_unknown_provider_returns_none(self, mock_config):
+        assert ocr_factory._try_create_provider('proveedor_inexistente', mock_config, Mock()) is None
+
+    def test_provider_factory_receives_config_and_logger(self, mock_config):
+        factory = Mock()
+        logger = Mock()
+
+        with patch.dict(ocr_factory._FACTORIES, {'google_vision': factory}):
+            adapter = ocr_factory._try_create_provider('google_vision', mock_config, logger)
+
+        factory.assert_called_once_with(mock_config, logger)
+        assert adapter is factory.return_value
+
+    def test_fallback_providers_are_single_engines(self):
+        assert set(ocr_factory._FALLBACK_ORDER) <= set(ocr_factory._FACTORIES)
+        assert 'digit_ensemble' not in ocr_factory._FALLBACK_ORDER
@@ -0,0 +1,121 @@
+"""Unit tests for PaddleOCRAdapter (PaddleOCR engine mocked)."""
+import numpy as np
+import pytest
+from unittest.mock import Mock, patch
+from PIL import Image
+
+from src.infrastructure.ocr import paddleocr_adapter
+from src.infrastructure.ocr.paddleocr_adapter import PaddleOCRAdapter
+from src.domain.ports import ConfigPort
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def paddle_engine():
+    """Mocked PaddleOCR engine returning two lines with the same cedula."""
+    engine = Mock()
+    engine.ocr.return_value = [[
+        [[[0, 0], [1, 0], [1, 1], [0, 1]], ('12.345.678', 0.8)],
+        [[[0, 2], [1, 2], [1, 3], [0, 3]], ('12345678', 0.95)],
+    ]]
+    return engine
+
+
+@pytest.fixture
+def config_values():
+    """Configuration values used by the adapter under test."""
+    return {'ocr.paddle_warmup': False}
+
+
+@pytest.fixture
+def mock_config(config_values):
+    """Mock configuration backed by config_values."""
+    config = Mock(spec=ConfigPort)
+    config.get.side_effect = lambda key, default=None: config_values.get(key, default)
+    return config
+
+
+@pytest.fixture
+def paddle_class(paddle_engine):
+    """Patched PaddleOCR class returning the mocked engine."""
+    with patch.object(paddleocr_adapter, 'PADDLEOCR_AVAILABLE', True), \
+         patch.object(paddleocr_adapter, 'PaddleOCR', return_value=paddle_engine, create=True) as paddle:
+        yield paddle
+
+
+@pytest.fixture
+def adapter(paddle_class, mock_config):
+    """Adapter built without the real PaddleOCR package."""
+    return PaddleOCRAdapter(mock_config)
+
+
+# ============================================================================
+# INITIALIZATION TESTS
+# ============================================================================
+
+class TestInitialization:
+    """Test engine construction and warmup."""
+
+    def test_cpu_options_are_passed_to_the_engine(self, paddle_class, mock_config, config_values):
+        config_values['ocr.paddle_cpu_threads'] = 3
+
+        PaddleOCRAdapter(mock_config)
+
+        kwargs = paddle_class.call_args.kwargs
+        assert kwargs['enable_mkldnn'] is True
+        assert kwargs['cpu_threads'] == 3
+
+    def test_cpu_threads_default_to_half_the_cores(self, paddle_class, mock_config):
+        with patch.object(paddleocr_adapter.os, 'cpu_count', return_value=8):
+            PaddleOCRAdapter(mock_config)
+
+        assert paddle_class.call_args.kwargs['cpu_threads'] == 4
+
+    def test_warmup_runs_one_inference(self, paddle_class, paddle_engine, mock_config, config_values):
+        config_values['ocr.paddle_warmup'] = True
+
+        PaddleOCRAdapter(mock_config)
+
+        paddle_engine.ocr.assert_called_once()
+        assert paddle_engine.ocr.call_args.args[0].shape == (32, 32, 3)
+
+    def test_warmup_failure_does_not_break_the_adapter(self, paddle_class, paddle_engine, mock_config, config_values):
+        config_values['ocr.paddle_warmup'] = True
+        paddle_engine.ocr.side_effect = [RuntimeError("mkldnn"), paddle_engine.ocr.return_value]
+
+        adapter = PaddleOCRAdapter(mock_config)
+
+        assert adapter.extract_cedulas(Image.new('RGB', (40, 20)))
+
+
+# ============================================================================
+# EXTRACTION TESTS
+# ============================================================================
+
+class TestExtractCedulas:
+    """Test cedula extraction from the engine output."""
+
+    def test_engine_receives_the_image_as_an_array(self, adapter, paddle_engine):
+        adapter.extract_cedulas(Image.new('RGB', (40, 20)))
+
+        img_array = paddle_engine.ocr.call_args.args[0]
+        assert isinstance(img_array, np.ndarray)
+        assert img_array.shape == (20, 40, 3)
+        assert img_array.flags['C_CONTIGUOUS']
+
+    @pytest.mark.parametrize('mode', ['L', 'P', '1', 'RGBA'])
+    def test_non_rgb_images_are_converted_to_uint8_rgb(self, adapter, paddle_engine, mode):
+        adapter.extract_cedulas(Image.new(mode, (40, 20)))
+
+        img_array = paddle_engine.ocr.call_args.args[0]
+        assert img_array.dtype == np.uint8
+        assert img_array.shape == (20, 40, 3)
+
+    def test_duplicates_keep_the_highest_confidence(self, adapter):
+        records = adapter.extract_cedulas(Image.new('RGB', (40, 20)))
+
+        assert [r.cedula.value for r in records] == ['12345678']
+        assert records[0].confidence.as_percentage() == pytest.approx(95.0)
@@ -0,0 +1,48 @@
+"""Unit tests for ResponseCache (disk cache of Vision API responses)."""
+import os
+
+import pytest
+
+from src.infrastructure.ocr.vision import ResponseCache
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def cache(tmp_path):
+    """ResponseCache rooted in a temporary directory."""
+    return ResponseCache(str(tmp_path / 'vision'), max_bytes=1024)
+
+
+# ============================================================================
+# TESTS
+# ============================================================================
+
+class TestResponseCache:
+    """Test lookup, storage and LRU eviction."""
+
+    def test_key_is_sha256_of_content(self):
+        assert ResponseCache.key_for(b'abc') == (
+            'ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad'
+        )
+
+    def test_miss_returns_none(self, cache):
+        assert cache.get(ResponseCache.key_for(b'image')) is None
+
+    def test_put_then_get_roundtrip(self, cache):
+        key = ResponseCache.key_for(b'image')
+        cache.put(key, b'serialized-response')
+
+        assert cache.get(key) == b'serialized-response'
+
+    def test_least_recently_used_entries_are_evicted(self, cache):
+        old_key, new_key = ResponseCache.key_for(b'old'), ResponseCache.key_for(b'new')
+        cache.put(old_key, b'x' * 600)
+        os.utime(cache.cache_dir / f"{old_key}.pb", (0, 0))
+
+        cache.put(new_key, b'y' * 600)
+
+        assert cache.get(old_key) is None
+        assert cache.get(new_key) == b'y' * 600
@@ -0,0 +1,145 @@
+"""Unit tests for RowBasedExtraction (OCR adapter mocked)."""
+import pytest
+from unittest.mock import MagicMock, patch
+from PIL import Image
+
+from src.infrastructure.ocr import row_based_extraction
+from src.infrastructure.ocr.row_based_extraction import RowBasedExtraction
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+def word(text, x, y, height=20, confidence=0.9):
+    return {'text': text, 'x': x, 'y': y, 'width': 60, 'height': height, 'confidence': confidence}
+
+
+@pytest.fixture
+def ocr_adapter():
+    """Adapter returning a two-row form: names on the left, cedulas on the right."""
+    adapter = MagicMock(upload_format='PNG', upload_quality=90)
+    adapter.preprocess_image.return_value = Image.new('L', (10, 10))
+    adapter._call_ocr_api.return_value.full_text_annotation.text = (
+        'NOMBRE CEDULA\nJuan Perez 12345678\nMaria de la Torre 87654321'
+    )
+    adapter._extract_text_blocks_with_positions.return_value = [
+        word('NOMBRE', 0, 0), word('CEDULA', 400, 0),
+        word('Juan', 0, 50), word('Perez', 80, 52), word('12345678', 400, 50),
+        word('Maria', 0, 100), word('de', 80, 100), word('la', 120, 100),
+        word('Torre', 160, 100), word('87654321', 400, 100),
+    ]
+    return adapter
+
+
+# ============================================================================
+# PAIR EXTRACTION TESTS
+# ============================================================================
+
+class TestExtractPairsByRows:
+    """Test pairing of each detected cedula with the name on its row."""
+
+    def test_each_cedula_gets_the_name_on_its_row(self, ocr_adapter):
+        pares = RowBasedExtraction.extract_pairs_by_rows(None, ocr_adapter, verbose=False)
+
+        assert [(p['nombre'], p['cedula']) for p in pares] == [
+            ('Juan Perez', '12345678'),
+            ('Maria de la Torre', '87654321'),
+        ]
+
+    def test_words_right_of_the_cedula_are_ignored(self, ocr_adapter):
+        ocr_adapter._extract_text_blocks_with_positions.return_value.append(word('Firmado', 500, 50))
+        ocr_adapter._extract_text_blocks_with_positions.return_value.append(word('Ruiz', 380, 50))
+
+        pares = RowBasedExtraction.extract_pairs_by_rows(None, ocr_adapter, verbose=False)
+
+        assert pares[0]['nombre'] == 'Juan Perez'
+
+    def test_cedula_without_name_words_is_skipped(self, ocr_adapter):
+        ocr_adapter._extract_text_blocks_with_positions.return_value = [word('12345678', 400, 50)]
+
+        assert RowBasedExtraction.extract_pairs_by_rows(None, ocr_adapter, verbose=False) == []
+
+    def test_page_without_cedulas_returns_no_pairs(self, ocr_adapter):
+        ocr_adapter._call_ocr_api.return_value.full_text_annotation.text = 'Juan Perez'
+
+        assert RowBasedExtraction.extract_pairs_by_rows(None, ocr_adapter, verbose=False) == []
+
+    def test_progress_is_logged_only_when_verbose(self, ocr_adapter):
+        with patch.object(row_based_extraction, 'logger') as logger:
+            RowBasedExtraction.extract_pairs_by_rows(None, ocr_adapter, verbose=False)
+            logger.debug.assert_not_called()
+
+            RowBasedExtraction.extract_pairs_by_rows(None, ocr_adapter, verbose=True)
+
+        logger.debug.assert_called_with('row_extraction_completed', pairs=2)
+
+    @pytest.mark.parametrize('upload_format,lossless', [('JPEG', False), ('WEBP', True)])
+    def test_page_is_encoded_like_the_adapter_uploads(self, ocr_adapter, upload_format, lossless):
+        ocr_adapter.upload_format = upload_format
+
+        with patch.object(row_based_extraction.ImageConverter, 'pil_to_bytes', return_value=b'img') as encode:
+            RowBasedExtraction.extract_pairs_by_rows(None, ocr_adapter, verbose=False)
+
+        encode.assert_called_once_with(
+            ocr_adapter.preprocess_image.return_value,
+            format=upload_format, quality=90, lossless=lossless
+        )
+        ocr_adapter._call_ocr_api.assert_called_once_with(b'img')
+
+
+# ============================================================================
+# NAME WORD TESTS
+# ============================================================================
+
+class TestIsNombreWord:
+    """Test the per-word name filter."""
+
+    @pytest.mark.parametrize('text', ['Juan', 'de', ' Torre '])
+    def test_name_words_are_accepted(self, text):
+        assert RowBasedExtraction._is_nombre_word(text)
+
+    @pytest.mark.parametrize('text', ['J', '1234', 'Cédula:', 'Nombres'])
+    def test_noise_and_form_words_are_rejected(self, text):
+        assert not RowBasedExtraction._is_nombre_word(text)
+
+
+# ============================================================================
+# NAME FORMAT TESTS
+# ============================================================================
+
+class TestFormatNombre:
+    """Test name normalization and Spanish title case."""
+
+    @pytest.mark.parametrize('raw,expected', [
+        ('  MARIA  DE LA   torre.', 'Maria de la Torre'),
+        ('De Los Rios', 'De los Rios'),
+        ('(juan y pedro)', 'Juan y Pedro'),
+        (' .,; ', ''),
+    ])
+    def test_names_are_normalized_and_title_cased(self, raw, expected):
+        assert RowBasedExtraction._format_nombre(raw) == expected
+
+    def test_row_name_uses_the_same_format(self):
+        blocks = [{'text': 'MARIA'}, {'text': 'DEL'}, {'text': 'carmen,'}, {'text': '1234'}]
+
+        assert RowBasedExtraction.extract_nombre_from_row(blocks) == 'Maria del Carmen'
+
+
+# ============================================================================
+# CEDULA POSITION TESTS
+# ============================================================================
+
+class TestCedulaPosition:
+    """Test how each detected cedula line is located among the words."""
+
+    def test_cedula_split_across_words_uses_the_first_matching_word(self, ocr_adapter):
+        ocr_adapter._call_ocr_api.return_value.full_text_annotation.text = 'Juan Perez 12.345.678'
+        ocr_adapter._extract_text_blocks_with_positions.return_value = [
+            word('Juan', 0, 200), word('Perez', 80, 200),
+            word('12.', 400, 200), word('345.678', 440, 260),
+        ]
+
+        pares = RowBasedExtraction.extract_pairs_by_rows(None, ocr_adapter, verbose=False)
+
+        assert [(p['nombre'], p['cedula']) for p in pares] == [('Juan Perez', '12345678')]
@@ -0,0 +1,176 @@
+"""Unit tests for SpatialPairing."""
+import pytest
+
+from src.infrastructure.ocr.spatial_pairing import SpatialPairing
+
+
+def block(text, x, y, width=100, height=20, confidence=0.9):
+    return {
+        'text': text, 'x': x, 'y': y,
+        'width': width, 'height': height, 'confidence': confidence
+    }
+
+
+# ============================================================================
+# NAME CLUSTERING TESTS
+# ============================================================================
+
+class TestFilterNombres:
+    """Test spatial clustering of name words."""
+
+    def test_chained_neighbours_form_one_name(self):
+        # "Lopez" solo está cerca de "Perez", que a su vez está cerca de "Juan"
+        blocks = [block('Juan', 0, 0), block('Perez', 300, 0), block('Lopez', 600, 10)]
+
+        nombres = SpatialPairing.filter_nombres(blocks)
+
+        assert [n['text'] for n in nombres] == ['Juan Perez Lopez']
+        assert nombres[0]['width'] == 700
+
+    def test_distant_rows_form_separate_names(self):
+        blocks = [block('Maria Gomez', 0, 0), block('Ana Torres', 0, 200)]
+
+        nombres = SpatialPairing.filter_nombres(blocks)
+
+        assert [n['text'] for n in nombres] == ['Maria Gomez', 'Ana Torres']
+
+    def test_numbers_are_not_names(self):
+        assert SpatialPairing.filter_nombres([block('12345678', 0, 0)]) == []
+
+
+# ============================================================================
+# NAME PATTERN TESTS
+# ============================================================================
+
+class TestIsNombrePattern:
+    """Test the per-block name filter."""
+
+    @pytest.mark.parametrize('text', ['Juan', 'María José', 'Ñandú', 'López-Ruiz'])
+    def test_name_text_is_accepted(self, text):
+        assert SpatialPairing._is_nombre_pattern(text)
+
+    @pytest.mark.parametrize('text', ['J', '12345678', 'a1b2', 'Cédula:', 'FIRMAS', 'Nombre y apellido'])
+    def test_numbers_and_form_words_are_rejected(self, text):
+        assert not SpatialPairing._is_nombre_pattern(text)
+
+
+# ============================================================================
+# CEDULA FILTER TESTS
+# ============================================================================
+
+class TestFilterCedulas:
+    """Test detection and splitting of cedula blocks."""
+
+    def test_block_with_several_cedulas_is_split(self):
+        cedulas = SpatialPairing.filter_cedulas([block('12345678 87654321', 400, 100, height=40)])
+
+        assert [(c['text'], c['y'], c['height']) for c in cedulas] == [
+            ('12345678', 100, 20),
+            ('87654321', 100 + 40 * 9 / 17, 20),
+        ]
+
+    def test_separated_digits_are_joined(self):
+        cedulas = SpatialPairing.filter_cedulas([block('12.345.678', 400, 100)])
+
+        assert [c['text'] for c in cedulas] == ['12345678']
+
+    def test_text_without_cedula_is_ignored(self):
+        assert SpatialPairing.filter_cedulas([block('Firma 123', 400, 100)]) == []
+
+
+# ============================================================================
+# BLOCK MERGE TESTS
+# ============================================================================
+
+class TestMergeNombreBlocks:
+    """Test merging of a name cluster into one block."""
+
+    def test_bounding_box_covers_every_block(self):
+        blocks = [
+            block('Juan', 100, 110, width=80, height=20, confidence=0.8),
+            block('Lopez', 90, 140, width=120, height=30, confidence=0.6),
+        ]
+
+        merged = SpatialPairing._merge_nombre_blocks(blocks)
+
+        assert merged['text'] == 'Juan Lopez'
+        assert (merged['x'], merged['y'], merged['width'], merged['height']) == (90, 110, 120, 60)
+        assert merged['confidence'] == pytest.approx(0.7)
+
+    def test_invalid_name_returns_none(self):
+        assert SpatialPairing._merge_nombre_blocks([block('Al', 0, 0)]) is None
+
+
+class TestFormatNombre:
+    """Test Spanish title case of merged names."""
+
+    @pytest.mark.parametrize('raw,expected', [
+        ('MARIA DE LOS angeles.', 'Maria de los Angeles'),
+        ('De La Torre', 'De la Torre'),
+        ("(juan) o'brien lópez-ruiz", "Juan O'brien López-ruiz"),
+        ('ana j perez', 'Ana Perez'),
+    ])
+    def test_names_are_title_cased(self, raw, expected):
+        assert SpatialPairing._format_nombre(raw) == expected
+
+
+# ============================================================================
+# PROXIMITY PAIRING TESTS
+# ============================================================================
+
+class TestPairByProximity:
+    """Test pairing of cedulas with the nearest name."""
+
+    def test_each_cedula_takes_the_nearest_unused_name(self):
+        nombres = [block('Maria Gomez', 0, 0), block('Ana Torres', 0, 200)]
+        cedulas = [block('12345678', 400, 200), block('87654321', 400, 0)]
+
+        pares = SpatialPairing.pair_by_proximity(nombres, cedulas, verbose=False)
+
+        assert [(p['nombre'], p['cedula']) for p in pares] == [
+            ('Maria Gomez', '87654321'),
+            ('Ana Torres', '12345678'),
+        ]
+        assert pares[0]['distance_pixels'] == 400
+
+    def test_names_are_used_only_once(self):
+        nombres = [block('Maria Gomez', 0, 0)]
+        cedulas = [block('12345678', 400, 0), block('87654321', 400, 30)]
+
+        pares = SpatialPairing.pair_by_proximity(nombres, cedulas, verbose=False)
+
+        assert [p['cedula'] for p in pares] == ['12345678']
+
+    def test_names_beyond_max_distance_are_ignored(self):
+        nombres = [block('Maria Gomez', 0, 0)]
+        cedulas = [block('12345678', 3000, 0)]
+
+        assert SpatialPairing.pair_by_proximity(nombres, cedulas, verbose=False) == []
+
+
+# ============================================================================
+# CROSS-ENGINE MATCHING TESTS
+# ============================================================================
+
+class TestMatchPairs:
+    """Test matching of Google and Azure pairs by similarity."""
+
+    def test_each_pair_matches_its_most_similar_counterpart(self):
+        google = [{'cedula': '12345678', 'nombre': 'Juan Perez'}, {'cedula': '87654321', 'nombre': 'Ana Torres'}]
+        azure = [{'cedula': '87654327', 'nombre': 'ANA TORRES'}, {'cedula': '12345678', 'nombre': 'Juan Peres'}]
+
+        matched = SpatialPairing.match_pairs(google, azure)
+
+        assert matched == [(google[0], azure[1]), (google[1], azure[0])]
+
+    def test_azure_pairs_are_used_only_once(self):
+        google = [{'cedula': '12345678', 'nombre': 'Juan'}, {'cedula': '12345678', 'nombre': 'Juan'}]
+        azure = [{'cedula': '12345678', 'nombre': 'Juan'}]
+
+        assert len(SpatialPairing.match_pairs(google, azure)) == 1
+
+    def test_dissimilar_pairs_are_not_matched(self):
+        google = [{'cedula': '12345678', 'nombre': 'Juan Perez'}]
+        azure = [{'cedula': '99990000', 'nombre': 'Maria Gomez'}]
+
+        assert SpatialPairing.match_pairs(google, azure) == []
@@ -0,0 +1,220 @@
+"""Unit tests for TesseractOCR (pytesseract mocked)."""
+import sys
+import time
+
+import cv2
+import numpy as np
+import pytest
+from unittest.mock import MagicMock, Mock, patch
+from PIL import Image, ImageDraw
+
+import src.infrastructure.ocr
+from src.domain.ports import ConfigPort
+
+# pytesseract no es una dependencia de los tests: el módulo se importa con un
+# sustituto y cada test reemplaza el binding del módulo por su propio mock
+with patch.dict(sys.modules, {'pytesseract': MagicMock()}):
+    from src.infrastructure.ocr import tesseract_ocr
+TesseractOCR = tesseract_ocr.TesseractOCR
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def config_values():
+    """Configuration values used by the OCR under test."""
+    return {}
+
+
+@pytest.fixture
+def mock_config(config_values):
+    """Mock configuration backed by config_values."""
+    config = Mock(spec=ConfigPort)
+    config.get.side_effect = lambda key, default=None: config_values.get(key, default)
+    return config
+
+
+@pytest.fixture
+def mock_pytesseract():
+    """Replace the pytesseract binding of the module with a mock."""
+    with patch.object(tesseract_ocr, 'pytesseract') as mocked:
+        mocked.image_to_data.return_value = {'text': [], 'conf': []}
+        mocked.image_to_string.return_value = ''
+        yield mocked
+
+
+@pytest.fixture
+def ocr(mock_config, mock_pytesseract):
+    """TesseractOCR with a silent logger."""
+    instance = TesseractOCR(mock_config)
+    instance.logger = Mock()
+    return instance
+
+
+@pytest.fixture
+def sample_image():
+    """Light background with dark writing."""
+    image = Image.new('RGB', (80, 40), color='white')
+    ImageDraw.Draw(image).rectangle((10, 15, 70, 25), fill='black')
+    return image
+
+
+def psm_of(call) -> int:
+    """PSM mode passed in the Tesseract config string of an image_to_data call."""
+    return int(call.kwargs['config'].split('--psm ')[1].split()[0])
+
+
+# ============================================================================
+# PSM MODE TESTS
+# ============================================================================
+
+class TestPsmModes:
+    """Test selection of the page segmentation modes."""
+
+    def test_default_runs_all_four_modes(self, ocr):
+        assert ocr.psm_modes == (4, 6, 11, 13)
+
+    @pytest.mark.parametrize('configured, expected', [([6, 11], (6, 11)), ([], (6,)), (6, (6,))])
+    def test_configured_modes(self, mock_config, config_values, mock_pytesseract, configured, expected):
+        config_values['ocr.tesseract.psm_modes'] = configured
+
+        assert TesseractOCR(mock_config).psm_modes == expected
+
+    @pytest.mark.parametrize('cpus, configured, expected', [
+        (2, None, 2),   # no más procesos que CPUs
+        (16, None, 4),  # ni más que modos PSM
+        (16, 1, 1),     # límite configurado
+        (None, None, 1),
+    ])
+    def test_concurrent_processes_are_bounded(self, mock_config, config_values, mock_pytesseract,
+                                              cpus, configured, expected):
+        if configured is not None:
+            config_values['ocr.tesseract.max_workers'] = configured
+
+        with patch.object(tesseract_ocr.os, 'cpu_count', return_value=cpus):
+            assert TesseractOCR(mock_config).max_workers == expected
+
+    def test_one_tesseract_call_per_mode(self, ocr, mock_pytesseract, sample_image):
+        ocr.extract_cedulas(sample_image)
+
+        assert sorted(psm_of(c) for c in mock_pytesseract.image_to_data.call_args_list) == [4, 6, 11, 13]
+
+
+# ============================================================================
+# MERGE TESTS
+# ============================================================================
+
+class TestMergeOrder:
+    """Test that concurrent PSM passes are merged in the configured order."""
+
+    def test_results_follow_mode_order_and_keep_best_confidence(self, ocr, mock_pytesseract, sample_image):
+        outputs = {
+            4: {'text': ['111111'], 'conf': ['40']},
+            6: {'text': ['222222'], 'conf': ['80']},
+            11: {'text': ['111111'], 'conf': ['90']},
+            13: {'text': ['333333'], 'conf': ['70']},
+        }
+
+        def image_to_data(image, lang, config, output_type):
+            psm = int(config.split('--psm ')[1].split()[0])
+            if psm == 4:
+                time.sleep(0.05)  # el primer modo termina el último
+            return outputs[psm]
+
+        mock_pytesseract.image_to_data.side_effect = image_to_data
+
+        records = ocr.extract_cedulas(sample_image)
+
+        assert [r.cedula.value for r in records] == ['111111', '222222', '333333']
+        assert records[0].confidence.as_percentage() == pytest.approx(90.0)
+
+    def test_failing_mode_does_not_drop_the_others(self, ocr, mock_pytesseract, sample_image):
+        def image_to_data(image, lang, config, output_type):
+            if '--psm 4 ' in config:
+                raise RuntimeError("tesseract")
+            return {'text': ['123456'], 'conf': ['75']}
+
+        mock_pytesseract.image_to_data.side_effect = image_to_data
+
+        assert [r.cedula.value for r in ocr.extract_cedulas(sample_image)] == ['123456']
+        ocr.logger.error.assert_called()
+
+    def test_progress_goes_to_logger_not_stdout(self, ocr, mock_pytesseract, sample_image, capsys):
+        mock_pytesseract.image_to_data.return_value = {'text': ['123456'], 'conf': ['75']}
+
+        ocr.extract_cedulas(sample_image)
+
+        assert capsys.readouterr().out == ''
+
+
+# ============================================================================
+# PREPROCESSING TESTS
+# ============================================================================
+
+class TestPreprocessImage:
+    """Test the OpenCV preprocessing chain."""
+
+    @pytest.mark.parametrize('white_pixels, inverted', [
+        (10000, True),
+        (25499, True),    # media 126.99: fondo oscuro
+        (25500, False),   # media 127.00: fondo claro
+        (40000, False),
+    ])
+    def test_inversion_matches_mean_below_127(self, ocr, sample_image, white_pixels, inverted):
+        # La imagen 80x40 se escala 4x: el binarizado es de 320x160
+        binary = np.zeros(160 * 320, np.uint8)
+        binary[:white_pixels] = 255
+        binary = binary.reshape(160, 320)
+        assert (binary.mean() < 127) == inverted
+
+        with patch.object(tesseract_ocr.cv2, 'adaptiveThreshold', return_value=binary), \
+                patch.object(tesseract_ocr.cv2, 'bitwise_not', wraps=cv2.bitwise_not) as bitwise_not:
+            ocr.preprocess_image(sample_image)
+
+        assert bitwise_not.called == inverted
+
+    def test_output_is_binary_with_light_background(self, ocr, sample_image):
+        processed = np.asarray(ocr.preprocess_image(sample_image))
+
+        assert processed.shape == (160, 320)
+        assert set(np.unique(processed)) <= {0, 255}
+        assert processed.mean() > 127
+
+    @pytest.mark.parametrize('configured, expected', [
+        (None, cv2.INTER_LINEAR),
+        ('cubic', cv2.INTER_CUBIC),
+        ('CUBIC', cv2.INTER_CUBIC),
+        ('lanczos', cv2.INTER_LINEAR),
+    ])
+    def test_upscale_interpolation(self, mock_config, config_values, mock_pytesseract, sample_image,
+                                   configured, expected):
+        if configured is not None:
+            config_values['ocr.tesseract.upscale_interpolation'] = configured
+        ocr = TesseractOCR(mock_config)
+        ocr.logger = Mock()
+
+        with patch.object(tesseract_ocr.cv2, 'resize', wraps=cv2.resize) as resize:
+            ocr.preprocess_image(sample_image)
+
+        assert resize.call_args.kwargs['interpolation'] == expected
+
+    def test_opencl_path_matches_cpu_path(self, mock_config, config_values, mock_pytesseract, sample_image):
+        cpu = TesseractOCR(mock_config)
+        cpu.logger = Mock()
+        config_values['ocr.tesseract.use_opencl'] = True
+        with patch.object(tesseract_ocr.cv2.ocl, 'haveOpenCL', return_value=True):
+            umat = TesseractOCR(mock_config)
+        umat.logger = Mock()
+
+        assert umat.use_opencl
+        assert np.array_equal(
+            np.asarray(umat.preprocess_image(sample_image)),
+            np.asarray(cpu.preprocess_image(sample_image))
+        )
+
+    def test_opencl_requested_without_device_uses_cpu(self, mock_config, config_values, mock_pytesseract):
+        config_values['ocr.tesseract.use_opencl'] = True
+        with patch.object(tesseract_ocr.cv2.ocl, 'haveOpenCL', return_value=False):
+            assert not TesseractOCR(mock_config).use_opencl